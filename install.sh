@@ -19,6 +19,7 @@ fi
 # Get the directory where the script is located
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" && pwd )"
 WEB_DIR="/var/www/html"
+PI_HOME="/home/pi"
 
 # Check if we're in the repository directory
 if [ ! -d "$SCRIPT_DIR/web" ]; then
@@ -60,6 +61,25 @@ if ls "$SCRIPT_DIR"/web/*.png &> /dev/null; then
     cp "$SCRIPT_DIR"/web/*.png "$WEB_DIR/"
 fi
 
+echo ""
+echo "Step 3b: Copying display service scripts to $PI_HOME..."
+# catt_monitor.py and hdmi_display_manager.sh import/run these from $PI_HOME
+for f in catt_monitor.py cast_controller.py cast_discovery.py cast_fleet.py cast_watchdog.py \
+         display_schedule.py file_watcher.py push_channel.py render_frames.py \
+         service_logging.py tournament_monitor.py hdmi_display_manager.sh; do
+    cp "$SCRIPT_DIR/scripts/$f" "$PI_HOME/"
+done
+chmod 755 "$PI_HOME/hdmi_display_manager.sh"
+
+# Keep a schedule that has already been edited on this Pi
+if [ ! -f "$PI_HOME/display_schedule.json" ]; then
+    cp "$SCRIPT_DIR/scripts/display_schedule.json" "$PI_HOME/"
+    echo "✓ Installed default display_schedule.json"
+else
+    echo "✓ Keeping existing display_schedule.json"
+fi
+chown pi:pi "$PI_HOME"/*.py "$PI_HOME/hdmi_display_manager.sh" "$PI_HOME/display_schedule.json" 2>/dev/null || true
+
 echo ""
 echo "Step 4: Setting up Composer dependencies..."
 cd "$WEB_DIR"
@@ -12,12 +12,12 @@ FIXED: Two-phase card processing to avoid stale element reference errors
 import datetime
 import time
 import json
+import os
 import sys
 import re
 import logging
 import random
 from zoneinfo import ZoneInfo
-from logging.handlers import RotatingFileHandler
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
@@ -26,6 +26,13 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.common.action_chains import ActionChains
+from completion_eta import CompletionEstimator
+from card_memo import CardMemo
+from live_subscriber import LiveSubscriber
+
+# Shared logging setup lives with the Pi services in ../scripts
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from service_logging import setup_logging, debug_sampled
 
 
 # Configuration
@@ -34,47 +41,111 @@ VENUE_CITY = "Hilliard"
 DATA_FILE = "/home/pi/tournament_data.json"
 DATA_FILE_BACKUP = "/var/www/html/tournament_data.json"
 LOG_FILE = "/home/pi/logs/tournament_monitor.log"
+# Run-to-run estimator state; scrape.yml keeps it in the repo's state/ directory
+ETA_STATE_FILE = os.environ.get("ETA_STATE_FILE", "/home/pi/completion_eta.json")
+# Scheduled runs as UTC "HH:MM" slots ("*:MM" = every hour), comma separated.
+# scrape.yml mirrors its cron entries here; a status probe due well before the
+# next slot is requested as an extra run through probe_request.json
+SCRAPE_SCHEDULE = os.environ.get("SCRAPE_SCHEDULE", "")
+PROBE_REQUEST_FILENAME = "probe_request.json"
+MIN_PROBE_LEAD = 5 * 60   # Not worth an extra run this close to a scheduled one
+# Committed to state/ by scrape.yml so the memo survives fresh Actions checkouts
+CARD_MEMO_FILE = os.environ.get("CARD_MEMO_FILE", "/home/pi/card_memo.json")
 
+# Counters reported at the end of each run
+RUN_METRICS = {}
 
-def setup_logging():
-    """Configure rotating log handler with graceful fallback"""
-    logger = logging.getLogger()
-    logger.setLevel(logging.INFO)
-    logger.handlers = []
-    
-    # Create log directory if it doesn't exist
-    import os
-    log_dir = os.path.dirname(LOG_FILE)
-    if log_dir and not os.path.exists(log_dir):
-        try:
-            os.makedirs(log_dir, exist_ok=True)
-        except Exception as e:
-            print(f"Warning: Could not create log directory {log_dir}: {e}")
-    
-    # Try to set up file logging, fall back to console-only if it fails
-    try:
-        handler = RotatingFileHandler(LOG_FILE, maxBytes=5*1024*1024, backupCount=5)
-        formatter = logging.Formatter('[%(asctime)s] %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-    except Exception as e:
-        print(f"Warning: Could not set up file logging: {e}")
-        print("Continuing with console-only logging")
-    
-    # Always add console handler
-    console_handler = logging.StreamHandler()
-    formatter = logging.Formatter('[%(asctime)s] %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
-    return logger
+# Live bracket output - the delta is written next to each tournament_data.json
+# copy and to BRACKET_DELTA_FILE. The Actions runner starts from a fresh
+# checkout, so scrape.yml points both files into the repo's state/ directory
+# and commits them; tournament_monitor.py copies the delta onto the Pi.
+BRACKET_DELTA_FILENAME = "bracket_delta.json"
+BRACKET_DELTA_FILE = os.environ.get("BRACKET_DELTA_FILE", BRACKET_DELTA_FILENAME)
+BRACKET_STATE_FILE = os.environ.get("BRACKET_STATE_FILE", "/home/pi/bracket_state.json")
+
+# Written when the displayed tournament finishes - triggers the winner scrape
+STATUS_EVENT_FILENAME = "status_event.json"
+
+# Reads every bracket match (round, table, players, scores) in ONE in-page call
+# so a 128-player bracket costs a single WebDriver round trip
+BRACKET_EXTRACT_JS = """
+var selector = "[data-match-id], [class*='bracket-match'], [class*='BracketMatch'], [class*='match-container']";
+var nodes = Array.prototype.slice.call(document.querySelectorAll(selector));
+// Drop wrappers that contain another match node so each match is read once
+nodes = nodes.filter(function(node) {
+    return !node.querySelector(selector);
+});
+
+function cleanText(el) {
+    return el ? (el.innerText || el.textContent || '').replace(/\\s+/g, ' ').trim() : '';
+}
+
+var matches = [];
+nodes.forEach(function(node, index) {
+    var text = (node.innerText || '').trim();
+    if (!text) return;
+
+    var roundEl = node.closest("[data-round], [class*='round'], [class*='Round']");
+    var round = roundEl ? (roundEl.getAttribute('data-round') || '') : '';
+    if (!round && roundEl) {
+        var heading = roundEl.querySelector("[class*='title'], [class*='header'], h3, h4");
+        round = cleanText(heading);
+    }
+
+    var players = Array.prototype.map.call(
+        node.querySelectorAll("[class*='player-name'], [class*='challenger-name'], [class*='name']"),
+        cleanText
+    ).filter(function(name) { return name; });
+    var scores = Array.prototype.map.call(
+        node.querySelectorAll("[class*='score']"),
+        cleanText
+    ).filter(function(score) { return /^\\d+$/.test(score); });
+
+    // Fallback to line parsing when the markup has no name/score classes
+    if (players.length < 2) {
+        var lines = text.split('\\n').map(function(l) { return l.trim(); }).filter(Boolean);
+        players = lines.filter(function(l) { return /[A-Za-z]/.test(l) && !/^(Match|Table|Round)\\b/i.test(l); });
+        scores = lines.filter(function(l) { return /^\\d+$/.test(l); });
+    }
+
+    var tableMatch = text.match(/Table\\s*#?\\s*([A-Za-z0-9]+)/i);
+    var numberMatch = text.match(/(?:Match|#)\\s*(\\d+)/i);
+    var className = (node.className && node.className.toString()) || '';
+    var status = 'pending';
+    if (/winner|completed|finished/i.test(className) || /\\bFinal\\b|\\bCompleted\\b/.test(text)) {
+        status = 'completed';
+    } else if (/in-progress|live|active/i.test(className) || tableMatch) {
+        status = 'in_progress';
+    }
+
+    matches.push({
+        match_id: node.getAttribute('data-match-id') || node.id ||
+                  (round + '#' + (numberMatch ? numberMatch[1] : index)),
+        round: round || null,
+        match_number: numberMatch ? parseInt(numberMatch[1], 10) : null,
+        table: tableMatch ? tableMatch[1] : null,
+        player1: players[0] || null,
+        player2: players[1] || null,
+        score1: scores.length > 0 ? parseInt(scores[0], 10) : null,
+        score2: scores.length > 1 ? parseInt(scores[1], 10) : null,
+        status: status
+    });
+});
+return matches;
+"""
 
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
 
 
-def log(message):
-    logging.info(message)
+def log(message, *args):
+    """INFO log with lazy %-style arguments"""
+    logger.info(message, *args)
+
+
+def debug(message, *args):
+    """DEBUG log - skipped entirely unless BANKSHOT_LOG_LEVEL=DEBUG"""
+    logger.debug(message, *args)
 
 
 def human_delay(min_seconds=1, max_seconds=3):
@@ -237,7 +308,7 @@ def setup_driver(headless=True):
         
         return driver
     except Exception as e:
-        log(f"Error setting up ChromeDriver: {e}")
+        log("Error setting up ChromeDriver: %s", e)
         raise
 
 
@@ -285,13 +356,17 @@ def extract_date_from_text(text):
     return None
 
 
-def get_tournament_details_from_page(driver, tournament_url, player_count):
-    """Get tournament details with DIRECT entry fee extraction from Digital Pool"""
+def get_tournament_details_from_page(driver, tournament_url, player_count, include_bracket=False):
+    """Get tournament details with DIRECT entry fee extraction from Digital Pool
+    
+    When include_bracket is set (in-progress tournaments), the live bracket is
+    read while we are already on the tournament page.
+    """
     try:
         if not tournament_url:
             return None
         
-        log(f"Fetching details from: {tournament_url}")
+        log("Fetching details from: %s", tournament_url)
         driver.get(tournament_url)
         
         # Random delay instead of fixed 3 seconds
@@ -309,14 +384,15 @@ def get_tournament_details_from_page(driver, tournament_url, player_count):
             'entry_fee': 15,
             'format_type': 'Singles',
             'has_digital_pool_payouts': False,
-            'payouts': {}
+            'payouts': {},
+            'bracket': None
         }
         
         # Try to extract date from URL if present (most reliable source)
         url_date = extract_date_from_text(tournament_url)
         if url_date:
             details['date'] = url_date
-            log(f"✓ Date from URL: {url_date}")
+            log("✓ Date from URL: %s", url_date)
         
         # Extract START TIME (tr[3]/td[2]) - But trust card date over detail date
         xpath_start_time = "/html/body/div[1]/div/div/section/section/section/main/div/div[2]/div[2]/div/div/div/div/div/div[2]/div/div[1]/div[1]/div[2]/div/div/div/div/div/div/div/div[2]/div/div/div/div/table/tbody/tr[3]/td[2]"
@@ -324,7 +400,7 @@ def get_tournament_details_from_page(driver, tournament_url, player_count):
             elem = driver.find_element(By.XPATH, xpath_start_time)
             raw_time = elem.text.strip()
             
-            log(f"DEBUG: Time field text: {repr(raw_time)}")
+            debug("Time field text: %r", raw_time)
             
             # Check if we have local time (with timezone like America/New_York)
             has_local_time = 'America/' in raw_time or 'US/' in raw_time
@@ -347,7 +423,7 @@ def get_tournament_details_from_page(driver, tournament_url, player_count):
                             break
                     
                     details['start_time'] = clean_start_time_string(local_time_line)
-                    log(f"✓ Start time: {details['start_time']}")
+                    log("✓ Start time: %s", details['start_time'])
                     
                     # Extract date from time field if not already set from URL
                     if not details['date']:
@@ -356,7 +432,7 @@ def get_tournament_details_from_page(driver, tournament_url, player_count):
                             try:
                                 parsed = datetime.datetime.strptime(date_match.group(1), "%a, %b %d, %Y")
                                 details['date'] = parsed.strftime("%Y/%m/%d")
-                                log(f"✓ Date from time field: {details['date']}")
+                                log("✓ Date from time field: %s", details['date'])
                             except Exception:
                                 pass
         except NoSuchElementException:
@@ -372,7 +448,7 @@ def get_tournament_details_from_page(driver, tournament_url, player_count):
             if fee_match:
                 fee_value = fee_match.group(1).replace(',', '')
                 details['entry_fee'] = int(float(fee_value))
-                log(f"✓ Entry fee from Digital Pool tr[18]/td[2]: ${details['entry_fee']}")
+                log("✓ Entry fee from Digital Pool tr[18]/td[2]: $%s", details['entry_fee'])
         except NoSuchElementException:
             log("⚠ Entry fee field not found at tr[18]/td[2]")
             
@@ -387,7 +463,7 @@ def get_tournament_details_from_page(driver, tournament_url, player_count):
                     total_pot = int(pot_match.group(1).replace(',', ''))
                     calculated = total_pot // player_count
                     details['entry_fee'] = calculated
-                    log(f"⚠ Calculated entry fee from pot: ${calculated}")
+                    log("⚠ Calculated entry fee from pot: $%s", calculated)
             except Exception:
                 log("⚠ Could not calculate from pot, using default $15")
         
@@ -397,7 +473,7 @@ def get_tournament_details_from_page(driver, tournament_url, player_count):
             elem = driver.find_element(By.XPATH, xpath_format)
             format_text = elem.text.strip()
             details['format_type'] = format_text if format_text else 'Singles'
-            log(f"✓ Format: {details['format_type']}")
+            log("✓ Format: %s", details['format_type'])
         except Exception:
             pass
         
@@ -410,19 +486,146 @@ def get_tournament_details_from_page(driver, tournament_url, player_count):
             if first_text and first_text != '$0' and first_text != '$0.00':
                 details['has_digital_pool_payouts'] = True
                 details['payouts']['1st'] = first_text
-                log(f"✓ Digital Pool payout 1st: {first_text}")
+                log("✓ Digital Pool payout 1st: %s", first_text)
         except Exception:
             pass
         
+        # Extract live BRACKET last - it may navigate to the bracket tab
+        if include_bracket:
+            details['bracket'] = get_bracket_matches(driver, tournament_url)
+        
         return details
         
     except Exception as e:
-        log(f"Error fetching details: {e}")
+        log("Error fetching details: %s", e)
         import traceback
         traceback.print_exc()
         return None
 
 
+def extract_bracket_matches(driver):
+    """Read all bracket matches on the current page in a single script call
+
+    Returns dict of match_id -> match (round, table, players, scores, status)
+    """
+    try:
+        raw_matches = driver.execute_script(BRACKET_EXTRACT_JS) or []
+    except Exception as e:
+        log("⚠ Bracket extraction failed: %s", e)
+        return {}
+
+    matches = {}
+    for match in raw_matches:
+        match_id = str(match.get('match_id') or '').strip()
+        if not match_id or not (match.get('player1') or match.get('player2')):
+            continue
+        match['match_id'] = match_id
+        matches[match_id] = match
+
+    return matches
+
+
+def get_bracket_matches(driver, tournament_url):
+    """Get live bracket for an in-progress tournament
+
+    Tries the page we are already on first, then the bracket tab.
+    """
+    matches = extract_bracket_matches(driver)
+
+    if not matches and tournament_url:
+        bracket_url = tournament_url.rstrip('/') + '/bracket'
+        try:
+            driver.get(bracket_url)
+            WebDriverWait(driver, 15).until(
+                lambda d: d.execute_script(
+                    "return document.querySelector(\"[data-match-id], [class*='bracket-match'], "
+                    "[class*='BracketMatch'], [class*='match-container']\") !== null"
+                )
+            )
+            matches = extract_bracket_matches(driver)
+        except TimeoutException:
+            log("⚠ No bracket found at %s", bracket_url)
+        except Exception as e:
+            log("⚠ Error loading bracket: %s", e)
+
+    in_play = sum(1 for m in matches.values() if m.get('status') == 'in_progress')
+    log("✓ Bracket: %s matches (%s on tables)", len(matches), in_play)
+    return matches
+
+
+def compute_bracket_delta(previous_matches, current_matches):
+    """Return (changed, removed_ids) between two match snapshots"""
+    changed = [match for match_id, match in current_matches.items()
+               if previous_matches.get(match_id) != match]
+    removed = [match_id for match_id in previous_matches if match_id not in current_matches]
+    return changed, removed
+
+
+def save_bracket_delta(tournament_url, matches):
+    """Write only the matches that changed since the previous poll
+
+    The full snapshot is kept in bracket_state.json so the next poll can diff
+    against it. Each delta carries a sequence number; a consumer that missed one
+    (base_sequence != its last sequence) should treat the next full delta as a reset.
+    """
+    import os
+    state_path = BRACKET_STATE_FILE
+
+    previous = {}
+    try:
+        with open(state_path, 'r') as f:
+            previous = json.load(f)
+    except Exception:
+        pass
+
+    same_tournament = previous.get('tournament_url') == tournament_url
+    previous_matches = previous.get('matches', {}) if same_tournament else {}
+    base_sequence = previous.get('sequence', 0) if same_tournament else 0
+
+    changed, removed = compute_bracket_delta(previous_matches, matches)
+    sequence = base_sequence + 1
+
+    delta = {
+        'tournament_url': tournament_url,
+        'sequence': sequence,
+        'base_sequence': base_sequence,
+        'full': not same_tournament,
+        'total_matches': len(matches),
+        'changed': changed,
+        'removed': removed,
+        'generated_at': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    }
+
+    log("Bracket delta #%s: %s changed, %s removed of %s matches", sequence, len(changed), len(removed), len(matches))
+
+    delta_paths = [os.path.join(os.path.dirname(DATA_FILE), BRACKET_DELTA_FILENAME),
+                   os.path.join(os.path.dirname(DATA_FILE_BACKUP), BRACKET_DELTA_FILENAME),
+                   BRACKET_DELTA_FILE]
+    for delta_path in delta_paths:
+        dir_path = os.path.dirname(delta_path)
+        try:
+            if dir_path and not os.path.exists(dir_path):
+                os.makedirs(dir_path, exist_ok=True)
+            with open(delta_path, 'w') as f:
+                json.dump(delta, f, indent=2)
+        except Exception as e:
+            log("✗ Error saving bracket delta to %s: %s", delta_path, e)
+
+    try:
+        if os.path.dirname(state_path):
+            os.makedirs(os.path.dirname(state_path), exist_ok=True)
+        with open(state_path, 'w') as f:
+            json.dump({
+                'tournament_url': tournament_url,
+                'sequence': sequence,
+                'matches': matches
+            }, f)
+    except Exception as e:
+        log("✗ Error saving bracket state: %s", e)
+
+    return delta
+
+
 def parse_time_string(time_str):
     """Parse time strings like '7:00 PM' and return datetime.time object"""
     try:
@@ -463,7 +666,7 @@ def search_tournaments_on_page(driver):
     
     try:
         search_term = VENUE_NAME
-        log(f"Searching for: {search_term}")
+        log("Searching for: %s", search_term)
         
         # Find search input
         search_input = None
@@ -530,7 +733,7 @@ def search_tournaments_on_page(driver):
             try:
                 cards = driver.find_elements(By.CSS_SELECTOR, selector)
                 if cards:
-                    log(f"Found {len(cards)} elements with selector: {selector}")
+                    log("Found %s elements with selector: %s", len(cards), selector)
                     tournament_cards = cards
                     break
             except Exception:
@@ -545,9 +748,9 @@ def search_tournaments_on_page(driver):
                                   re.search(r'\d{4}/\d{2}/\d{2}', div.text) or
                                   re.search(r'\d{4}-\d{2}-\d{2}', div.text)
                               )]
-            log(f"Found {len(tournament_cards)} potential tournament divs")
+            log("Found %s potential tournament divs", len(tournament_cards))
         
-        log(f"Processing {len(tournament_cards)} potential tournament cards")
+        log("Processing %s potential tournament cards", len(tournament_cards))
         
         # =================================================================
         # PHASE 1: Collect all card data BEFORE navigating away
@@ -555,6 +758,9 @@ def search_tournaments_on_page(driver):
         # =================================================================
         matching_cards_data = []
         
+        # Unchanged cards (same text as a previous run) reuse their parsed record
+        card_memo = CardMemo(CARD_MEMO_FILE)
+        
         for idx, card in enumerate(tournament_cards):
             try:
                 card_text = card.text
@@ -563,10 +769,19 @@ def search_tournaments_on_page(driver):
                 if VENUE_NAME not in card_text or VENUE_CITY not in card_text:
                     continue
                 
-                log(f"\n{'='*50}")
-                log(f"Card {idx} - Found matching venue!")
-                log(f"{'='*50}")
-                log(f"DEBUG Card text:\n{card_text[:500]}...")
+                memo_key = CardMemo.key(card_text)
+                memo_record = card_memo.get(memo_key)
+                if memo_record:
+                    debug("Card %s unchanged - using memoized record: %s", idx, memo_record['card']['name'])
+                    matching_cards_data.append(dict(memo_record['card'],
+                                                    card_text=card_text,
+                                                    memo_key=memo_key,
+                                                    from_memo=True,
+                                                    details=memo_record['details']))
+                    continue
+                
+                log("Card %s - Found matching venue!", idx)
+                debug_sampled(logger, 'card-text', "Card text:\n%.500s...", card_text)
                 
                 # Extract tournament name
                 tournament_name = None
@@ -601,12 +816,12 @@ def search_tournaments_on_page(driver):
                 
                 # Extract date - FIXED: Support multiple formats
                 tournament_date = extract_date_from_text(card_text)
-                log(f"DEBUG: Extracted date from card: {tournament_date}")
+                debug("Extracted date from card: %s", tournament_date)
                 
                 # Extract player count - FIXED: Handle 0 players case better
                 player_match = re.search(r'(\d+)\s+Players?', card_text, re.IGNORECASE)
                 player_count = int(player_match.group(1)) if player_match else 0
-                log(f"DEBUG: Player count: {player_count}")
+                debug("Player count: %s", player_count)
                 
                 # Get tournament URL
                 tournament_url = None
@@ -626,6 +841,10 @@ def search_tournaments_on_page(driver):
                         name_slug = re.sub(r'-+', '-', name_slug).strip('-')
                         tournament_url = f"https://digitalpool.com/tournaments/{date_no_slashes}-{name_slug}/"
                 
+                # Completion percentage also feeds the completion-ETA estimator
+                completion_match = re.search(r'(\d+)%\s*Complete', card_text, re.IGNORECASE)
+                completion_pct = int(completion_match.group(1)) if completion_match else None
+                
                 # Extract status from card text (before navigating away)
                 actual_status = "Unknown"
                 status_indicators = {
@@ -640,9 +859,7 @@ def search_tournaments_on_page(driver):
                         break
                 
                 if actual_status == "Unknown":
-                    completion_match = re.search(r'(\d+)%\s*Complete', card_text, re.IGNORECASE)
-                    if completion_match:
-                        completion_pct = int(completion_match.group(1))
+                    if completion_pct is not None:
                         if completion_pct == 100:
                             actual_status = "Completed"
                         elif completion_pct == 0:
@@ -659,23 +876,28 @@ def search_tournaments_on_page(driver):
                     'player_count': player_count,
                     'url': tournament_url,
                     'status': actual_status,
-                    'card_text': card_text
+                    'completion_pct': completion_pct,
+                    'card_text': card_text,
+                    'memo_key': memo_key,
+                    'from_memo': False,
+                    'details': None
                 })
                 
-                log(f"✓ Card data collected: {tournament_name}")
+                log("✓ Card data collected: %s", tournament_name)
                 
             except Exception as e:
-                log(f"Error collecting card {idx} data: {e}")
+                log("Error collecting card %s data: %s", idx, e)
                 continue
         
-        log(f"\n{'='*50}")
-        log(f"Collected data from {len(matching_cards_data)} matching cards")
-        log(f"{'='*50}")
+        log("\n" + "=" * 50)
+        log("Collected data from %s matching cards", len(matching_cards_data))
+        log("=" * 50)
         
         # =================================================================
         # PHASE 2: Now fetch details from each tournament page
         # This is done AFTER collecting all card data to avoid stale refs
         # =================================================================
+        detail_pages_skipped = 0
         for card_data in matching_cards_data:
             try:
                 tournament_name = card_data['name']
@@ -691,19 +913,37 @@ def search_tournaments_on_page(driver):
                 format_type = 'Singles'
                 has_digital_pool_payouts = False
                 digital_pool_payouts = {}
+                bracket_matches = None
+                
+                details = card_data['details']
+                if card_data['from_memo']:
+                    detail_pages_skipped += 1
+                elif tournament_url:
+                    details = get_tournament_details_from_page(
+                        driver, tournament_url, player_count,
+                        include_bracket=(actual_status == 'In Progress')
+                    )
+                
+                # Live tournaments are never memoized - their state is why we poll.
+                # Neither is a failed detail fetch, so the next run retries it.
+                if not card_data['from_memo'] and actual_status != 'In Progress' and details is not None:
+                    card_memo.put(card_data['memo_key'], {
+                        'card': {key: card_data[key] for key in
+                                 ('name', 'date', 'player_count', 'url', 'status', 'completion_pct')},
+                        'details': details
+                    })
                 
-                if tournament_url:
-                    details = get_tournament_details_from_page(driver, tournament_url, player_count)
-                    if details:
-                        if details['start_time']:
-                            start_time_str = details['start_time']
-                        # FIXED: Use detail page date if card date is missing
-                        if details['date'] and not actual_date:
-                            actual_date = details['date']
-                        entry_fee = details['entry_fee']
-                        format_type = details['format_type']
-                        has_digital_pool_payouts = details['has_digital_pool_payouts']
-                        digital_pool_payouts = details['payouts']
+                if details:
+                    if details['start_time']:
+                        start_time_str = details['start_time']
+                    # FIXED: Use detail page date if card date is missing
+                    if details['date'] and not actual_date:
+                        actual_date = details['date']
+                    entry_fee = details['entry_fee']
+                    format_type = details['format_type']
+                    has_digital_pool_payouts = details['has_digital_pool_payouts']
+                    digital_pool_payouts = details['payouts']
+                    bracket_matches = details['bracket']
                 
                 start_time = parse_time_string(start_time_str) if start_time_str else None
                 
@@ -714,38 +954,46 @@ def search_tournaments_on_page(driver):
                     'start_time': start_time_str,
                     'start_time_parsed': start_time.strftime("%H:%M") if start_time else None,
                     'status': actual_status,
+                    'completion_pct': card_data['completion_pct'],
                     'player_count': player_count,
                     'entry_fee': entry_fee,
                     'format_type': format_type,
                     'has_digital_pool_payouts': has_digital_pool_payouts,
                     'digital_pool_payouts': digital_pool_payouts,
                     'url': tournament_url,
+                    'bracket_matches': bracket_matches,
                     'found_at': datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 }
                 
                 tournaments.append(tournament_info)
-                log(f"✓ Tournament extracted")
-                log(f"  Name: {tournament_name}")
-                log(f"  Date: {actual_date}")
-                log(f"  Players: {player_count}")
-                log(f"  Entry Fee: ${entry_fee} (from Digital Pool)")
-                log(f"  Status: {actual_status}")
+                log("✓ Tournament extracted")
+                log("  Name: %s", tournament_name)
+                log("  Date: %s", actual_date)
+                log("  Players: %s", player_count)
+                log("  Entry Fee: $%s (from Digital Pool)", entry_fee)
+                log("  Status: %s", actual_status)
                 
             except Exception as e:
-                log(f"Error fetching details for {card_data.get('name', 'unknown')}: {e}")
+                log("Error fetching details for %s: %s", card_data.get('name', 'unknown'), e)
                 import traceback
                 traceback.print_exc()
                 continue
         
+        card_memo.save()
+        RUN_METRICS['card_memo_hits'] = card_memo.hits
+        RUN_METRICS['card_memo_lookups'] = card_memo.hits + card_memo.misses
+        RUN_METRICS['card_memo_hit_rate'] = card_memo.hit_rate
+        RUN_METRICS['detail_pages_skipped'] = detail_pages_skipped
+        
         if not tournaments:
             log("✗ No tournaments found")
         else:
-            log(f"\n✓ Found {len(tournaments)} tournament(s)")
+            log("\n✓ Found %s tournament(s)", len(tournaments))
         
         return tournaments
         
     except Exception as e:
-        log(f"Error searching tournaments: {e}")
+        log("Error searching tournaments: %s", e)
         import traceback
         traceback.print_exc()
         return []
@@ -791,10 +1039,10 @@ def get_all_todays_tournaments():
         today_eastern = datetime.datetime.now(eastern).date()
         today_str = today_eastern.strftime("%Y/%m/%d")
         
-        log(f"\nFiltering for today's date: {today_str} (Eastern)")
-        log(f"All tournaments found: {len(all_tournaments)}")
+        log("\nFiltering for today's date: %s (Eastern)", today_str)
+        log("All tournaments found: %s", len(all_tournaments))
         for t in all_tournaments:
-            log(f"  - {t['name']}: date={t['date']}, players={t['player_count']}, status={t['status']}")
+            log("  - %s: date=%s, players=%s, status=%s", t['name'], t['date'], t['player_count'], t['status'])
         
         # FIXED: Include tournaments with matching date OR missing date (if only one found)
         todays_tournaments = [t for t in all_tournaments if t['date'] == today_str]
@@ -807,25 +1055,25 @@ def get_all_todays_tournaments():
             upcoming_or_progress = [t for t in no_date_tournaments 
                                     if t['status'] in ['Upcoming', 'In Progress']]
             if upcoming_or_progress:
-                log(f"Found {len(upcoming_or_progress)} tournament(s) without dates but with active status")
+                log("Found %s tournament(s) without dates but with active status", len(upcoming_or_progress))
                 # Set their date to today since they're currently active/upcoming
                 for t in upcoming_or_progress:
                     t['date'] = today_str
-                    log(f"  - Setting date to today for: {t['name']}")
+                    log("  - Setting date to today for: %s", t['name'])
                 todays_tournaments = upcoming_or_progress
         
-        log(f"\nFound {len(todays_tournaments)} tournament(s) for today ({today_str} Eastern)")
+        log("\nFound %s tournament(s) for today (%s Eastern)", len(todays_tournaments), today_str)
         
         for t in todays_tournaments:
-            log(f"  Tournament: {t['name']}")
-            log(f"  Entry fee: ${t['entry_fee']}")
-            log(f"  Players: {t['player_count']}")
-            log(f"  Status: {t['status']}")
+            log("  Tournament: %s", t['name'])
+            log("  Entry fee: $%s", t['entry_fee'])
+            log("  Players: %s", t['player_count'])
+            log("  Status: %s", t['status'])
         
         return todays_tournaments
         
     except Exception as e:
-        log(f"Error: {e}")
+        log("Error: %s", e)
         import traceback
         traceback.print_exc()
         return []
@@ -850,13 +1098,13 @@ def determine_which_tournament_to_display(tournaments):
     in_progress = [t for t in tournaments if t['status'] == 'In Progress']
     
     if in_progress:
-        log(f"Found {len(in_progress)} in progress")
+        log("Found %s in progress", len(in_progress))
         if len(in_progress) > 1:
             sorted_in_progress = sorted(in_progress, 
                                        key=lambda x: x['start_time_parsed'] if x['start_time_parsed'] else "00:00",
                                        reverse=True)
             selected = sorted_in_progress[0]
-            log(f"Multiple in progress - selecting latest: {selected['name']}")
+            log("Multiple in progress - selecting latest: %s", selected['name'])
         else:
             selected = in_progress[0]
         return selected
@@ -872,29 +1120,34 @@ def determine_which_tournament_to_display(tournaments):
                                 key=lambda x: x['start_time_parsed'] if x['start_time_parsed'] else "00:00")
     
     selected = sorted_tournaments[0]
-    log(f"Selecting first scheduled: {selected['name']}")
-    log(f"  Players: {selected['player_count']}")
-    log(f"  Status: {selected['status']}")
+    log("Selecting first scheduled: %s", selected['name'])
+    log("  Players: %s", selected['player_count'])
+    log("  Status: %s", selected['status'])
     
     return selected
 
 
+def load_previous_tournament_data():
+    """Load the tournament_data.json written by the previous run"""
+    import os
+    for path in [DATA_FILE, 'tournament_data.json']:
+        if os.path.exists(path):
+            try:
+                with open(path, 'r') as f:
+                    return json.load(f)
+            except Exception as e:
+                log("Error reading %s: %s", path, e)
+    return None
+
+
 def check_previous_tournament_still_active():
     """Check if previous tournament is still in progress"""
     driver = None
     try:
-        import os
-        data_file = None
-        for path in [DATA_FILE, 'tournament_data.json']:
-            if os.path.exists(path):
-                data_file = path
-                break
-        
-        if not data_file:
+        prev_data = load_previous_tournament_data()
+        
+        if not prev_data:
             return None
-            
-        with open(data_file, 'r') as f:
-            prev_data = json.load(f)
         
         if prev_data.get('display_tournament') and prev_data.get('status') == 'In Progress':
             tournament_date = prev_data.get('date')
@@ -908,7 +1161,7 @@ def check_previous_tournament_still_active():
                 today_eastern = datetime.datetime.now(eastern).date()
                 
                 if prev_date < today_eastern:
-                    log(f"Previous tournament from {tournament_date} was 'In Progress' - verifying...")
+                    log("Previous tournament from %s was 'In Progress' - verifying...", tournament_date)
                     
                     try:
                         driver = setup_driver(headless=True)
@@ -930,7 +1183,7 @@ def check_previous_tournament_still_active():
                             return prev_data
                             
                     except Exception as e:
-                        log(f"Error checking status: {e}")
+                        log("Error checking status: %s", e)
                         prev_data['status'] = 'Completed'
                         prev_data['display_tournament'] = False
                         return prev_data
@@ -943,10 +1196,34 @@ def check_previous_tournament_still_active():
         
         return None
     except Exception as e:
-        log(f"Error checking previous tournament: {e}")
+        log("Error checking previous tournament: %s", e)
         return None
 
 
+def write_tournament_json(output_data):
+    """Write tournament_data.json to every location the display and Actions read"""
+    # Save to multiple locations with directory creation
+    for file_path in [DATA_FILE, DATA_FILE_BACKUP]:
+        try:
+            dir_path = os.path.dirname(file_path)
+            if dir_path and not os.path.exists(dir_path):
+                os.makedirs(dir_path, exist_ok=True)
+            
+            with open(file_path, 'w') as f:
+                json.dump(output_data, f, indent=2)
+            log("✓ Saved to %s", file_path)
+        except Exception as e:
+            log("✗ Error saving to %s: %s", file_path, e)
+    
+    # Also save to current directory for GitHub Actions
+    try:
+        with open('tournament_data.json', 'w') as f:
+            json.dump(output_data, f, indent=2)
+        log("✓ Saved to tournament_data.json (current directory)")
+    except Exception as e:
+        log("✗ Error saving to current directory: %s", e)
+
+
 def save_tournament_data(tournament):
     """Save tournament data to JSON files"""
     if not tournament:
@@ -975,6 +1252,7 @@ def save_tournament_data(tournament):
             'date': tournament['date'],
             'start_time': tournament['start_time'],
             'status': tournament['status'],
+            'completion_pct': tournament.get('completion_pct'),
             'player_count': tournament.get('player_count', 0),
             'entry_fee': tournament.get('entry_fee', 15),
             'format_type': tournament.get('format_type', 'Singles'),
@@ -984,33 +1262,220 @@ def save_tournament_data(tournament):
             'display_tournament': should_display
         }
         
-        log(f"\nTournament to display: {tournament['name']}")
-        log(f"Entry Fee: ${tournament.get('entry_fee', 15)} (from Digital Pool)")
-        log(f"Players: {tournament.get('player_count', 0)}")
-        log(f"Status: {tournament['status']}")
-        log(f"Display flag: {should_display}")
+        log("\nTournament to display: %s", tournament['name'])
+        log("Entry Fee: $%s (from Digital Pool)", tournament.get('entry_fee', 15))
+        log("Players: %s", tournament.get('player_count', 0))
+        log("Status: %s", tournament['status'])
+        log("Display flag: %s", should_display)
     
-    # Save to multiple locations with directory creation
+    write_tournament_json(output_data)
+    
+    # Live bracket - only the matches that changed since the last poll
+    if tournament and tournament['status'] == 'In Progress' and tournament.get('bracket_matches'):
+        save_bracket_delta(tournament['url'], tournament['bracket_matches'])
+
+
+def status_probe_not_due(estimator, prev_data):
+    """True when a requested probe (--probe run) is no longer needed
+
+    A scheduled run since the request may have rescheduled the probe later, or
+    the tournament may have finished.
+    """
+    if not prev_data or not prev_data.get('display_tournament') or prev_data.get('status') != 'In Progress':
+        return True
+    
+    tournament_url = prev_data.get('tournament_url')
+    if not tournament_url or estimator.probe_due(tournament_url):
+        return False
+    
+    due_at = datetime.datetime.fromtimestamp(estimator.next_probe['due_at'])
+    remaining = estimator.next_probe.get('estimated_remaining')
+    log("Next status probe for %s due at %s", prev_data.get('tournament_name'), due_at.strftime('%H:%M'))
+    if remaining is not None:
+        log("  Estimated time to finish: %.0f min", remaining / 60)
+    return True
+
+
+def update_completion_eta(estimator, prev_data, tournament_url, status, format_type=None,
+                          completion_pct=None, bracket_matches=None):
+    """Feed this run's status into the ETA estimator and schedule the next probe"""
+    # The previously displayed tournament finished (or was replaced)
+    prev_url = prev_data.get('tournament_url') if prev_data else None
+    if prev_url and prev_data.get('status') == 'In Progress':
+        if prev_url != tournament_url or status == 'Completed':
+            estimator.mark_completed(prev_url)
+    
+    if tournament_url and status == 'In Progress':
+        matches_remaining = None
+        if bracket_matches:
+            matches_remaining = sum(1 for m in bracket_matches.values() if m.get('status') != 'completed')
+        
+        estimator.observe(tournament_url, format_type, completion_pct, matches_remaining)
+        probe = estimator.schedule_next_probe(tournament_url)
+        
+        due_at = datetime.datetime.fromtimestamp(probe['due_at'])
+        if probe['estimated_remaining'] is not None:
+            log("Estimated time to finish: %.0f min", probe['estimated_remaining'] / 60)
+        log("Next status probe at %s", due_at.strftime('%H:%M'))
+    
+    estimator.save()
+
+
+def next_scheduled_run(now=None, schedule=SCRAPE_SCHEDULE):
+    """Next UTC datetime in the SCRAPE_SCHEDULE slots, or None without a schedule"""
+    now = now or datetime.datetime.now(datetime.timezone.utc)
+    candidates = []
+    for slot in filter(None, (part.strip() for part in schedule.split(','))):
+        hour, _, minute = slot.partition(':')
+        try:
+            minute = int(minute)
+            hours = range(24) if hour == '*' else [int(hour)]
+        except ValueError:
+            log("Ignoring bad SCRAPE_SCHEDULE slot: %s", slot)
+            continue
+        for day in (0, 1):
+            base = now.replace(second=0, microsecond=0) + datetime.timedelta(days=day)
+            candidates.extend(base.replace(hour=h, minute=minute) for h in hours)
+    upcoming = [run for run in candidates if run > now]
+    return min(upcoming) if upcoming else None
+
+
+def request_status_probe(estimator, tournament_url):
+    """Write probe_request.json when the next probe falls well before the next scheduled run
+
+    scrape.yml dispatches one extra run (--probe) for it; scheduled runs always
+    scrape, so the estimate only ever adds runs near the end of an event.
+    """
     import os
-    for file_path in [DATA_FILE, DATA_FILE_BACKUP]:
+    probe = estimator.next_probe
+    if not tournament_url or not probe or probe.get('url') != tournament_url:
+        return None
+    next_run = next_scheduled_run()
+    if not next_run or probe['due_at'] > next_run.timestamp() - MIN_PROBE_LEAD:
+        return None
+    
+    request = {
+        'tournament_url': tournament_url,
+        'probe_at': int(probe['due_at']),
+        'next_scheduled_run': next_run.isoformat(timespec='minutes')
+    }
+    log("Requesting a status probe at %s (next scheduled run %s)",
+        datetime.datetime.fromtimestamp(probe['due_at']).strftime('%H:%M'), request['next_scheduled_run'])
+    try:
+        with open(PROBE_REQUEST_FILENAME, 'w') as f:
+            json.dump(request, f, indent=2)
+    except Exception as e:
+        log("✗ Error saving probe request: %s", e)
+    return request
+
+
+def emit_status_event(prev_data, tournament_url, status, tournaments=None):
+    """Write status_event.json when the displayed tournament goes In Progress -> Completed
+
+    A tournament replaced on the display counts as finished unless this run's
+    list still shows it unfinished. The winner scrape for that URL runs off this
+    file instead of on a fixed schedule.
+    """
+    import os
+    prev_url = prev_data.get('tournament_url') if prev_data else None
+    if not prev_url or prev_data.get('status') != 'In Progress':
+        return None
+    
+    if prev_url == tournament_url:
+        if status != 'Completed':
+            return None
+    else:
+        listed = {t['url']: t['status'] for t in tournaments or []}
+        if listed.get(prev_url, 'Completed') != 'Completed':
+            return None
+    
+    event = {
+        'event': 'tournament_completed',
+        'tournament_url': prev_url,
+        'tournament_name': prev_data.get('tournament_name'),
+        'date': prev_data.get('date'),
+        'previous_status': 'In Progress',
+        'status': 'Completed',
+        'detected_at': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    }
+    
+    log("Status event: %s went In Progress -> Completed", prev_data.get('tournament_name'))
+    
+    for dir_path in [os.path.dirname(DATA_FILE), os.path.dirname(DATA_FILE_BACKUP), '.']:
+        event_path = os.path.join(dir_path, STATUS_EVENT_FILENAME)
         try:
-            dir_path = os.path.dirname(file_path)
             if dir_path and not os.path.exists(dir_path):
                 os.makedirs(dir_path, exist_ok=True)
-            
-            with open(file_path, 'w') as f:
-                json.dump(output_data, f, indent=2)
-            log(f"✓ Saved to {file_path}")
+            with open(event_path, 'w') as f:
+                json.dump(event, f, indent=2)
         except Exception as e:
-            log(f"✗ Error saving to {file_path}: {e}")
+            log("✗ Error saving status event to %s: %s", event_path, e)
     
-    # Also save to current directory for GitHub Actions
-    try:
-        with open('tournament_data.json', 'w') as f:
-            json.dump(output_data, f, indent=2)
-        log(f"✓ Saved to tournament_data.json (current directory)")
-    except Exception as e:
-        log(f"✗ Error saving to current directory: {e}")
+    return event
+
+
+def log_run_metrics():
+    """Report this run's counters"""
+    if not RUN_METRICS:
+        return
+    log("RUN METRICS")
+    if 'card_memo_lookups' in RUN_METRICS:
+        log("  Card memo: %d/%d hits (%.0f%% hit rate)",
+            RUN_METRICS['card_memo_hits'], RUN_METRICS['card_memo_lookups'],
+            RUN_METRICS['card_memo_hit_rate'] * 100)
+        log("  Detail pages skipped: %d", RUN_METRICS['detail_pages_skipped'])
+
+
+def run_live_subscription(estimator):
+    """Apply pushed DigitalPool updates for the displayed tournament until it ends
+
+    Returns False (so main() scrapes as usual) when nothing is being displayed.
+    """
+    prev_data = load_previous_tournament_data()
+    if not prev_data or not prev_data.get('display_tournament') or not prev_data.get('tournament_url'):
+        log("No displayed tournament to subscribe to - scraping instead")
+        return False
+    
+    tournament_url = prev_data['tournament_url']
+    log("Subscribing to live updates for %s", prev_data.get('tournament_name'))
+    
+    def on_tournament(fields):
+        data = load_previous_tournament_data() or prev_data
+        before = dict(data)
+        changes = {key: fields[key] for key in ('status', 'player_count')
+                   if key in fields and data.get(key) != fields[key]}
+        
+        if changes:
+            data.update(changes)
+            data['display_tournament'] = data['status'] in ['In Progress', 'Upcoming']
+            data['last_updated'] = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            log("Live update: %s", changes)
+            write_tournament_json(data)
+        
+        update_completion_eta(estimator, before, tournament_url, data.get('status'),
+                              data.get('format_type'), fields.get('completion_pct'))
+        emit_status_event(before, tournament_url, data.get('status'))
+        return data.get('status') == 'Completed'
+    
+    def on_matches(matches):
+        if matches:
+            save_bracket_delta(tournament_url, matches)
+        return False
+    
+    def poll():
+        # Channel down - one regular scrape; stop once our tournament is no longer shown
+        before = load_previous_tournament_data() or prev_data
+        tournaments = get_all_todays_tournaments()
+        selected = determine_which_tournament_to_display(tournaments)
+        save_tournament_data(selected)
+        emit_status_event(before, selected['url'] if selected else None,
+                          selected['status'] if selected else None, tournaments)
+        return not selected or selected['url'] != tournament_url or selected['status'] == 'Completed'
+    
+    subscriber = LiveSubscriber(tournament_url, on_tournament, on_matches, fallback_poll=poll)
+    subscriber.run()
+    log("Live subscription ended after %d pushed messages", subscriber.messages_received)
+    return True
 
 
 def main():
@@ -1023,33 +1488,38 @@ def main():
     log("FIXED: Two-phase processing to avoid stale element errors")
     log("="*60)
     
+    # Scheduled runs always scrape; the ETA estimate only adds --probe runs
+    # near the end of an in-progress tournament
+    estimator = CompletionEstimator(ETA_STATE_FILE)
+    prev_data = load_previous_tournament_data()
+    
+    # --subscribe listens for pushed updates instead of polling
+    if '--subscribe' in sys.argv and run_live_subscription(estimator):
+        log("\n" + "="*60)
+        log("MONITOR COMPLETED")
+        log("="*60)
+        sys.exit(0)
+    
+    if '--probe' in sys.argv and status_probe_not_due(estimator, prev_data):
+        log("Requested status probe no longer needed - skipping")
+        sys.exit(0)
+    
     # Check if previous tournament still active
     prev_tournament_data = check_previous_tournament_still_active()
     
     if prev_tournament_data:
         log("Using previous tournament data (after-midnight scenario)")
         
-        # Use the same save logic as save_tournament_data()
-        import os
-        for file_path in [DATA_FILE, DATA_FILE_BACKUP]:
-            try:
-                dir_path = os.path.dirname(file_path)
-                if dir_path and not os.path.exists(dir_path):
-                    os.makedirs(dir_path, exist_ok=True)
-                
-                with open(file_path, 'w') as f:
-                    json.dump(prev_tournament_data, f, indent=2)
-                log(f"✓ Saved to {file_path}")
-            except Exception as e:
-                log(f"✗ Error saving to {file_path}: {e}")
+        write_tournament_json(prev_tournament_data)
         
-        # Also save to current directory for GitHub Actions
-        try:
-            with open('tournament_data.json', 'w') as f:
-                json.dump(prev_tournament_data, f, indent=2)
-            log(f"✓ Saved to tournament_data.json (current directory)")
-        except Exception as e:
-            log(f"✗ Error saving to current directory: {e}")
+        update_completion_eta(estimator, prev_data,
+                              prev_tournament_data.get('tournament_url'),
+                              prev_tournament_data.get('status'),
+                              prev_tournament_data.get('format_type'),
+                              prev_tournament_data.get('completion_pct'))
+        emit_status_event(prev_data,
+                          prev_tournament_data.get('tournament_url'),
+                          prev_tournament_data.get('status'))
         
         log("\n" + "="*60)
         log("MONITOR COMPLETED")
@@ -1065,6 +1535,25 @@ def main():
     # Save results
     save_tournament_data(selected_tournament)
     
+    if selected_tournament:
+        update_completion_eta(estimator, prev_data,
+                              selected_tournament['url'],
+                              selected_tournament['status'],
+                              selected_tournament.get('format_type'),
+                              selected_tournament.get('completion_pct'),
+                              selected_tournament.get('bracket_matches'))
+        if selected_tournament['status'] == 'In Progress':
+            request_status_probe(estimator, selected_tournament['url'])
+    else:
+        update_completion_eta(estimator, prev_data, None, None)
+    
+    emit_status_event(prev_data,
+                      selected_tournament['url'] if selected_tournament else None,
+                      selected_tournament['status'] if selected_tournament else None,
+                      tournaments)
+    
+    log_run_metrics()
+    
     log("\n" + "="*60)
     log("MONITOR COMPLETED")
     log("="*60)
@@ -1073,4 +1562,5 @@ def main():
 
 
 if __name__ == "__main__":
+    setup_logging(LOG_FILE)
     main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Name Validation Benchmark
+Times the original is_valid_player_name (lists + per-call regexes) against
+name_validation.is_valid_player_name and the batch validate_player_names over
+a corpus of card text, and checks all three agree.
+
+The corpus is card text separated by lines of ----. The bundled
+recordings/card_corpus.txt is SYNTHETIC: cards written by hand in DigitalPool's
+card layout (venue, date, entry, players, "Name - 1st" lines, button labels),
+not recorded from the site. Its timings show the relative speed-up only; for
+real numbers, save card text from a scrape and pass that file instead.
+
+Usage:
+    python3 bench_name_validation.py [corpus.txt] [--repeat 200]
+"""
+
+import argparse
+import os
+import re
+import time
+
+from name_validation import is_valid_player_name, validate_player_names
+
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'recordings', 'card_corpus.txt')
+
+# Same pattern extract_winners_from_card_text uses to find names
+NAME_RE = re.compile(r'([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*(?:\s+(?:Jr|Sr|II|III|IV))?)')
+
+
+def legacy_is_valid_player_name(name):
+    """The pre-name_validation implementation, kept for comparison"""
+    if not name or len(name) < 2:
+        return False
+
+    name_lower = name.lower().strip()
+
+    invalid_names = [
+        'name', 'player', 'description', 'start date', 'end date', 'date',
+        'time', 'status', 'place', 'rank', 'position', 'score', 'points',
+        'wins', 'losses', 'matches', 'games', 'rating', 'fargo', 'handicap',
+        'entry', 'fee', 'payout', 'prize', 'total', 'amount', 'action',
+        'details', 'view', 'edit', 'delete', 'bracket', 'standings',
+        'tournament', 'event', 'venue', 'location', 'format', 'type',
+        'round', 'match', 'table', 'seed', 'bye', 'forfeit', 'dq',
+        'n/a', 'tbd', 'unknown', 'pending', 'complete', 'in progress',
+    ]
+
+    if name_lower in invalid_names:
+        return False
+
+    if '$' in name or 'entry' in name_lower:
+        return False
+
+    if re.search(r'\d{4}[/-]\d{1,2}[/-]\d{1,2}', name):
+        return False
+    if re.search(r'\d{1,2}:\d{2}\s*(AM|PM|am|pm|UTC)', name):
+        return False
+    if re.search(r'(Mon|Tue|Wed|Thu|Fri|Sat|Sun),?\s+\w+\s+\d', name, re.IGNORECASE):
+        return False
+    if re.search(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d', name, re.IGNORECASE):
+        return False
+    if re.search(r'\d{1,2}(st|nd|rd|th)\s+\d{4}', name):
+        return False
+
+    tournament_keywords = ['tournament', 'night', '8-ball', '9-ball', '10-ball',
+                          'eight ball', 'nine ball', 'ten ball', 'billiards',
+                          'championship', 'league', 'weekly', 'monday', 'tuesday',
+                          'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+    for keyword in tournament_keywords:
+        if keyword in name_lower:
+            return False
+
+    if not re.search(r'[a-zA-Z]', name):
+        return False
+
+    if re.match(r'^[\d\$\.,%\-\+\#\@\!\?\(\)]+$', name):
+        return False
+
+    if not re.search(r'[A-Z]', name):
+        return False
+
+    if len(name) > 35:
+        return False
+
+    digit_count = sum(c.isdigit() for c in name)
+    if digit_count > 2:
+        return False
+
+    return True
+
+
+def load_candidates(path):
+    """Per card: every line plus every name-pattern match"""
+    with open(path, 'r') as f:
+        cards = [card.strip() for card in f.read().split('\n----\n') if card.strip()]
+    return [card.split('\n') + NAME_RE.findall(card) for card in cards]
+
+
+def bench(label, fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed * 1000 / repeat:8.3f} ms/pass")
+    return elapsed, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark player name validation')
+    parser.add_argument('corpus', nargs='?', default=DEFAULT_CORPUS)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    cards = load_candidates(args.corpus)
+    total = sum(len(c) for c in cards)
+    corpus_note = " (synthetic sample corpus)" if os.path.abspath(args.corpus) == DEFAULT_CORPUS else ""
+    print(f"{len(cards)} cards{corpus_note}, {total} candidate strings, {args.repeat} passes\n")
+
+    legacy_time, legacy = bench('legacy per-name', lambda: [[legacy_is_valid_player_name(n) for n in c] for c in cards], args.repeat)
+    single_time, single = bench('compiled per-name', lambda: [[is_valid_player_name(n) for n in c] for c in cards], args.repeat)
+    batch_time, batch = bench('compiled batch per card', lambda: [validate_player_names(c) for c in cards], args.repeat)
+
+    mismatches = [(n, l, s, b)
+                  for card, lc, sc, bc in zip(cards, legacy, single, batch)
+                  for n, l, s, b in zip(card, lc, sc, bc) if not l == s == b]
+    print(f"\nSpeed-up vs legacy: per-name {legacy_time / single_time:.1f}x, batch {legacy_time / batch_time:.1f}x")
+    print(f"Accepted names: {sum(map(sum, legacy))} of {total}")
+    if mismatches:
+        print(f"✗ {len(mismatches)} disagreements, e.g. {mismatches[:5]}")
+        return 1
+    print("✓ All implementations agree")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Parsed Card Memo
+Remembers the parsed record for each search-result card, keyed by a hash of
+the card text, so unchanged cards skip parsing and detail-page follow-ups on
+the next run. Entries not seen for MAX_AGE_DAYS are dropped on save.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+
+
+MAX_AGE_DAYS = 14
+
+
+class CardMemo:
+    """Persistent card-text-hash -> parsed record memo with hit statistics"""
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.load()
+
+    @staticmethod
+    def key(card_text):
+        return hashlib.sha1(card_text.encode('utf-8')).hexdigest()
+
+    def load(self):
+        try:
+            with open(self.path, 'r') as f:
+                self.entries = json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.warning("Could not load card memo %s: %s", self.path, e)
+
+    def get(self, key):
+        """Return the stored record for this card hash, counting the hit/miss"""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        entry['last_seen'] = time.time()
+        return entry['record']
+
+    def put(self, key, record):
+        self.entries[key] = {'record': record, 'last_seen': time.time()}
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def save(self):
+        cutoff = time.time() - MAX_AGE_DAYS * 86400
+        self.entries = {k: v for k, v in self.entries.items() if v.get('last_seen', 0) >= cutoff}
+        try:
+            dir_path = os.path.dirname(self.path)
+            if dir_path:
+                os.makedirs(dir_path, exist_ok=True)
+            with open(self.path, 'w') as f:
+                # Kept in the repo by the Actions scrape - stable order keeps diffs small
+                json.dump(self.entries, f, indent=1, sort_keys=True)
+            return True
+        except Exception as e:
+            logging.warning("Could not save card memo %s: %s", self.path, e)
+            return False
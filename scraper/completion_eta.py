@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Tournament Completion ETA Estimator
+Estimates how long an in-progress tournament has left and schedules the next
+status probe: rarely while the finish is far off, often as it gets close.
+
+Inputs per observation: completion % (card text) and matches remaining (bracket).
+Prior: past durations of events with the same format at this venue.
+
+The estimator only schedules; bankshot_monitor_multi.py turns a probe due
+before its next scheduled run into an extra (--probe) run.
+"""
+
+import json
+import logging
+import os
+import statistics
+import time
+
+
+# Probe scheduling - next probe at PROBE_FRACTION of the estimated time left
+MIN_PROBE_INTERVAL = 5 * 60       # Never probe more often than every 5 minutes
+MAX_PROBE_INTERVAL = 60 * 60      # Never wait more than an hour
+DEFAULT_PROBE_INTERVAL = 15 * 60  # No estimate yet
+PROBE_FRACTION = 0.5
+
+# Only the recent part of the history describes the current pace
+RATE_WINDOW = 90 * 60
+MAX_OBSERVATIONS = 50
+MAX_HISTORY_PER_FORMAT = 20
+
+
+class CompletionEstimator:
+    """Persistent completion-ETA model backed by a small JSON file"""
+
+    def __init__(self, path):
+        self.path = path
+        self.active = {}
+        self.history = {}
+        self.next_probe = None
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            self.active = data.get('active', {})
+            self.history = data.get('history', {})
+            self.next_probe = data.get('next_probe')
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.warning("Could not load ETA state %s: %s", self.path, e)
+
+    def save(self):
+        try:
+            dir_path = os.path.dirname(self.path)
+            if dir_path:
+                os.makedirs(dir_path, exist_ok=True)
+            with open(self.path, 'w') as f:
+                json.dump({
+                    'active': self.active,
+                    'history': self.history,
+                    'next_probe': self.next_probe
+                }, f, indent=2)
+            return True
+        except Exception as e:
+            logging.warning("Could not save ETA state %s: %s", self.path, e)
+            return False
+
+    def observe(self, url, format_type, completion_pct=None, matches_remaining=None, now=None):
+        """Record a status sample for an in-progress tournament"""
+        now = now or time.time()
+        entry = self.active.setdefault(url, {
+            'format_type': format_type or 'Singles',
+            'started_at': now,
+            'observations': []
+        })
+        entry['observations'].append([now, completion_pct, matches_remaining])
+        entry['observations'] = entry['observations'][-MAX_OBSERVATIONS:]
+
+    def mark_completed(self, url, now=None):
+        """Move a finished tournament's duration into the per-format history"""
+        now = now or time.time()
+        entry = self.active.pop(url, None)
+        if self.next_probe and self.next_probe.get('url') == url:
+            self.next_probe = None
+        if not entry:
+            return None
+
+        duration = now - entry['started_at']
+        durations = self.history.setdefault(entry['format_type'], [])
+        durations.append(round(duration))
+        del durations[:-MAX_HISTORY_PER_FORMAT]
+        logging.info("Recorded %s duration: %.0f min", entry['format_type'], duration / 60)
+        return duration
+
+    def _rate_estimate(self, observations, index):
+        """Seconds left extrapolated from the recent pace of one metric
+
+        index 1 = completion % (counts up to 100), 2 = matches remaining (counts down to 0)
+        """
+        samples = [(o[0], o[index]) for o in observations if o[index] is not None]
+        if len(samples) < 2:
+            return None
+
+        latest_ts, latest = samples[-1]
+        window = [s for s in samples if latest_ts - s[0] <= RATE_WINDOW]
+        first_ts, first = window[0] if len(window) >= 2 else samples[0]
+        elapsed = latest_ts - first_ts
+        if elapsed <= 0:
+            return None
+
+        if index == 1:
+            progress, left = latest - first, 100 - latest
+        else:
+            progress, left = first - latest, latest
+        if left <= 0:
+            return 0.0
+        if progress <= 0:
+            return None
+        return left / (progress / elapsed)
+
+    def _history_estimate(self, entry, now):
+        durations = self.history.get(entry['format_type'])
+        if not durations:
+            return None
+        return max(statistics.median(durations) - (now - entry['started_at']), 0.0)
+
+    def estimate_remaining(self, url, now=None):
+        """Best estimate of seconds until the tournament completes, or None"""
+        now = now or time.time()
+        entry = self.active.get(url)
+        if not entry:
+            return None
+
+        observations = entry['observations']
+        live = [e for e in (self._rate_estimate(observations, 1),
+                            self._rate_estimate(observations, 2)) if e is not None]
+        historical = self._history_estimate(entry, now)
+
+        if live:
+            # Age the live estimate by the time since the last sample
+            live_estimate = max(sum(live) / len(live) - (now - observations[-1][0]), 0.0)
+            if historical is None:
+                return live_estimate
+            # Trust the live pace more as the tournament progresses
+            pct = next((o[1] for o in reversed(observations) if o[1] is not None), 0)
+            live_weight = 0.5 + min(max(pct, 0), 100) / 200
+            return live_weight * live_estimate + (1 - live_weight) * historical
+
+        return historical
+
+    def schedule_next_probe(self, url, now=None):
+        """Pick when to check the tournament status next and remember it"""
+        now = now or time.time()
+        remaining = self.estimate_remaining(url, now)
+
+        if remaining is None:
+            delay = DEFAULT_PROBE_INTERVAL
+        else:
+            delay = min(max(remaining * PROBE_FRACTION, MIN_PROBE_INTERVAL), MAX_PROBE_INTERVAL)
+
+        self.next_probe = {
+            'url': url,
+            'due_at': now + delay,
+            'estimated_remaining': round(remaining) if remaining is not None else None
+        }
+        return self.next_probe
+
+    def probe_due(self, url, now=None):
+        """True when the tournament's status should be checked now"""
+        now = now or time.time()
+        if not self.next_probe or self.next_probe.get('url') != url:
+            return True
+        return now >= self.next_probe['due_at']
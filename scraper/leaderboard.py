@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Season Leaderboard
+Keeps per-season counters (wins, split wins, 2nd/3rd, top-3 finishes) per
+player plus the number of events, updated incrementally as tournaments are
+archived. Applying a tournament touches only its placings and is idempotent
+by tournament URL; re-applying a URL with different placings (e.g. winners
+filled in later) replaces its previous contribution.
+
+Writes a compact leaderboard.json for the web pages.
+
+Usage:
+    python3 leaderboard.py rebuild [--archive results/winners_archive.jsonl]
+    python3 leaderboard.py show [--season 2025]
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import os
+import sys
+
+from player_index import PlayerIndex
+from winners_archive import WinnersArchive
+
+
+OUTPUT_DIR = os.environ.get("OUTPUT_DIR", ".")
+LEADERBOARD_STATE_FILE = os.environ.get("LEADERBOARD_STATE_FILE", os.path.join(OUTPUT_DIR, "leaderboard_state.json"))
+LEADERBOARD_FILE = os.path.join(OUTPUT_DIR, "leaderboard.json")
+ARCHIVE_FILE = os.environ.get("ARCHIVE_FILE", os.path.join(OUTPUT_DIR, "winners_archive.jsonl"))
+
+TOP_N = 25
+
+
+def season_of(date):
+    """Seasons are calendar years: '2025/12/05' -> '2025'"""
+    return (date or '')[:4] or 'unknown'
+
+
+def placings(tournament, players):
+    """[(player_id, place, split), ...] for a tournament's winners"""
+    result = []
+    for player in tournament.get('top_3', []):
+        player_id = player.get('player_id') or players.resolve(player['name'], create=True)
+        result.append((players.canonical_id(player_id), player['place'], bool(player.get('split'))))
+    return result
+
+
+class Leaderboard:
+    """Incrementally maintained season counters"""
+
+    def __init__(self, path=LEADERBOARD_STATE_FILE, players=None):
+        self.path = path
+        self.players = players or PlayerIndex()
+        self.seasons = {}   # season -> {'events': n, 'players': {player_id: counters}}
+        self.applied = {}   # tournament key -> {'season', 'placings'}
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            self.seasons = data.get('seasons', {})
+            self.applied = data.get('applied', {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.warning("Could not load leaderboard state %s: %s", self.path, e)
+
+    def save(self):
+        dir_path = os.path.dirname(self.path)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'seasons': self.seasons, 'applied': self.applied}, f)
+        os.replace(tmp_path, self.path)
+
+    def _count(self, season, entries, sign):
+        stats = self.seasons.setdefault(season, {'events': 0, 'players': {}})
+        stats['events'] += sign
+        for player_id, place, split in entries:
+            counters = stats['players'].setdefault(
+                player_id, {'wins': 0, 'splits': 0, 'second': 0, 'third': 0, 'top3': 0})
+            if place == 1:
+                counters['splits' if split else 'wins'] += sign
+            elif place == 2:
+                counters['second'] += sign
+            elif place == 3:
+                counters['third'] += sign
+            counters['top3'] += sign
+            if not any(counters.values()):
+                del stats['players'][player_id]
+
+    def apply(self, tournament):
+        """Add one archived tournament; True if the counters changed"""
+        key = WinnersArchive.key(tournament)
+        season = season_of(tournament.get('date'))
+        entries = placings(tournament, self.players)
+
+        previous = self.applied.get(key)
+        if previous:
+            if previous['season'] == season and [tuple(p) for p in previous['placings']] == entries:
+                return False
+            self._count(previous['season'], [tuple(p) for p in previous['placings']], -1)
+
+        self._count(season, entries, 1)
+        self.applied[key] = {'season': season, 'placings': entries}
+        return True
+
+    def rebuild(self, archive):
+        """Recompute everything from the archive (after merges or corrections)"""
+        self.seasons = {}
+        self.applied = {}
+        for record in archive.records.values():
+            self.apply(record)
+
+    def standings(self, season=None):
+        season = season or max(self.seasons, default=None)
+        stats = self.seasons.get(season, {'events': 0, 'players': {}})
+        rows = []
+        for player_id, counters in stats['players'].items():
+            player = self.players.players.get(player_id, {})
+            rows.append([player.get('name', player_id), counters['wins'], counters['splits'],
+                         counters['second'], counters['third'], counters['top3']])
+        rows.sort(key=lambda r: (-r[1], -r[2], -r[5], r[0]))
+        return season, stats['events'], rows
+
+    def write_compact(self, path=LEADERBOARD_FILE, season=None):
+        """Small JSON for the web pages - current season, top players only"""
+        season, events, rows = self.standings(season)
+        data = {
+            'season': season,
+            'events': events,
+            'updated': datetime.datetime.now().isoformat(timespec='seconds'),
+            'columns': ['name', 'wins', 'splits', 'second', 'third', 'top3'],
+            'rows': rows[:TOP_N]
+        }
+        dir_path = os.path.dirname(path)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+        return data
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Season leaderboard')
+    parser.add_argument('--state', default=LEADERBOARD_STATE_FILE)
+    parser.add_argument('--output', default=LEADERBOARD_FILE)
+    sub = parser.add_subparsers(dest='command', required=True)
+    rebuild = sub.add_parser('rebuild', help='Recompute from the winners archive')
+    rebuild.add_argument('--archive', default=ARCHIVE_FILE)
+    show = sub.add_parser('show')
+    show.add_argument('--season')
+    args = parser.parse_args(argv)
+
+    board = Leaderboard(args.state)
+
+    if args.command == 'rebuild':
+        archive = WinnersArchive(args.archive)
+        board.rebuild(archive)
+        board.players.save()
+        board.save()
+        data = board.write_compact(args.output)
+        print(f"✓ Rebuilt from {len(archive)} tournaments - season {data['season']}: {data['events']} events")
+        return 0
+
+    season, events, rows = board.standings(args.season)
+    print(f"Season {season} - {events} events")
+    print(f"  {'Player':<28} {'W':>3} {'Spl':>4} {'2nd':>4} {'3rd':>4} {'Top3':>5}")
+    for name, wins, splits, second, third, top3 in rows[:TOP_N]:
+        print(f"  {name:<28} {wins:>3} {splits:>4} {second:>4} {third:>4} {top3:>5}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
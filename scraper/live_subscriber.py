@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+DigitalPool Live Subscriber
+Listens to DigitalPool's GraphQL websocket subscriptions for one tournament and
+hands pushed status and bracket changes to callbacks as they arrive.
+
+- Speaks graphql-transport-ws (and the legacy graphql-ws message names)
+- Reconnects with exponential backoff + jitter
+- Falls back to a polling callable while the channel is unavailable
+- DIGITALPOOL_WS_URL can point at ws_replay_server.py for local testing;
+  DIGITALPOOL_WS_RECORD=<file> appends received messages for later replay
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import re
+import time
+
+try:
+    import websockets
+except ImportError:
+    websockets = None
+
+
+DIGITALPOOL_WS_URL = os.environ.get('DIGITALPOOL_WS_URL', 'wss://api.digitalpool.com/v1/graphql')
+DIGITALPOOL_WS_RECORD = os.environ.get('DIGITALPOOL_WS_RECORD')
+
+CONNECT_TIMEOUT = 10
+BACKOFF_INITIAL = 1
+BACKOFF_MAX = 60
+FAILURES_BEFORE_FALLBACK = 3   # Poll once after this many failed connects in a row
+FALLBACK_POLL_INTERVAL = 300   # Seconds between polls while the channel is down
+
+STATUS_SUBSCRIPTION = """
+subscription TournamentStatus($slug: String!) {
+  tournaments(where: {slug: {_eq: $slug}}) {
+    id
+    name
+    status
+    progress
+    tournament_players_aggregate { aggregate { count } }
+  }
+}
+"""
+
+MATCHES_SUBSCRIPTION = """
+subscription TournamentMatches($slug: String!) {
+  tournament_brackets(where: {tournament: {slug: {_eq: $slug}}}, order_by: {match_number: asc}) {
+    id
+    round
+    match_number
+    table_name
+    status
+    challenger1_name
+    challenger2_name
+    challenger1_score
+    challenger2_score
+  }
+}
+"""
+
+# DigitalPool status values -> the status strings used in tournament_data.json
+STATUS_MAP = {
+    'IN_PROGRESS': 'In Progress',
+    'LIVE': 'In Progress',
+    'COMPLETED': 'Completed',
+    'FINISHED': 'Completed',
+    'NOT_STARTED': 'Upcoming',
+    'UPCOMING': 'Upcoming',
+    'REGISTRATION': 'Upcoming',
+}
+
+MATCH_STATUS_MAP = {
+    'IN_PROGRESS': 'in_progress',
+    'COMPLETED': 'completed',
+    'NOT_STARTED': 'pending',
+}
+
+
+def tournament_slug(tournament_url):
+    """'https://digitalpool.com/tournaments/20251206-doubles/' -> '20251206-doubles'"""
+    match = re.search(r'/tournaments/([^/?#]+)', tournament_url or '')
+    return match.group(1) if match else None
+
+
+def normalize_tournament(row):
+    """Pushed tournament row -> tournament_data.json fields"""
+    fields = {}
+    if row.get('status'):
+        status = str(row['status']).upper()
+        fields['status'] = STATUS_MAP.get(status, row['status'])
+    if row.get('progress') is not None:
+        fields['completion_pct'] = int(float(row['progress']))
+    players = (row.get('tournament_players_aggregate') or {}).get('aggregate') or {}
+    if players.get('count') is not None:
+        fields['player_count'] = players['count']
+    return fields
+
+
+def normalize_matches(rows):
+    """Pushed bracket rows -> match_id -> match dict (same shape as the page extractor)"""
+    matches = {}
+    for row in rows or []:
+        match_id = str(row.get('id') or '')
+        if not match_id:
+            continue
+        status = str(row.get('status') or '').upper()
+        matches[match_id] = {
+            'match_id': match_id,
+            'round': row.get('round'),
+            'match_number': row.get('match_number'),
+            'table': row.get('table_name'),
+            'player1': row.get('challenger1_name'),
+            'player2': row.get('challenger2_name'),
+            'score1': row.get('challenger1_score'),
+            'score2': row.get('challenger2_score'),
+            'status': MATCH_STATUS_MAP.get(status, 'pending'),
+        }
+    return matches
+
+
+class LiveSubscriber:
+    """Keeps a subscription open for one tournament and dispatches pushed updates
+
+    on_tournament(fields) and on_matches(matches) may return True to stop
+    listening (e.g. once the tournament is completed).
+    """
+
+    def __init__(self, tournament_url, on_tournament, on_matches=None,
+                 fallback_poll=None, ws_url=DIGITALPOOL_WS_URL, record_path=DIGITALPOOL_WS_RECORD):
+        self.tournament_url = tournament_url
+        self.slug = tournament_slug(tournament_url)
+        self.on_tournament = on_tournament
+        self.on_matches = on_matches
+        self.fallback_poll = fallback_poll
+        self.ws_url = ws_url
+        self.record_path = record_path
+        self._last_message_at = None
+        self.stopped = False
+        self.messages_received = 0
+
+    def run(self):
+        """Blocking entry point - returns once a callback asks to stop"""
+        if not self.slug:
+            logging.error("Cannot subscribe - no tournament slug in %s", self.tournament_url)
+            return
+        asyncio.run(self._run())
+
+    async def _run(self):
+        backoff = BACKOFF_INITIAL
+        failures = 0
+
+        while not self.stopped:
+            if websockets is None:
+                logging.warning("websockets package not installed - polling instead of subscribing")
+                if not await self._poll():
+                    return
+                await asyncio.sleep(FALLBACK_POLL_INTERVAL)
+                continue
+
+            try:
+                await self._subscribe_once()
+                # Clean close from the server - reconnect right away
+                backoff = BACKOFF_INITIAL
+                failures = 0
+            except Exception as e:
+                failures += 1
+                logging.warning("Live channel unavailable (%s) - attempt %d", e, failures)
+
+            if self.stopped:
+                break
+
+            if failures >= FAILURES_BEFORE_FALLBACK:
+                logging.info("Falling back to polling while the live channel is down")
+                if not await self._poll():
+                    return
+                failures = 0
+
+            delay = backoff + random.uniform(0, backoff / 2)
+            logging.info("Reconnecting to live channel in %.1fs", delay)
+            await asyncio.sleep(delay)
+            backoff = min(backoff * 2, BACKOFF_MAX)
+
+    async def _poll(self):
+        """Run the fallback poll in a worker thread; False if there is none"""
+        if not self.fallback_poll:
+            return False
+        try:
+            if await asyncio.to_thread(self.fallback_poll):
+                self.stopped = True
+        except Exception as e:
+            logging.error("Fallback poll failed: %s", e)
+        return not self.stopped
+
+    async def _subscribe_once(self):
+        async with websockets.connect(self.ws_url,
+                                      subprotocols=['graphql-transport-ws', 'graphql-ws'],
+                                      open_timeout=CONNECT_TIMEOUT) as ws:
+            legacy = ws.subprotocol == 'graphql-ws'
+
+            await ws.send(json.dumps({'type': 'connection_init', 'payload': {}}))
+            while True:
+                ack = json.loads(await asyncio.wait_for(ws.recv(), CONNECT_TIMEOUT))
+                if ack.get('type') == 'connection_ack':
+                    break
+                if ack.get('type') == 'connection_error':
+                    raise ConnectionError(ack.get('payload'))
+
+            subscriptions = {'status': STATUS_SUBSCRIPTION}
+            if self.on_matches:
+                subscriptions['matches'] = MATCHES_SUBSCRIPTION
+            for sub_id, query in subscriptions.items():
+                await ws.send(json.dumps({
+                    'id': sub_id,
+                    'type': 'start' if legacy else 'subscribe',
+                    'payload': {'query': query, 'variables': {'slug': self.slug}}
+                }))
+
+            logging.info("✓ Subscribed to live updates for %s", self.slug)
+
+            async for raw in ws:
+                self._record(raw)
+                message = json.loads(raw)
+                msg_type = message.get('type')
+
+                if msg_type == 'ping':
+                    await ws.send(json.dumps({'type': 'pong'}))
+                elif msg_type in ('next', 'data'):
+                    self.messages_received += 1
+                    self._dispatch(message.get('id'), (message.get('payload') or {}).get('data') or {})
+                elif msg_type == 'error':
+                    raise ConnectionError(message.get('payload'))
+
+                if self.stopped:
+                    return
+
+    def _record(self, raw):
+        """Append a received message (with the gap since the previous one) for replay"""
+        if not self.record_path:
+            return
+        now = time.monotonic()
+        delay = now - self._last_message_at if self._last_message_at else 0
+        self._last_message_at = now
+        try:
+            with open(self.record_path, 'a') as f:
+                f.write(json.dumps({'delay': round(delay, 3), 'message': json.loads(raw)}) + '\n')
+        except Exception as e:
+            logging.warning("Could not record live message: %s", e)
+
+    def _dispatch(self, sub_id, data):
+        if sub_id == 'status':
+            rows = data.get('tournaments') or []
+            if rows and self.on_tournament(normalize_tournament(rows[0])):
+                self.stopped = True
+        elif sub_id == 'matches' and self.on_matches:
+            if self.on_matches(normalize_matches(data.get('tournament_brackets'))):
+                self.stopped = True
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Player Name Validation
+Decides whether a string pulled from card text looks like a player name rather
+than a table header, date, fee or tournament title.
+
+All word lists are compiled once at import: exact matches are a frozenset
+lookup, and the keyword and date/time checks are one alternation regex each.
+validate_player_names() checks a whole list of candidates with a single keyword
+scan over the joined text.
+"""
+
+import bisect
+import re
+
+
+# Common table headers and non-name strings to filter out
+INVALID_NAMES = frozenset([
+    'name', 'player', 'description', 'start date', 'end date', 'date',
+    'time', 'status', 'place', 'rank', 'position', 'score', 'points',
+    'wins', 'losses', 'matches', 'games', 'rating', 'fargo', 'handicap',
+    'entry', 'fee', 'payout', 'prize', 'total', 'amount', 'action',
+    'details', 'view', 'edit', 'delete', 'bracket', 'standings',
+    'tournament', 'event', 'venue', 'location', 'format', 'type',
+    'round', 'match', 'table', 'seed', 'bye', 'forfeit', 'dq',
+    'n/a', 'tbd', 'unknown', 'pending', 'complete', 'in progress',
+])
+
+# Tournament names (contain "tournament", "night", "ball", etc.)
+TOURNAMENT_KEYWORDS = (
+    'tournament', 'night', '8-ball', '9-ball', '10-ball',
+    'eight ball', 'nine ball', 'ten ball', 'billiards',
+    'championship', 'league', 'weekly', 'monday', 'tuesday',
+    'wednesday', 'thursday', 'friday', 'saturday', 'sunday',
+)
+
+# Entry fees ("$15 Entry") and tournament keywords - matched against the lowercased text
+BLOCKED_RE = re.compile('|'.join(re.escape(k) for k in ('$', 'entry') + TOURNAMENT_KEYWORDS))
+
+# Dates/times: "2025/12/3", "12:04 AM", "Thu, Dec 4", "December 4", "4th 2025"
+DATE_TIME_RE = re.compile(
+    r'\d{4}[/-]\d{1,2}[/-]\d{1,2}'
+    r'|\d{1,2}:\d{2}\s*(?:AM|PM|am|pm|UTC)'
+    r'|(?i:(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),?\s+\w+\s+\d)'
+    r'|(?i:(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d)'
+    r'|\d{1,2}(?:st|nd|rd|th)\s+\d{4}'
+)
+
+HAS_UPPER_RE = re.compile(r'[A-Z]')
+HAS_DIGIT_RE = re.compile(r'\d')
+
+MAX_NAME_LENGTH = 35
+MAX_DIGITS = 2
+
+# Joins batch candidates - none of the patterns above can match across it
+_SEPARATOR = '\x00'
+
+
+def _shape_ok(name):
+    """Checks that don't need the keyword/date scans"""
+    if not name or len(name) < 2 or len(name) > MAX_NAME_LENGTH:
+        return False
+    if name.lower().strip() in INVALID_NAMES:
+        return False
+    # Must have a capital letter, so it can't be all numbers/symbols
+    # (names look like "John Smith" or "J. Smith")
+    if not HAS_UPPER_RE.search(name):
+        return False
+    # Player names rarely have numbers
+    return sum(map(str.isdigit, name)) <= MAX_DIGITS
+
+
+def is_valid_player_name(name):
+    """Check if a string looks like a valid player name (not a table header or metadata)"""
+    if not _shape_ok(name):
+        return False
+    if BLOCKED_RE.search(name.lower()):
+        return False
+    # Every date/time form needs a digit, so most names skip this scan
+    if HAS_DIGIT_RE.search(name) and DATE_TIME_RE.search(name):
+        return False
+    return True
+
+
+def validate_player_names(names):
+    """is_valid_player_name for a list of candidates - returns a list of bools
+
+    Candidates that pass the cheap shape checks are joined and scanned once for
+    blocked keywords; a match rejects the candidate it starts in. Only the few
+    candidates containing a digit get the date/time scan.
+    """
+    results = [_shape_ok(name) for name in names]
+    candidates = []
+    for i, ok in enumerate(results):
+        if ok and _SEPARATOR in names[i]:
+            results[i] = is_valid_player_name(names[i])
+        elif ok:
+            candidates.append(i)
+    if not candidates:
+        return results
+
+    starts = []
+    offset = 0
+    for i in candidates:
+        starts.append(offset)
+        offset += len(names[i]) + 1
+
+    text = _SEPARATOR.join(names[i] for i in candidates)
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        for match in BLOCKED_RE.finditer(lowered):
+            results[candidates[bisect.bisect_right(starts, match.start()) - 1]] = False
+    else:
+        # str.lower() changed the length (a few non-ASCII letters) - offsets would drift
+        for i in candidates:
+            if BLOCKED_RE.search(names[i].lower()):
+                results[i] = False
+
+    for i in candidates:
+        if results[i] and HAS_DIGIT_RE.search(names[i]) and DATE_TIME_RE.search(names[i]):
+            results[i] = False
+
+    return results
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Player Identity Index
+Gives every player a stable id so card winners ("Matthew Fitch Jr.") and
+console registrations ("Matt Fitch Jr") line up.
+
+- Names are canonicalized: accents/punctuation stripped, nicknames mapped to
+  one first name, Jr/Sr spellings unified, middle initials dropped
+- Exact canonical matches are a dict lookup; anything else goes through a
+  trigram inverted index scored by Dice similarity
+- Only exact canonical or alias matches resolve automatically. Fuzzy hits
+  ("Dan Millet" for "Dan Miller") are suggestions for lookup/merge - a new
+  player that looks like a known one is logged as a possible duplicate
+- Merged ids keep resolving to the player they were merged into
+
+Usage:
+    python3 player_index.py lookup "Matt Fitch Jr"
+    python3 player_index.py alias p0007 "Matty Fitch"
+    python3 player_index.py merge p0007 p0031
+    python3 player_index.py import-csv players.csv       (console Download CSV)
+    python3 player_index.py import-winners [winners_archive.jsonl]
+"""
+
+import argparse
+import collections
+import csv
+import json
+import logging
+import math
+import os
+import re
+import sys
+import time
+import unicodedata
+
+
+PLAYER_INDEX_FILE = os.environ.get(
+    "PLAYER_INDEX_FILE", os.path.join(os.environ.get("OUTPUT_DIR", "."), "player_index.json"))
+
+MATCH_THRESHOLD = 0.85   # Dice score at which a new player is logged as a possible duplicate
+LOOKUP_THRESHOLD = 0.5   # Lowest score shown as a lookup suggestion
+
+NICKNAMES = {
+    'matt': 'matthew', 'mike': 'michael', 'mikey': 'michael', 'dave': 'david',
+    'chris': 'christopher', 'tom': 'thomas', 'tommy': 'thomas', 'bob': 'robert',
+    'bobby': 'robert', 'rob': 'robert', 'robbie': 'robert', 'bill': 'william',
+    'billy': 'william', 'will': 'william', 'jim': 'james', 'jimmy': 'james',
+    'joe': 'joseph', 'joey': 'joseph', 'dan': 'daniel', 'danny': 'daniel',
+    'steve': 'steven', 'stephen': 'steven', 'tony': 'anthony', 'nick': 'nicholas',
+    'josh': 'joshua', 'jon': 'jonathan', 'jeff': 'jeffrey', 'ken': 'kenneth',
+    'kenny': 'kenneth', 'greg': 'gregory', 'rick': 'richard', 'ricky': 'richard',
+    'rich': 'richard', 'ron': 'ronald', 'ronnie': 'ronald', 'don': 'donald',
+    'donnie': 'donald', 'andy': 'andrew', 'drew': 'andrew', 'sam': 'samuel',
+    'ben': 'benjamin', 'alex': 'alexander', 'pat': 'patrick', 'ed': 'edward',
+    'eddie': 'edward', 'larry': 'lawrence', 'jerry': 'gerald', 'charlie': 'charles',
+    'chuck': 'charles', 'doug': 'douglas', 'tim': 'timothy', 'timmy': 'timothy',
+    'jake': 'jacob', 'zach': 'zachary', 'zack': 'zachary', 'nate': 'nathan',
+    'kate': 'katherine', 'katie': 'katherine', 'liz': 'elizabeth', 'beth': 'elizabeth',
+    'jen': 'jennifer', 'jenny': 'jennifer', 'sue': 'susan', 'cindy': 'cynthia',
+}
+
+SUFFIXES = {
+    'jr': 'jr', 'junior': 'jr', 'sr': 'sr', 'senior': 'sr',
+    'ii': 'ii', '2nd': 'ii', 'iii': 'iii', '3rd': 'iii', 'iv': 'iv', '4th': 'iv',
+}
+
+_NON_NAME_RE = re.compile(r"[^a-z0-9\s-]")
+
+
+def canonicalize(name):
+    """'Matthew  Fitch, Jr.' -> 'matthew fitch jr'"""
+    text = unicodedata.normalize('NFKD', name or '').encode('ascii', 'ignore').decode('ascii')
+    text = _NON_NAME_RE.sub('', text.lower().replace("'", '').replace('.', ' ').replace(',', ' '))
+    tokens = text.replace('-', ' ').split()
+    if not tokens:
+        return ''
+
+    suffix = None
+    if len(tokens) > 1 and tokens[-1] in SUFFIXES:
+        suffix = SUFFIXES[tokens.pop()]
+
+    first = NICKNAMES.get(tokens[0], tokens[0])
+    # Drop middle initials ("Michael D Chambers")
+    rest = [t for i, t in enumerate(tokens[1:], 1) if len(t) > 1 or i == len(tokens) - 1]
+
+    return ' '.join([first] + rest + ([suffix] if suffix else []))
+
+
+def _suffix(key):
+    last = key.rsplit(' ', 1)[-1]
+    return last if last in SUFFIXES else None
+
+
+def trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class PlayerIndex:
+    """Persistent player id registry with exact and trigram fuzzy lookup"""
+
+    def __init__(self, path=PLAYER_INDEX_FILE):
+        self.path = path
+        self.players = {}   # id -> {'name', 'aliases', ...} or {'merged_into': id}
+        self.next_id = 1
+        self.exact = {}     # canonical key -> id
+        self.postings = collections.defaultdict(set)  # trigram -> canonical keys
+        self.key_grams = {}  # canonical key -> trigram set
+        self.fargo = {}     # Fargo id -> player id
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            self.players = data.get('players', {})
+            self.next_id = data.get('next_id', len(self.players) + 1)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.warning("Could not load player index %s: %s", self.path, e)
+
+        for player_id, player in self.players.items():
+            if 'merged_into' in player:
+                continue
+            for alias in [player['name']] + player.get('aliases', []):
+                self._index_key(canonicalize(alias), player_id)
+            if player.get('fargo_id'):
+                self.fargo[str(player['fargo_id'])] = player_id
+
+    def save(self):
+        dir_path = os.path.dirname(self.path)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'next_id': self.next_id, 'players': self.players}, f, indent=1)
+        os.replace(tmp_path, self.path)
+
+    def _index_key(self, key, player_id):
+        if not key:
+            return
+        self.exact[key] = player_id
+        if key not in self.key_grams:
+            grams = trigrams(key)
+            self.key_grams[key] = grams
+            for gram in grams:
+                self.postings[gram].add(key)
+
+    def canonical_id(self, player_id):
+        """Follow merges to the surviving id"""
+        seen = set()
+        while player_id in self.players and 'merged_into' in self.players[player_id] and player_id not in seen:
+            seen.add(player_id)
+            player_id = self.players[player_id]['merged_into']
+        return player_id
+
+    def candidates(self, name, limit=5, threshold=LOOKUP_THRESHOLD):
+        """[(score, player_id, matched_key), ...] best first"""
+        key = canonicalize(name)
+        if not key:
+            return []
+        if key in self.exact:
+            return [(1.0, self.canonical_id(self.exact[key]), key)]
+
+        # Prefix filter: a key scoring >= threshold shares at least min_common of
+        # the indexed trigrams, so it contains one of the rarest (n - min_common + 1)
+        gram_set = trigrams(key)
+        min_common = math.ceil(threshold * len(gram_set) / (2 - threshold))
+        indexed = sorted((g for g in gram_set if g in self.postings), key=lambda g: len(self.postings[g]))
+        probe = set()
+        for gram in indexed[:len(indexed) - min_common + 1]:
+            probe.update(self.postings[gram])
+
+        suffix = _suffix(key)
+        scored = []
+        for other in probe:
+            if _suffix(other) != suffix:
+                continue  # Jr, Sr and the unsuffixed name are different people
+            other_grams = self.key_grams[other]
+            score = 2 * len(gram_set & other_grams) / (len(gram_set) + len(other_grams))
+            if score >= threshold:
+                scored.append((score, self.canonical_id(self.exact[other]), other))
+        scored.sort(reverse=True)
+
+        results, seen = [], set()
+        for entry in scored:
+            if entry[1] not in seen:
+                seen.add(entry[1])
+                results.append(entry)
+            if len(results) == limit:
+                break
+        return results
+
+    def resolve(self, name, create=False, fargo_id=None):
+        """Player id for a name (or Fargo id); registers a new player if create"""
+        if fargo_id and str(fargo_id) in self.fargo:
+            player_id = self.canonical_id(self.fargo[str(fargo_id)])
+            self.add_alias(player_id, name)
+            return player_id
+
+        key = canonicalize(name)
+        if key in self.exact:
+            player_id = self.canonical_id(self.exact[key])
+        elif create and key:
+            # Near-identical spellings are often different people (Miller /
+            # Millet, Martin / Martinez) - never merge them automatically
+            similar = self.candidates(name, limit=1, threshold=MATCH_THRESHOLD)
+            player_id = f"p{self.next_id:04d}"
+            self.next_id += 1
+            self.players[player_id] = {'name': name.strip(), 'aliases': []}
+            self._index_key(key, player_id)
+            if similar:
+                score, other_id, _ = similar[0]
+                logging.info("New player %s '%s' looks like %s '%s' (%.2f) - if they are the same: "
+                             "player_index.py merge %s %s", player_id, name.strip(), other_id,
+                             self.players[other_id]['name'], score, other_id, player_id)
+        else:
+            return None
+
+        if fargo_id:
+            self.players[player_id]['fargo_id'] = str(fargo_id)
+            self.fargo[str(fargo_id)] = player_id
+        return player_id
+
+    def add_alias(self, player_id, alias):
+        player_id = self.canonical_id(player_id)
+        player = self.players[player_id]
+        key = canonicalize(alias)
+        if not key or self.exact.get(key) == player_id:
+            return
+        if alias != player['name'] and alias not in player['aliases']:
+            player['aliases'].append(alias)
+        self._index_key(key, player_id)
+
+    def merge(self, keep_id, drop_id):
+        """Fold drop_id into keep_id; drop_id keeps resolving to keep_id"""
+        keep_id, drop_id = self.canonical_id(keep_id), self.canonical_id(drop_id)
+        if keep_id == drop_id:
+            return keep_id
+        dropped = self.players[drop_id]
+        for alias in [dropped['name']] + dropped.get('aliases', []):
+            self.add_alias(keep_id, alias)
+        if dropped.get('fargo_id') and not self.players[keep_id].get('fargo_id'):
+            self.players[keep_id]['fargo_id'] = dropped['fargo_id']
+            self.fargo[dropped['fargo_id']] = keep_id
+        self.players[drop_id] = {'merged_into': keep_id, 'name': dropped['name']}
+        return keep_id
+
+
+def import_csv(index, path):
+    """Register players from the console's Download CSV (name,phone_number,skill_level,Fargo_ID)"""
+    count = 0
+    with open(path, newline='') as f:
+        for row in csv.DictReader(f):
+            name = (row.get('name') or '').strip()
+            if name:
+                index.resolve(name, create=True, fargo_id=(row.get('Fargo_ID') or '').strip() or None)
+                count += 1
+    return count
+
+
+def import_winners(index, archive_path):
+    """Register every winner in the winners archive"""
+    count = 0
+    with open(archive_path, 'r') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            for player in record.get('top_3', []):
+                index.resolve(player['name'], create=True)
+                count += 1
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Player identity index')
+    parser.add_argument('--index', default=PLAYER_INDEX_FILE)
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('lookup').add_argument('name')
+    alias = sub.add_parser('alias')
+    alias.add_argument('player_id')
+    alias.add_argument('name')
+    merge = sub.add_parser('merge')
+    merge.add_argument('keep_id')
+    merge.add_argument('drop_id')
+    sub.add_parser('import-csv').add_argument('csv_file')
+    sub.add_parser('import-winners').add_argument(
+        'archive', nargs='?',
+        default=os.environ.get("ARCHIVE_FILE", os.path.join(os.environ.get("OUTPUT_DIR", "."), "winners_archive.jsonl")))
+    args = parser.parse_args(argv)
+
+    index = PlayerIndex(args.index)
+
+    if args.command == 'lookup':
+        start = time.perf_counter()
+        results = index.candidates(args.name)
+        elapsed = (time.perf_counter() - start) * 1e6
+        print(f"'{args.name}' -> '{canonicalize(args.name)}' ({elapsed:.0f} µs)")
+        for score, player_id, key in results:
+            print(f"  {player_id}  {index.players[player_id]['name']:<30} {score:.2f}  via '{key}'")
+        if not results:
+            print("  No match")
+        return 0
+
+    if args.command == 'alias':
+        if index.canonical_id(args.player_id) not in index.players:
+            print(f"Unknown player id {args.player_id}")
+            return 1
+        index.add_alias(args.player_id, args.name)
+        print(f"✓ '{args.name}' -> {index.canonical_id(args.player_id)}")
+    elif args.command == 'merge':
+        for player_id in (args.keep_id, args.drop_id):
+            if player_id not in index.players:
+                print(f"Unknown player id {player_id}")
+                return 1
+        print(f"✓ Merged {args.drop_id} into {index.merge(args.keep_id, args.drop_id)}")
+    elif args.command == 'import-csv':
+        print(f"✓ Imported {import_csv(index, args.csv_file)} registrations")
+    elif args.command == 'import-winners':
+        print(f"✓ Resolved {import_winners(index, args.archive)} winners")
+
+    index.save()
+    active = sum(1 for p in index.players.values() if 'merged_into' not in p)
+    print(f"Index: {active} players, {len(index.exact)} names")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Live subscriber tests against ws_replay_server.py
+
+    python3 -m pytest scraper/test_live_subscriber.py
+    python3 -m unittest test_live_subscriber        (from scraper/)
+"""
+
+import asyncio
+import os
+import threading
+import unittest
+
+import live_subscriber
+from live_subscriber import LiveSubscriber
+
+try:
+    import websockets
+    import ws_replay_server
+except ImportError:
+    websockets = None
+
+
+RECORDING = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'recordings', 'live_sample.jsonl')
+TOURNAMENT_URL = 'https://digitalpool.com/tournaments/20251206-tuesday-8-ball/'
+SPEED = 100   # Recorded gaps are a few seconds; replay them in milliseconds
+
+
+class ReplayServer:
+    """ws_replay_server's replay handler on a free port, in a background thread"""
+
+    def __init__(self, drop_after=0):
+        self.recording = ws_replay_server.load_recording(RECORDING)
+        self.state = {'position': 0}
+        self.drop_after = drop_after
+        self.connections = 0
+        self.port = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=asyncio.run, args=(self._serve(),), daemon=True)
+
+    async def _serve(self):
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+
+        async def handler(ws):
+            self.connections += 1
+            try:
+                await ws_replay_server.replay(ws, self.recording, self.state, self.drop_after, SPEED)
+            except websockets.ConnectionClosed:
+                pass
+
+        async with websockets.serve(handler, 'localhost', 0,
+                                    subprotocols=['graphql-transport-ws', 'graphql-ws']) as server:
+            self.port = server.sockets[0].getsockname()[1]
+            self._ready.set()
+            await self._stop.wait()
+
+    @property
+    def url(self):
+        return f"ws://localhost:{self.port}"
+
+    def start(self):
+        self._thread.start()
+        self._ready.wait(5)
+        return self
+
+    def stop(self):
+        """Close the listener and every open connection (safe from any thread)"""
+        self._loop.call_soon_threadsafe(self._stop.set)
+
+    def join(self):
+        self._thread.join(5)
+
+
+@unittest.skipIf(websockets is None, "websockets not installed")
+class LiveSubscriberReplayTest(unittest.TestCase):
+
+    def setUp(self):
+        # Reconnect quickly - the real backoff starts at a second
+        self.saved = live_subscriber.BACKOFF_INITIAL, live_subscriber.BACKOFF_MAX
+        live_subscriber.BACKOFF_INITIAL, live_subscriber.BACKOFF_MAX = 0.01, 0.05
+        self.statuses = []
+        self.match_updates = []
+
+    def tearDown(self):
+        live_subscriber.BACKOFF_INITIAL, live_subscriber.BACKOFF_MAX = self.saved
+
+    def on_tournament(self, fields):
+        self.statuses.append(fields)
+        return fields.get('status') == 'Completed'
+
+    def on_matches(self, matches):
+        self.match_updates.append(matches)
+        return False
+
+    def subscribe(self, server, fallback_poll=None):
+        subscriber = LiveSubscriber(TOURNAMENT_URL, self.on_tournament, self.on_matches,
+                                    fallback_poll=fallback_poll, ws_url=server.url, record_path=None)
+        runner = threading.Thread(target=subscriber.run, daemon=True)
+        runner.start()
+        runner.join(20)
+        self.assertFalse(runner.is_alive(), "subscriber did not stop")
+        return subscriber
+
+    def test_pushed_updates_are_applied(self):
+        server = ReplayServer().start()
+        try:
+            subscriber = self.subscribe(server)
+        finally:
+            server.stop()
+            server.join()
+
+        self.assertEqual(self.statuses[0], {'status': 'In Progress', 'completion_pct': 10, 'player_count': 24})
+        self.assertEqual([s['completion_pct'] for s in self.statuses], [10, 35, 70, 100])
+        self.assertEqual(self.statuses[-1]['status'], 'Completed')
+        self.assertEqual(self.match_updates[-1]['m-1']['status'], 'completed')
+        self.assertEqual(subscriber.messages_received, 9)   # Every recorded update; the ping isn't one
+
+    def test_reconnects_after_dropped_connection(self):
+        server = ReplayServer(drop_after=3).start()
+        try:
+            subscriber = self.subscribe(server)
+        finally:
+            server.stop()
+            server.join()
+
+        self.assertGreater(server.connections, 1)
+        self.assertEqual([s['completion_pct'] for s in self.statuses], [10, 35, 70, 100])
+        self.assertEqual(subscriber.messages_received, 9)
+
+    def test_falls_back_to_polling_when_channel_is_down(self):
+        server = ReplayServer().start()
+        polls = []
+
+        def on_first_update(fields):
+            self.statuses.append(fields)
+            server.stop()   # Drop the socket and refuse reconnects
+            return False
+
+        def poll():
+            polls.append(True)
+            return True   # The poll saw the tournament finish
+
+        self.on_tournament = on_first_update
+        try:
+            self.subscribe(server, fallback_poll=poll)
+        finally:
+            server.join()
+
+        self.assertEqual(len(self.statuses), 1)
+        self.assertEqual(polls, [True])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the player identity index
+
+    python3 -m pytest scraper/test_player_index.py
+    python3 -m unittest test_player_index        (from scraper/)
+"""
+
+import os
+import tempfile
+import unittest
+
+from player_index import PlayerIndex
+
+
+class SuffixMatchingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.index = PlayerIndex(os.path.join(self.tmp.name, 'player_index.json'))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_jr_sr_and_unsuffixed_stay_separate(self):
+        junior = self.index.resolve("Craig Frye Jr", create=True)
+        plain = self.index.resolve("Craig Frye", create=True)
+        senior = self.index.resolve("Craig Frye Sr", create=True)
+        self.assertEqual(len({junior, plain, senior}), 3)
+
+    def test_suffix_never_aliases_to_unsuffixed_name(self):
+        plain = self.index.resolve("Tom Walsh", create=True)
+        junior = self.index.resolve("Tom Walsh Jr", create=True)
+        self.assertNotEqual(plain, junior)
+        self.assertEqual(self.index.players[plain]['aliases'], [])
+        self.assertEqual(self.index.candidates("Thomas Walsh Jr"), [(1.0, junior, 'thomas walsh jr')])
+
+    def test_same_suffix_spellings_still_match(self):
+        player = self.index.resolve("Matthew Fitch Jr.", create=True)
+        self.assertEqual(self.index.resolve("Matt Fitch Junior", create=True), player)
+
+
+class FuzzyMatchingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.index = PlayerIndex(os.path.join(self.tmp.name, 'player_index.json'))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_similar_surnames_are_different_players(self):
+        for first, second in [("Dan Miller", "Dan Millet"),
+                              ("Tony Martin", "Tony Martinez"),
+                              ("Steve Roberts", "Steve Robertson")]:
+            with self.subTest(first=first, second=second):
+                first_id = self.index.resolve(first, create=True)
+                second_id = self.index.resolve(second, create=True)
+                self.assertNotEqual(first_id, second_id)
+                self.assertEqual(self.index.players[first_id]['aliases'], [])
+
+    def test_fuzzy_hits_stay_lookup_suggestions(self):
+        player = self.index.resolve("Dan Miller", create=True)
+        self.assertIsNone(self.index.resolve("Dan Millet"))
+        self.assertEqual(self.index.candidates("Dan Millet")[0][1], player)
+
+    def test_nicknames_and_aliases_resolve_exactly(self):
+        player = self.index.resolve("Daniel Miller", create=True)
+        self.assertEqual(self.index.resolve("Danny Miller"), player)
+        self.index.add_alias(player, "D Miller Jr")
+        self.assertEqual(self.index.resolve("D. Miller Jr."), player)
+
+
+if __name__ == '__main__':
+    unittest.main()
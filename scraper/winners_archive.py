@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Winners Archive
+Append-only JSON Lines history of completed tournaments, one record per line,
+keyed by tournament URL. A later line for the same URL supersedes earlier ones
+(e.g. winners found on a re-run), so the file is never rewritten.
+The date index is rebuilt on load.
+"""
+
+import datetime
+import json
+import logging
+import os
+
+
+class WinnersArchive:
+    """URL-keyed archive of completed tournaments with a date index"""
+
+    def __init__(self, path):
+        self.path = path
+        self.records = {}   # key -> record
+        self.by_date = {}   # 'YYYY/MM/DD' -> [key, ...]
+        self._torn_tail = False
+        self.load()
+
+    @staticmethod
+    def key(tournament):
+        """Tournament URL, or date|name when the card had no link"""
+        return tournament.get('url') or f"{tournament.get('date')}|{tournament.get('name')}"
+
+    def load(self):
+        try:
+            with open(self.path, 'r') as f:
+                for line_number, line in enumerate(f, 1):
+                    self._torn_tail = not line.endswith('\n')
+                    if not line.strip():
+                        continue
+                    try:
+                        self._index(json.loads(line))
+                    except ValueError:
+                        # A torn final line from an interrupted run - skip it
+                        logging.warning("Skipping bad archive line %d in %s", line_number, self.path)
+        except FileNotFoundError:
+            pass
+
+    def _index(self, record):
+        key = self.key(record)
+        previous = self.records.get(key)
+        if previous and previous.get('date') != record.get('date'):
+            self.by_date[previous.get('date')].remove(key)
+        if not previous or previous.get('date') != record.get('date'):
+            self.by_date.setdefault(record.get('date'), []).append(key)
+        self.records[key] = record
+
+    def __contains__(self, tournament):
+        return self.key(tournament) in self.records
+
+    def __len__(self):
+        return len(self.records)
+
+    def get(self, tournament):
+        return self.records.get(self.key(tournament))
+
+    def add(self, tournament):
+        """Append a completed tournament; True if it is new or adds missing winners"""
+        existing = self.get(tournament)
+        top_3 = tournament.get('top_3', [])
+        if existing and (existing.get('top_3') or not top_3):
+            return False
+
+        record = {
+            'url': tournament.get('url'),
+            'name': tournament.get('name'),
+            'date': tournament.get('date'),
+            'top_3': top_3,
+            'archived_at': datetime.datetime.now().isoformat(timespec='seconds')
+        }
+
+        dir_path = os.path.dirname(self.path)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+        with open(self.path, 'a') as f:
+            if self._torn_tail:
+                f.write('\n')
+                self._torn_tail = False
+            f.write(json.dumps(record) + '\n')
+
+        self._index(record)
+        return True
+
+    def dates(self):
+        """Archived dates, newest first"""
+        return sorted((d for d, keys in self.by_date.items() if d and keys), reverse=True)
+
+    def latest_date(self):
+        dates = self.dates()
+        return dates[0] if dates else None
+
+    def watermark(self):
+        """Date and URL of the newest archived tournament, or None if empty"""
+        date = self.latest_date()
+        if not date:
+            return None
+        newest = max(self.tournaments_on(date), key=lambda r: r.get('archived_at') or '')
+        return {'date': date, 'url': newest.get('url')}
+
+    def tournaments_on(self, date):
+        return [self.records[key] for key in self.by_date.get(date, [])]
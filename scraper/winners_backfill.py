@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Historical Winners Backfill
+Splits a date range into chunks and scrapes them with a small pool of worker
+processes (one headless Chrome each). Page loads and scroll steps from every
+worker go through one shared rate limiter so DigitalPool sees a steady pace.
+
+Completed chunks are recorded in a checkpoint next to the archive, so an
+interrupted backfill resumes with the chunks it had not finished.
+
+Usage:
+    python3 winnerscraper.py backfill 2023/01/01 2025/12/31 [--workers 2] [--chunk-days 30]
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import multiprocessing
+import os
+import time
+
+import winnerscraper
+from service_logging import setup_logging
+from winners_archive import WinnersArchive
+from player_index import PlayerIndex
+from leaderboard import Leaderboard
+
+
+DEFAULT_WORKERS = 2        # Each worker runs its own Chrome - keep it small on the Pi
+DEFAULT_CHUNK_DAYS = 30
+MIN_REQUEST_INTERVAL = 2.0  # Seconds between DigitalPool page actions across all workers
+
+
+class RateLimiter:
+    """Minimum spacing between actions, shared across processes"""
+
+    def __init__(self, min_interval, lock, next_time):
+        self.min_interval = min_interval
+        self.lock = lock
+        self.next_time = next_time
+
+    def wait(self):
+        with self.lock:
+            now = time.time()
+            if self.next_time.value > now:
+                time.sleep(self.next_time.value - now)
+                now = self.next_time.value
+            self.next_time.value = now + self.min_interval
+
+
+def date_chunks(start, end, chunk_days):
+    """[(chunk_start, chunk_end), ...] newest first, as YYYY/MM/DD strings"""
+    start_date = datetime.datetime.strptime(start, "%Y/%m/%d").date()
+    chunk_end = datetime.datetime.strptime(end, "%Y/%m/%d").date()
+    chunks = []
+    while chunk_end >= start_date:
+        chunk_start = max(start_date, chunk_end - datetime.timedelta(days=chunk_days - 1))
+        chunks.append((chunk_start.strftime("%Y/%m/%d"), chunk_end.strftime("%Y/%m/%d")))
+        chunk_end = chunk_start - datetime.timedelta(days=1)
+    return chunks
+
+
+def load_checkpoint(path, start, end, chunk_days):
+    """Chunks already finished for this exact backfill (a different range starts over)"""
+    try:
+        with open(path, 'r') as f:
+            checkpoint = json.load(f)
+        if (checkpoint.get('start'), checkpoint.get('end'), checkpoint.get('chunk_days')) == (start, end, chunk_days):
+            return {tuple(chunk) for chunk in checkpoint.get('done', [])}
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logging.warning("Ignoring unreadable checkpoint %s: %s", path, e)
+    return set()
+
+
+def save_checkpoint(path, start, end, chunk_days, done):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump({
+            'start': start,
+            'end': end,
+            'chunk_days': chunk_days,
+            'done': sorted(done, reverse=True),
+            'updated': datetime.datetime.now().isoformat(timespec='seconds')
+        }, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def init_worker(min_interval, lock, next_time):
+    setup_logging()
+    winnerscraper.rate_limiter = RateLimiter(min_interval, lock, next_time)
+
+
+def scrape_chunk(chunk):
+    """Worker: completed tournaments dated within the chunk, or None if it failed"""
+    chunk_start, chunk_end = chunk
+    driver = None
+    try:
+        driver = winnerscraper.setup_driver(headless=True)
+        if not winnerscraper.open_search_page(driver):
+            return chunk, None
+
+        # The chunk start acts as the watermark: scroll (uncapped - older chunks
+        # sit far down the list) until cards are older than it. A chunk whose
+        # start was never loaded failed, rather than finished with no results.
+        tournaments = winnerscraper.search_tournaments(
+            driver, {'date': chunk_start, 'url': None}, until=chunk_end,
+            max_scroll_steps=None, complete_only=True)
+        if tournaments is None:
+            logging.warning("Chunk %s - %s: search did not reach %s", chunk_start, chunk_end, chunk_start)
+            return chunk, None
+        return chunk, [t for t in tournaments if t['date'] and chunk_start <= t['date'] <= chunk_end]
+    except Exception as e:
+        logging.error("Chunk %s - %s failed: %s", chunk_start, chunk_end, e)
+        return chunk, None
+    finally:
+        if driver:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+def backfill(start, end, archive_path, workers=DEFAULT_WORKERS, chunk_days=DEFAULT_CHUNK_DAYS,
+             min_interval=MIN_REQUEST_INTERVAL):
+    """Scrape every chunk not yet checkpointed and merge results into the archive
+
+    Returns the number of chunks that failed (they are retried on the next run).
+    """
+    archive = WinnersArchive(archive_path)
+    players = PlayerIndex()
+    leaderboard = Leaderboard(players=players)
+    checkpoint_path = archive_path + '.backfill.json'
+    done = load_checkpoint(checkpoint_path, start, end, chunk_days)
+    pending = [chunk for chunk in date_chunks(start, end, chunk_days) if chunk not in done]
+
+    total = len(pending) + len(done)
+
+    logging.info("Backfill %s - %s: %d chunks of %d days, %d already done, %d workers",
+                 start, end, total, chunk_days, len(done), workers)
+    if not pending:
+        return 0
+
+    # spawn: each worker starts clean (no inherited logging thread or driver state)
+    ctx = multiprocessing.get_context('spawn')
+    lock = ctx.Lock()
+    next_time = ctx.Value('d', 0.0, lock=False)
+
+    failed = 0
+    started = time.time()
+    with ctx.Pool(workers, initializer=init_worker, initargs=(min_interval, lock, next_time)) as pool:
+        # Results are merged here, so the archive has a single writer
+        for chunk, tournaments in pool.imap_unordered(scrape_chunk, pending):
+            if tournaments is None:
+                failed += 1
+                logging.warning("✗ Chunk %s - %s failed - will retry on the next run", *chunk)
+                continue
+
+            added = 0
+            for tournament in tournaments:
+                winnerscraper.tag_player_ids(tournament, players)
+                if archive.add(tournament):
+                    leaderboard.apply(archive.get(tournament))
+                    added += 1
+            players.save()
+            leaderboard.save()
+            done.add(chunk)
+            save_checkpoint(checkpoint_path, start, end, chunk_days, done)
+            logging.info("✓ Chunk %s - %s: %d tournaments, %d new (%d/%d chunks)",
+                         chunk[0], chunk[1], len(tournaments), added, len(done), total)
+
+    leaderboard.write_compact(os.path.join(winnerscraper.OUTPUT_DIR, "leaderboard.json"))
+    logging.info("Backfill finished in %.0fs - archive holds %d tournaments, %d chunk(s) failed",
+                 time.time() - started, len(archive), failed)
+    if not failed:
+        os.remove(checkpoint_path)
+    return failed
+
+
+def backfill_main(argv):
+    parser = argparse.ArgumentParser(prog='winnerscraper.py backfill',
+                                     description='Backfill historical winners into the archive')
+    parser.add_argument('start', help='First date (YYYY/MM/DD)')
+    parser.add_argument('end', nargs='?', default=datetime.date.today().strftime("%Y/%m/%d"),
+                        help='Last date (YYYY/MM/DD, default today)')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS)
+    parser.add_argument('--chunk-days', type=int, default=DEFAULT_CHUNK_DAYS)
+    parser.add_argument('--min-interval', type=float, default=MIN_REQUEST_INTERVAL,
+                        help='Seconds between page actions across all workers')
+    parser.add_argument('--archive', default=winnerscraper.ARCHIVE_FILE)
+    args = parser.parse_args(argv)
+
+    failed = backfill(args.start, args.end, args.archive, args.workers, args.chunk_days, args.min_interval)
+    return 1 if failed else 0
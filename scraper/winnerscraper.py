@@ -13,6 +13,10 @@ import re
 import logging
 import random
 import os
+import gzip
+import hashlib
+import html
+from string import Template
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
@@ -23,31 +27,83 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 
+# Shared logging setup lives with the Pi services in ../scripts
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from service_logging import setup_logging, debug_sampled
+from winners_archive import WinnersArchive
+from name_validation import validate_player_names
+from player_index import PlayerIndex
+from leaderboard import Leaderboard
+
 
 # Configuration
 VENUE_NAME = "Bankshot Billiards"
 VENUE_CITY = "Hilliard"
+OUTPUT_DIR = os.environ.get("OUTPUT_DIR", ".")
+ARCHIVE_FILE = os.environ.get("ARCHIVE_FILE", os.path.join(OUTPUT_DIR, "winners_archive.jsonl"))
 
+# Final standings (place + name per row) in ONE in-page call - returns [] until
+# the standings table has rendered, so it doubles as the readiness check
+STANDINGS_EXTRACT_JS = """
+function cleanText(el) {
+    return el ? (el.innerText || el.textContent || '').replace(/\\s+/g, ' ').trim() : '';
+}
 
-def setup_logging():
-    """Configure logging"""
-    logger = logging.getLogger()
-    logger.setLevel(logging.INFO)
-    logger.handlers = []
-    
-    console_handler = logging.StreamHandler()
-    formatter = logging.Formatter('[%(asctime)s] %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
-    return logger
+var tables = Array.prototype.slice.call(document.querySelectorAll('table'));
+for (var t = 0; t < tables.length; t++) {
+    var headers = Array.prototype.map.call(tables[t].querySelectorAll('thead th'), function(th) {
+        return cleanText(th).toLowerCase();
+    });
+    var placeCol = headers.findIndex(function(h) { return /^(place|rank|finish|pos)/.test(h); });
+    if (placeCol < 0) continue;
+    var nameCol = headers.findIndex(function(h) { return /name|player/.test(h); });
+    if (nameCol < 0) nameCol = placeCol + 1;
+
+    var rows = [];
+    tables[t].querySelectorAll('tbody tr').forEach(function(tr) {
+        var cells = tr.querySelectorAll('td');
+        if (cells.length <= Math.max(placeCol, nameCol)) return;
+        var place = cleanText(cells[placeCol]);
+        var name = cleanText(cells[nameCol]);
+        if (/\\d/.test(place) && name) rows.push({place: place, name: name});
+    });
+    if (rows.length) return rows;
+}
+return [];
+"""
+STANDINGS_TIMEOUT = 15
+
+# Incremental search - stop once this many cards in a row are already archived
+WATERMARK_STOP_AFTER = 3
+MAX_SCROLL_STEPS = 40
+
+# innerText of the result cards after the first arguments[0] (seen cards aren't re-read)
+CARD_TEXTS_JS = """
+const cards = document.querySelectorAll('.ant-card');
+return Array.from(cards).slice(arguments[0]).map(card => card.innerText || '');
+"""
 
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
 
+# Shared rate limiter - set in backfill workers so page loads are spaced across processes
+rate_limiter = None
 
-def log(message):
-    logging.info(message)
+
+def log(message, *args):
+    """INFO log with lazy %-style arguments"""
+    logger.info(message, *args)
+
+
+def debug(message, *args):
+    """DEBUG log - skipped entirely unless BANKSHOT_LOG_LEVEL=DEBUG"""
+    logger.debug(message, *args)
+
+
+def throttle():
+    """Wait for the shared rate limiter, if any, before hitting DigitalPool"""
+    if rate_limiter:
+        rate_limiter.wait()
 
 
 def human_delay(min_seconds=1, max_seconds=3):
@@ -150,7 +206,7 @@ def setup_driver(headless=True):
         
         return driver
     except Exception as e:
-        log(f"Error setting up ChromeDriver: {e}")
+        log("Error setting up ChromeDriver: %s", e)
         raise
 
 
@@ -228,86 +284,12 @@ def format_date_for_url(date_str):
     return date_str.replace('/', '')
 
 
-def is_valid_player_name(name):
-    """Check if a string looks like a valid player name (not a table header or metadata)"""
-    if not name or len(name) < 2:
-        return False
-    
-    name_lower = name.lower().strip()
-    
-    # Common table headers and non-name strings to filter out
-    invalid_names = [
-        'name', 'player', 'description', 'start date', 'end date', 'date',
-        'time', 'status', 'place', 'rank', 'position', 'score', 'points',
-        'wins', 'losses', 'matches', 'games', 'rating', 'fargo', 'handicap',
-        'entry', 'fee', 'payout', 'prize', 'total', 'amount', 'action',
-        'details', 'view', 'edit', 'delete', 'bracket', 'standings',
-        'tournament', 'event', 'venue', 'location', 'format', 'type',
-        'round', 'match', 'table', 'seed', 'bye', 'forfeit', 'dq',
-        'n/a', 'tbd', 'unknown', 'pending', 'complete', 'in progress',
-    ]
-    
-    # Check against invalid names
-    if name_lower in invalid_names:
-        return False
-    
-    # Filter out entry fees like "$15 Entry", "$20", etc.
-    if '$' in name or 'entry' in name_lower:
-        return False
-    
-    # Filter out dates/times - various formats
-    # "Thu, Dec 4, 2025", "12:04 AM", "2025/12/3", etc.
-    if re.search(r'\d{4}[/-]\d{1,2}[/-]\d{1,2}', name):  # 2025/12/3 or 2025-12-03
-        return False
-    if re.search(r'\d{1,2}:\d{2}\s*(AM|PM|am|pm|UTC)', name):  # 12:04 AM, 12:04 PM (UTC)
-        return False
-    if re.search(r'(Mon|Tue|Wed|Thu|Fri|Sat|Sun),?\s+\w+\s+\d', name, re.IGNORECASE):  # Thu, Dec 4
-        return False
-    if re.search(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d', name, re.IGNORECASE):
-        return False
-    if re.search(r'\d{1,2}(st|nd|rd|th)\s+\d{4}', name):  # 4th 2025
-        return False
-    
-    # Filter out tournament names (contain "tournament", "night", "ball", etc.)
-    tournament_keywords = ['tournament', 'night', '8-ball', '9-ball', '10-ball', 
-                          'eight ball', 'nine ball', 'ten ball', 'billiards',
-                          'championship', 'league', 'weekly', 'monday', 'tuesday',
-                          'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-    for keyword in tournament_keywords:
-        if keyword in name_lower:
-            return False
-    
-    # Must contain at least one letter
-    if not re.search(r'[a-zA-Z]', name):
-        return False
-    
-    # Shouldn't be all numbers/symbols
-    if re.match(r'^[\d\$\.,%\-\+\#\@\!\?\(\)]+$', name):
-        return False
-    
-    # Should look like a name (at least one capital letter or proper format)
-    # Names typically have format like "John Smith" or "J. Smith"
-    if not re.search(r'[A-Z]', name):
-        return False
-    
-    # Filter out very long strings (names are usually < 30 chars)
-    if len(name) > 35:
-        return False
-    
-    # Filter out strings with too many numbers (player names rarely have numbers)
-    digit_count = sum(c.isdigit() for c in name)
-    if digit_count > 2:
-        return False
-    
-    return True
-
-
 def extract_winners_from_card_text(card_text):
     """Extract top 3 winners directly from the tournament card text"""
     top_3 = []
     found_split = False
     
-    log(f"  Extracting winners from card text...")
+    log("  Extracting winners from card text...")
     
     # Look for patterns like "Name - 1st" or "Name - 1st (split)"
     # Pattern handles names like "Tom Carlisle", "Matt Fitch Jr", "Craig Frye Jr"
@@ -319,7 +301,10 @@ def extract_winners_from_card_text(card_text):
     first_place_pattern = name_pattern + r'\s*-\s*1st(\s*\(split\))?'
     first_matches = re.findall(first_place_pattern, card_text)
     
-    log(f"    1st place matches: {first_matches}")
+    debug("    1st place matches: %s", first_matches)
+    
+    # (place, name, split) candidates - validated together below
+    candidates = []
     
     for match in first_matches:
         name = match[0].strip()
@@ -338,9 +323,7 @@ def extract_winners_from_card_text(card_text):
         if '\n' in name:
             name = name.split('\n')[-1].strip()
         
-        if name and is_valid_player_name(name):
-            top_3.append({"place": 1, "name": name, "split": is_split})
-            log(f"    ✓ 1st place: {name} (split={is_split})")
+        candidates.append((1, name, is_split))
     
     # Find 2nd place (only if no split for 1st)
     if not found_split:
@@ -352,9 +335,7 @@ def extract_winners_from_card_text(card_text):
             if 'Complete' in name:
                 parts = name.split('Complete')
                 name = parts[-1].strip()
-            if name and is_valid_player_name(name):
-                top_3.append({"place": 2, "name": name})
-                log(f"    ✓ 2nd place: {name}")
+            candidates.append((2, name, False))
     
     # Find 3rd place
     third_pattern = name_pattern + r'\s*-\s*3rd'
@@ -365,9 +346,18 @@ def extract_winners_from_card_text(card_text):
         if 'Complete' in name:
             parts = name.split('Complete')
             name = parts[-1].strip()
-        if name and is_valid_player_name(name):
-            top_3.append({"place": 3, "name": name})
-            log(f"    ✓ 3rd place: {name}")
+        candidates.append((3, name, False))
+    
+    valid = validate_player_names([name for _, name, _ in candidates])
+    for (place, name, is_split), ok in zip(candidates, valid):
+        if not (name and ok):
+            continue
+        if place == 1:
+            top_3.append({"place": 1, "name": name, "split": is_split})
+            log("    ✓ 1st place: %s (split=%s)", name, is_split)
+        else:
+            top_3.append({"place": place, "name": name})
+            log("    ✓ %s place: %s", "2nd" if place == 2 else "3rd", name)
     
     # Sort by place
     top_3.sort(key=lambda x: (x['place'], x.get('name', '')))
@@ -375,30 +365,147 @@ def extract_winners_from_card_text(card_text):
     return top_3
 
 
+def standings_to_top_3(rows):
+    """Standings rows ({'place': '1st', 'name': ...}) -> top_3 entries, split ties included"""
+    placed = []
+    for row in rows:
+        match = re.search(r'\d+', row.get('place', ''))
+        if match and int(match.group()) <= 3:
+            placed.append((int(match.group()), row['name'].strip()))
+    
+    valid = validate_player_names([name for _, name in placed])
+    placed = [entry for entry, ok in zip(placed, valid) if ok]
+    
+    # Two players sharing 1st (or marked split) is a split final - no 2nd place
+    firsts = [name for place, name in placed if place == 1]
+    split = len(firsts) > 1 or any('split' in row.get('place', '').lower() for row in rows)
+    
+    top_3 = []
+    for place, name in placed:
+        if place == 1:
+            top_3.append({"place": 1, "name": name, "split": split})
+        elif not (split and place == 2):
+            top_3.append({"place": place, "name": name})
+    
+    top_3.sort(key=lambda x: (x['place'], x.get('name', '')))
+    return top_3
+
+
 def get_top_3_from_tournament(driver, tournament_url):
-    """Extract top 3 finishers from a tournament page - FALLBACK only"""
-    # This is now just a fallback if card text extraction fails
-    log(f"  Fallback: fetching standings from: {tournament_url}")
+    """Read the top 3 finishers from the standings page - FALLBACK only
+
+    One page load; the extraction script is polled as the readiness check, so
+    it returns as soon as the standings table renders.
+    """
+    standings_url = tournament_url.rstrip('/') + '/standings'
+    log("  Fallback: reading standings from: %s", standings_url)
     
     try:
-        driver.get(tournament_url)
-        human_delay(3, 4)
-        
-        # Just return empty - card text extraction should have worked
-        log("  Fallback extraction not implemented - using card text instead")
+        throttle()
+        driver.get(standings_url)
+        rows = WebDriverWait(driver, STANDINGS_TIMEOUT, poll_frequency=0.25).until(
+            lambda d: d.execute_script(STANDINGS_EXTRACT_JS)
+        )
+    except TimeoutException:
+        log("  ⚠ No standings table on %s", standings_url)
         return []
-        
     except Exception as e:
-        log(f"Error in fallback extraction: {e}")
+        log("Error in fallback extraction: %s", e)
         return []
+    
+    top_3 = standings_to_top_3(rows)
+    log("  ✓ Standings: %s", [(p['place'], p['name']) for p in top_3])
+    return top_3
+
+
+def card_before_watermark(tournament_date, watermark):
+    """True for a card dated before the newest archived tournament"""
+    return bool(watermark and tournament_date and tournament_date < watermark['date'])
+
+
+def scroll_to_watermark(driver, watermark, max_steps=MAX_SCROLL_STEPS):
+    """Scroll one viewport at a time until the loaded cards reach the watermark
+
+    Returns True once the watermark or the end of the results is loaded, False
+    if it gave up first (max_steps reached, or the cards couldn't be read).
+    max_steps None scrolls until one of those happens.
+    """
+    seen = 0
+    older_streak = 0
+    stalled = 0
+    step = 0
+    
+    while max_steps is None or step < max_steps:
+        step += 1
+        try:
+            texts = driver.execute_script(CARD_TEXTS_JS, seen) or []
+        except Exception as e:
+            log("Could not read cards while scrolling (%s) - scrolling the full page", e)
+            simulate_human_scrolling(driver)
+            return False
+        
+        seen += len(texts)
+        for text in texts:
+            tournament_date = extract_date_from_text(text)
+            if card_before_watermark(tournament_date, watermark):
+                older_streak += 1
+            elif tournament_date:
+                older_streak = 0
+        
+        if older_streak >= WATERMARK_STOP_AFTER:
+            log("Reached watermark %s after %s scroll step(s) - %s cards loaded", watermark['date'], step, seen)
+            return True
+        
+        stalled = 0 if texts else stalled + 1
+        if stalled >= 2:
+            log("End of results after %s scroll step(s) - %s cards loaded", step, seen)
+            return True
+        
+        throttle()
+        driver.execute_script("window.scrollBy(0, window.innerHeight);")
+        human_delay(0.8, 1.5)
+    
+    log("Stopped scrolling after %s steps - %s cards loaded, watermark %s not reached",
+        max_steps, seen, watermark['date'])
+    return False
+
+
+def open_search_page(driver):
+    """Load the DigitalPool tournaments page - False on timeout"""
+    throttle()
+    driver.get("https://www.digitalpool.com/tournaments")
+    
+    log("Waiting for page to load...")
+    try:
+        WebDriverWait(driver, 20).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "input"))
+        )
+        log("✓ Page loaded")
+    except TimeoutException:
+        log("✗ Page load timeout")
+        return False
+    
+    human_delay(2, 4)
+    return True
 
 
-def search_tournaments(driver):
-    """Search for Bankshot Billiards tournaments"""
+def search_tournaments(driver, watermark=None, until=None, max_scroll_steps=MAX_SCROLL_STEPS,
+                       complete_only=False):
+    """Search for Bankshot Billiards tournaments
+
+    With a watermark ({'date', 'url'} of the newest archived tournament) only
+    cards newer than it are loaded and parsed. Cards dated after `until`
+    (YYYY/MM/DD) are skipped without parsing.
+
+    complete_only returns None instead of a partial list when the search fails
+    or scrolling stops before the watermark - for callers that checkpoint the
+    result as final (backfill).
+    """
     tournaments = []
+    failed = None if complete_only else []
     
     try:
-        log(f"Searching for: {VENUE_NAME}")
+        log("Searching for: %s", VENUE_NAME)
         
         search_input = None
         selectors = [
@@ -423,7 +530,7 @@ def search_tournaments(driver):
         
         if not search_input:
             log("✗ Could not find search input")
-            return []
+            return failed
         
         search_input.click()
         human_delay(0.3, 0.7)
@@ -440,10 +547,15 @@ def search_tournaments(driver):
         log("Waiting for search results...")
         human_delay(4, 6)
         
-        # Scroll multiple times to load all results
-        for scroll_round in range(3):
-            simulate_human_scrolling(driver)
-            human_delay(1, 2)
+        if watermark:
+            log("Watermark: %s %s", watermark['date'], watermark['url'])
+            if not scroll_to_watermark(driver, watermark, max_scroll_steps) and complete_only:
+                return None
+        else:
+            # Empty archive - scroll multiple times to load all results
+            for scroll_round in range(3):
+                simulate_human_scrolling(driver)
+                human_delay(1, 2)
         
         # Find tournament cards using multiple methods
         card_selectors = [
@@ -458,7 +570,7 @@ def search_tournaments(driver):
             try:
                 cards = driver.find_elements(By.CSS_SELECTOR, selector)
                 if cards:
-                    log(f"Found {len(cards)} elements with selector: {selector}")
+                    log("Found %s elements with selector: %s", len(cards), selector)
                     tournament_cards = cards
                     break
             except Exception:
@@ -472,40 +584,35 @@ def search_tournaments(driver):
                                   re.search(r'\d{4}-\d{2}-\d{2}', div.text)
                               )]
         
-        log(f"Processing {len(tournament_cards)} potential tournament cards")
+        log("Processing %s potential tournament cards", len(tournament_cards))
         
-        # DEBUG: Print all card text snippets to see what we're finding
-        for idx, card in enumerate(tournament_cards[:15]):  # Check first 15 cards
-            try:
-                card_text = card.text
-                
-                # Log every card that mentions our venue
-                if VENUE_NAME in card_text:
-                    log(f"\n{'='*50}")
-                    log(f"DEBUG Card {idx} contains '{VENUE_NAME}'")
-                    log(f"Card text (first 400 chars):")
-                    log(card_text[:400])
-                    log(f"{'='*50}")
-                    
-                    # Check completion status
-                    has_100_pct = '100%' in card_text
-                    has_completed = 'Completed' in card_text or 'Complete' in card_text
-                    log(f"  Has '100%': {has_100_pct}")
-                    log(f"  Has 'Completed': {has_completed}")
+        # DEBUG: Print card text snippets to see what we're finding
+        # (reading card.text is a WebDriver round trip, so only when enabled)
+        if logger.isEnabledFor(logging.DEBUG):
+            for idx, card in enumerate(tournament_cards[:15]):  # Check first 15 cards
+                try:
+                    card_text = card.text
                     
-                    # Extract date for debugging
-                    debug_date = extract_date_from_text(card_text)
-                    log(f"  Extracted date: {debug_date}")
-            except Exception as e:
-                log(f"Error reading card {idx}: {e}")
+                    # Log every card that mentions our venue
+                    if VENUE_NAME in card_text:
+                        debug("Card %s contains '%s'", idx, VENUE_NAME)
+                        debug("Card text (first 400 chars):\n%.400s", card_text)
+                        
+                        # Check completion status
+                        debug("  Has '100%%': %s", '100%' in card_text)
+                        debug("  Has 'Completed': %s", 'Completed' in card_text or 'Complete' in card_text)
+                        debug("  Extracted date: %s", extract_date_from_text(card_text))
+                except Exception as e:
+                    debug("Error reading card %s: %s", idx, e)
         
-        log(f"\n{'='*50}")
+        log("\n" + "=" * 50)
         log("Now processing cards for completed tournaments...")
-        log(f"{'='*50}\n")
+        log("=" * 50 + "\n")
         
         # Get today's date for comparison
         from datetime import datetime, timedelta
         today = datetime.now().date()
+        older_streak = 0
         
         for idx, card in enumerate(tournament_cards):
             try:
@@ -514,26 +621,38 @@ def search_tournaments(driver):
                 if VENUE_NAME not in card_text or VENUE_CITY not in card_text:
                     continue
                 
+                # Cards dated before the watermark are already archived
+                if card_before_watermark(extract_date_from_text(card_text), watermark):
+                    older_streak += 1
+                    if older_streak >= WATERMARK_STOP_AFTER:
+                        log("Reached watermark at card %s - stopping", idx)
+                        break
+                    continue
+                older_streak = 0
+                
+                if until and (extract_date_from_text(card_text) or '') > until:
+                    continue
+                
                 # Check if COMPLETED - must be 100% complete or explicitly marked completed
                 is_completed = False
                 
                 # Look for explicit "100%" or "Completed"
                 if '100%' in card_text:
                     is_completed = True
-                    log(f"  Card {idx}: Found '100%' - marking as completed")
+                    debug("  Card %s: Found '100%%' - marking as completed", idx)
                 elif 'Completed' in card_text or 'Complete' in card_text:
                     is_completed = True
-                    log(f"  Card {idx}: Found 'Completed' - marking as completed")
+                    debug("  Card %s: Found 'Completed' - marking as completed", idx)
                 
                 # DON'T mark as completed just because percentage is high - must be 100%
                 
                 if not is_completed:
-                    log(f"Skipping card {idx} - not 100% completed")
+                    debug("Skipping card %s - not 100%% completed", idx)
                     continue
                 
-                log(f"\n{'='*40}")
-                log(f"Found completed tournament in card {idx}")
-                log(f"Card text preview: {card_text[:200]}...")
+                log("\n" + "=" * 40)
+                log("Found completed tournament in card %s", idx)
+                debug_sampled(logger, 'card-preview', "Card text preview: %.200s...", card_text)
                 
                 tournament_name = None
                 for tag in ['h1', 'h2', 'h3', 'h4', 'h5']:
@@ -565,21 +684,21 @@ def search_tournaments(driver):
                 try:
                     link_element = card.find_element(By.CSS_SELECTOR, "a[href*='/tournaments/']")
                     tournament_url = link_element.get_attribute('href')
-                    log(f"  ✓ Found URL in card: {tournament_url}")
+                    log("  ✓ Found URL in card: %s", tournament_url)
                 except Exception as e:
-                    log(f"  Could not find tournament link with CSS selector: {e}")
+                    log("  Could not find tournament link with CSS selector: %s", e)
                     try:
                         # Try finding any link in the card
                         links = card.find_elements(By.TAG_NAME, "a")
-                        log(f"  Found {len(links)} links in card")
+                        log("  Found %s links in card", len(links))
                         for link in links:
                             href = link.get_attribute('href')
                             if href and '/tournaments/' in href:
                                 tournament_url = href
-                                log(f"  ✓ Found URL via link scan: {tournament_url}")
+                                log("  ✓ Found URL via link scan: %s", tournament_url)
                                 break
                     except Exception as e2:
-                        log(f"  Link scan failed: {e2}")
+                        log("  Link scan failed: %s", e2)
                 
                 if not tournament_url and tournament_date and tournament_name:
                     # Remove date prefix from name - handle both 2-digit and 1-digit month/day
@@ -592,14 +711,18 @@ def search_tournaments(driver):
                     name_slug = re.sub(r'[^a-z0-9-]', '', name_for_slug.lower().replace(' ', '-'))
                     name_slug = re.sub(r'-+', '-', name_slug).strip('-')
                     tournament_url = f"https://digitalpool.com/tournaments/{date_for_url}-{name_slug}/"
-                    log(f"  Constructed URL: {tournament_url}")
+                    log("  Constructed URL: %s", tournament_url)
+                
+                # The watermark card itself counts towards the stop streak
+                if watermark and tournament_url == watermark['url']:
+                    older_streak += 1
                 
                 # Extract winners directly from card text!
                 top_3 = extract_winners_from_card_text(card_text)
                 if top_3:
-                    log(f"  ✓ Extracted {len(top_3)} winners from card: {[p['name'] for p in top_3]}")
+                    log("  ✓ Extracted %s winners from card: %s", len(top_3), [p['name'] for p in top_3])
                 else:
-                    log(f"  ⚠ No winners found in card text")
+                    log("  ⚠ No winners found in card text")
                 
                 tournaments.append({
                     'name': tournament_name,
@@ -609,18 +732,18 @@ def search_tournaments(driver):
                     'top_3': top_3  # Store extracted winners
                 })
                 
-                log(f"  Name: {tournament_name}")
-                log(f"  Date: {tournament_date}")
-                log(f"  URL: {tournament_url}")
+                log("  Name: %s", tournament_name)
+                log("  Date: %s", tournament_date)
+                log("  URL: %s", tournament_url)
                 
             except Exception as e:
-                log(f"Error parsing card {idx}: {e}")
+                log("Error parsing card %s: %s", idx, e)
                 continue
         
-        log(f"\n{'='*40}")
-        log(f"Total tournaments found: {len(tournaments)}")
+        log("\n" + "=" * 40)
+        log("Total tournaments found: %s", len(tournaments))
         for t in tournaments:
-            log(f"  - {t['date']}: {t['name']}")
+            log("  - %s: %s", t['date'], t['name'])
         
         # Filter out future tournaments - only keep past/today completed ones
         from datetime import datetime
@@ -629,42 +752,65 @@ def search_tournaments(driver):
         # Use Eastern Time for date comparison
         eastern = ZoneInfo('America/New_York')
         today = datetime.now(eastern).date()
-        log(f"Today's date (Eastern): {today}")
+        log("Today's date (Eastern): %s", today)
         
         past_tournaments = []
         for t in tournaments:
             if t['date']:
                 try:
                     t_date = datetime.strptime(t['date'], "%Y/%m/%d").date()
-                    log(f"  Comparing tournament date {t_date} vs today {today}")
+                    log("  Comparing tournament date %s vs today %s", t_date, today)
                     if t_date <= today:
                         past_tournaments.append(t)
-                        log(f"  ✓ Including (past/today): {t['date']} - {t['name']}")
+                        log("  ✓ Including (past/today): %s - %s", t['date'], t['name'])
                     else:
-                        log(f"  ✗ Excluding (future): {t['date']} - {t['name']}")
+                        log("  ✗ Excluding (future): %s - %s", t['date'], t['name'])
                 except Exception as e:
-                    log(f"  ⚠ Date parse error for {t['date']}: {e} - including anyway")
+                    log("  ⚠ Date parse error for %s: %s - including anyway", t['date'], e)
                     past_tournaments.append(t)
             else:
-                log(f"  ⚠ No date for {t['name']} - including anyway")
+                log("  ⚠ No date for %s - including anyway", t['name'])
                 past_tournaments.append(t)
         
-        log(f"\nFiltered to {len(past_tournaments)} past/current tournaments")
+        log("\nFiltered to %s past/current tournaments", len(past_tournaments))
         
         return past_tournaments
         
     except Exception as e:
-        log(f"Error searching tournaments: {e}")
+        log("Error searching tournaments: %s", e)
         import traceback
         traceback.print_exc()
-        return []
+        return failed
+
+
+def tag_player_ids(tournament, players):
+    """Attach a stable player_id to each winner"""
+    for player in tournament.get('top_3', []):
+        player['player_id'] = players.resolve(player['name'], create=True)
 
 
-def main():
-    """Main execution"""
+def archive_results(results, archive):
+    """Fill results with the most recent date's tournaments from the archive"""
+    most_recent_date = archive.latest_date()
+    results["most_recent_date"] = most_recent_date
+    results["tournaments"] = [
+        {
+            "name": t['name'],
+            "date": t['date'],
+            "url": t['url'],
+            "top_3": t.get('top_3', [])
+        }
+        for t in archive.tournaments_on(most_recent_date)
+    ] if most_recent_date else []
+    return results
+
+
+def main(archive):
+    """Main execution - merge newly completed tournaments into the archive"""
     log("=" * 60)
     log("BANKSHOT BILLIARDS WINNER SCRAPER")
     log("=" * 60)
+    log("Archive: %s (%s tournaments)", archive.path, len(archive))
     
     driver = None
     results = {
@@ -676,29 +822,19 @@ def main():
     
     try:
         driver = setup_driver(headless=True)
-        driver.get("https://www.digitalpool.com/tournaments")
         
-        log("Waiting for page to load...")
-        try:
-            WebDriverWait(driver, 20).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "input"))
-            )
-            log("✓ Page loaded")
-        except TimeoutException:
-            log("✗ Page load timeout")
+        if not open_search_page(driver):
             results["error"] = "Page load timeout"
-            return results
+            return archive_results(results, archive)
         
-        human_delay(2, 4)
-        
-        tournaments = search_tournaments(driver)
+        tournaments = search_tournaments(driver, archive.watermark())
         
         if not tournaments:
             log("No completed tournaments found")
             results["error"] = "No completed tournaments found"
-            return results
+            return archive_results(results, archive)
         
-        log(f"\nFound {len(tournaments)} completed tournament(s)")
+        log("\nFound %s completed tournament(s)", len(tournaments))
         
         tournaments_with_dates = [t for t in tournaments if t['date']]
         tournaments_with_dates.sort(key=lambda x: x['date'], reverse=True)
@@ -706,44 +842,52 @@ def main():
         if not tournaments_with_dates:
             log("No tournaments with valid dates")
             results["error"] = "No tournaments with valid dates"
-            return results
-        
-        most_recent_date = tournaments_with_dates[0]['date']
-        results["most_recent_date"] = most_recent_date
-        
-        most_recent_tournaments = [t for t in tournaments_with_dates if t['date'] == most_recent_date]
-        
-        log(f"\nMost recent date: {most_recent_date}")
-        log(f"Tournaments on that date: {len(most_recent_tournaments)}")
+            return archive_results(results, archive)
         
-        for tournament in most_recent_tournaments:
+        # Only tournaments the archive doesn't already have are processed
+        players = PlayerIndex()
+        leaderboard = Leaderboard(players=players)
+        new_count = 0
+        for tournament in tournaments_with_dates:
+            tag_player_ids(tournament, players)
+            if tournament in archive:
+                # Already archived - only worth re-adding if winners turned up this time
+                if archive.add(tournament):
+                    leaderboard.apply(archive.get(tournament))
+                    log("✓ Filled in winners for %s - %s", tournament['date'], tournament['name'])
+                continue
+            
             # Use pre-extracted winners from card text (already stored in tournament['top_3'])
             top_3 = tournament.get('top_3', [])
             
             if top_3:
-                log(f"✓ Using {len(top_3)} winners from card: {[p['name'] for p in top_3]}")
+                log("✓ Using %s winners from card: %s", len(top_3), [p['name'] for p in top_3])
             else:
-                log(f"⚠ No winners extracted for {tournament['name']}")
+                log("⚠ No winners extracted for %s", tournament['name'])
                 # Fallback to page extraction only if card text failed
                 if tournament['url']:
                     top_3 = get_top_3_from_tournament(driver, tournament['url'])
                     tournament['top_3'] = top_3
+                    tag_player_ids(tournament, players)
             
-            results["tournaments"].append({
-                "name": tournament['name'],
-                "date": tournament['date'],
-                "url": tournament['url'],
-                "top_3": tournament.get('top_3', [])
-            })
+            archive.add(tournament)
+            leaderboard.apply(archive.get(tournament))
+            new_count += 1
+            log("✓ Archived %s - %s", tournament['date'], tournament['name'])
+        
+        log("\nArchived %s new tournament(s) - archive now holds %s", new_count, len(archive))
+        players.save()
+        leaderboard.save()
+        leaderboard.write_compact(os.path.join(OUTPUT_DIR, "leaderboard.json"))
         
-        return results
+        return archive_results(results, archive)
         
     except Exception as e:
-        log(f"Error: {e}")
+        log("Error: %s", e)
         import traceback
         traceback.print_exc()
         results["error"] = str(e)
-        return results
+        return archive_results(results, archive)
     finally:
         if driver:
             try:
@@ -752,108 +896,71 @@ def main():
                 pass
 
 
-def generate_html_display(results, output_path):
-    """Generate HTML display page"""
-    tournaments = results.get("tournaments", [])
-    most_recent_date = results.get("most_recent_date", "")
+def scrape_tournament(archive, url, name=None, date=None):
+    """Archive one just-completed tournament from its standings page
+
+    Run when the live monitor reports the displayed tournament finished.
+    Without a name/date, or if the standings aren't up yet, falls back to the
+    incremental card search.
+    """
+    log("=" * 60)
+    log("BANKSHOT BILLIARDS WINNER SCRAPER - %s", url)
+    log("=" * 60)
     
-    if most_recent_date:
-        try:
-            dt = datetime.datetime.strptime(most_recent_date, "%Y/%m/%d")
-            formatted_date = dt.strftime("%B %d, %Y")
-        except:
-            formatted_date = most_recent_date
-    else:
-        formatted_date = "Recent"
+    results = {
+        "scrape_date": datetime.datetime.now().isoformat(),
+        "search_term": VENUE_NAME,
+        "most_recent_date": None,
+        "tournaments": []
+    }
     
-    num_tournaments = len(tournaments) if tournaments else 1
-    column_width = 100 / num_tournaments if num_tournaments > 0 else 100
+    tournament = {'url': url, 'name': name, 'date': date}
+    existing = archive.get(tournament)
+    if existing and existing.get('top_3'):
+        log("Already archived with winners: %s - %s", existing['date'], existing['name'])
+        return archive_results(results, archive)
     
-    tournament_columns = ""
+    if existing:
+        tournament['name'] = tournament['name'] or existing.get('name')
+        tournament['date'] = tournament['date'] or existing.get('date')
+    if not tournament['name'] or not tournament['date']:
+        log("No name/date for %s - running the card search instead", url)
+        return main(archive)
     
-    if not tournaments:
-        tournament_columns = """
-        <div class="tournament-column" style="width: 100%;">
-            <div class="tournament-name">No Recent Tournaments Found</div>
-            <div class="winner-card">
-                <div class="winner-name">Check back soon!</div>
-            </div>
-        </div>
-        """
-    else:
-        for tournament in tournaments:
-            name = tournament.get("name", "Tournament")
-            # Clean up tournament name - remove date prefix if present
-            name = re.sub(r'^\d{4}[/-]\d{1,2}[/-]\d{1,2}\s*', '', name)
-            
-            top_3 = tournament.get("top_3", [])
-            
-            winners_html = ""
-            
-            # Check if there's a split (multiple 1st place winners)
-            has_split = any(p.get('split') for p in top_3)
-            
-            if has_split:
-                # For splits: show both 1st place winners, then 3rd
-                first_place_winners = [p for p in top_3 if p.get('place') == 1]
-                third_place = next((p for p in top_3 if p.get('place') == 3), None)
-                
-                # First 1st place winner
-                if len(first_place_winners) >= 1:
-                    winners_html += f"""
-                    <div class="winner-card first">
-                        <div class="place-badge">1st Place (Split)</div>
-                        <div class="winner-name">{first_place_winners[0].get('name', 'TBD')}</div>
-                    </div>
-                    """
-                
-                # Second 1st place winner
-                if len(first_place_winners) >= 2:
-                    winners_html += f"""
-                    <div class="winner-card first">
-                        <div class="place-badge">1st Place (Split)</div>
-                        <div class="winner-name">{first_place_winners[1].get('name', 'TBD')}</div>
-                    </div>
-                    """
-                
-                # 3rd place
-                if third_place:
-                    winners_html += f"""
-                    <div class="winner-card third">
-                        <div class="place-badge">3rd Place</div>
-                        <div class="winner-name">{third_place.get('name', 'TBD')}</div>
-                    </div>
-                    """
-            else:
-                # Normal case: 1st, 2nd, 3rd
-                place_labels = ["1st Place", "2nd Place", "3rd Place"]
-                place_classes = ["first", "second", "third"]
-                
-                for i in range(3):
-                    place_label = place_labels[i]
-                    place_class = place_classes[i]
-                    
-                    # Find player with this place
-                    player = next((p for p in top_3 if p.get('place') == i + 1), None)
-                    player_name = player.get('name', 'TBD') if player else 'TBD'
-                    
-                    winners_html += f"""
-                    <div class="winner-card {place_class}">
-                        <div class="place-badge">{place_label}</div>
-                        <div class="winner-name">{player_name}</div>
-                    </div>
-                    """
-            
-            tournament_columns += f"""
-            <div class="tournament-column" style="width: {column_width}%;">
-                <div class="tournament-name">{name}</div>
-                <div class="winners-container">
-                    {winners_html}
-                </div>
-            </div>
-            """
+    driver = None
+    try:
+        driver = setup_driver(headless=True)
+        tournament['top_3'] = get_top_3_from_tournament(driver, url)
+    except Exception as e:
+        log("Error: %s", e)
+        tournament['top_3'] = []
+    finally:
+        if driver:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+    
+    if not tournament['top_3']:
+        log("⚠ No standings for %s yet - running the card search instead", url)
+        return main(archive)
     
-    html_content = f'''<!DOCTYPE html>
+    players = PlayerIndex()
+    leaderboard = Leaderboard(players=players)
+    tag_player_ids(tournament, players)
+    if archive.add(tournament):
+        leaderboard.apply(archive.get(tournament))
+        log("✓ Archived %s - %s", tournament['date'], tournament['name'])
+    players.save()
+    leaderboard.save()
+    leaderboard.write_compact(os.path.join(OUTPUT_DIR, "leaderboard.json"))
+    
+    return archive_results(results, archive)
+
+
+# Winners page - compiled once, filled from the results model
+WINNERS_PAGE_TEMPLATE = Template('''<!DOCTYPE html>
+<!-- results-hash: $results_hash -->
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -861,9 +968,9 @@ def generate_html_display(results, output_path):
     <title>Bankshot Billiards - Tournament Winners</title>
     <link href="https://fonts.googleapis.com/css2?family=Bebas+Neue&family=Oswald:wght@400;500;600;700&family=Roboto:wght@400;500;700&display=swap" rel="stylesheet">
     <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        html, body {{ width: 100%; height: 100%; overflow: hidden; }}
-        body {{
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        html, body { width: 100%; height: 100%; overflow: hidden; }
+        body {
             font-family: 'Roboto', sans-serif;
             background: linear-gradient(180deg, #1a472a 0%, #0d3320 100%);
             color: white;
@@ -873,9 +980,9 @@ def generate_html_display(results, output_path):
             max-height: 100vh;
             max-width: 177.78vh;
             margin: 0 auto;
-        }}
-        .header {{ text-align: center; padding: 2vh 2vw; flex-shrink: 0; }}
-        .congratulations {{
+        }
+        .header { text-align: center; padding: 2vh 2vw; flex-shrink: 0; }
+        .congratulations {
             font-family: 'Bebas Neue', sans-serif;
             font-size: clamp(1.5rem, 4vw, 3.5rem);
             letter-spacing: 3px;
@@ -886,33 +993,33 @@ def generate_html_display(results, output_path):
             align-items: center;
             justify-content: center;
             gap: 0.5em;
-        }}
-        .trophy-icon {{
+        }
+        .trophy-icon {
             width: 1.2em;
             height: 1.2em;
             color: #ffd700;
             filter: drop-shadow(2px 2px 2px rgba(0,0,0,0.3));
-        }}
-        .date-line {{
+        }
+        .date-line {
             font-family: 'Oswald', sans-serif;
             font-size: clamp(0.8rem, 1.5vw, 1.3rem);
             opacity: 0.9;
             letter-spacing: 2px;
-        }}
-        .tournaments-wrapper {{
+        }
+        .tournaments-wrapper {
             flex: 1;
             display: flex;
             padding: 1vh 2vw 2vh 2vw;
             gap: 2vw;
             min-height: 0;
-        }}
-        .tournament-column {{
+        }
+        .tournament-column {
             display: flex;
             flex-direction: column;
             align-items: center;
             flex-shrink: 0;
-        }}
-        .tournament-name {{
+        }
+        .tournament-name {
             font-family: 'Bebas Neue', sans-serif;
             font-size: clamp(1rem, 2.5vw, 2rem);
             letter-spacing: 2px;
@@ -923,8 +1030,8 @@ def generate_html_display(results, output_path):
             padding: 0 1vw;
             word-wrap: break-word;
             max-width: 100%;
-        }}
-        .winners-container {{
+        }
+        .winners-container {
             flex: 1;
             display: flex;
             flex-direction: column;
@@ -932,52 +1039,52 @@ def generate_html_display(results, output_path):
             gap: 2vh;
             width: 100%;
             padding: 0 1vw;
-        }}
-        .winner-card {{
+        }
+        .winner-card {
             background: rgba(255, 255, 255, 0.1);
             border: 2px solid rgba(255, 255, 255, 0.2);
             border-radius: 12px;
             padding: 2vh 2vw;
             text-align: center;
-        }}
-        .winner-card.first {{
+        }
+        .winner-card.first {
             background: linear-gradient(135deg, rgba(255, 215, 0, 0.3) 0%, rgba(255, 215, 0, 0.1) 100%);
             border-color: #ffd700;
             box-shadow: 0 0 20px rgba(255, 215, 0, 0.3);
-        }}
-        .winner-card.second {{
+        }
+        .winner-card.second {
             background: linear-gradient(135deg, rgba(192, 192, 192, 0.3) 0%, rgba(192, 192, 192, 0.1) 100%);
             border-color: #c0c0c0;
             box-shadow: 0 0 15px rgba(192, 192, 192, 0.2);
-        }}
-        .winner-card.third {{
+        }
+        .winner-card.third {
             background: linear-gradient(135deg, rgba(205, 127, 50, 0.3) 0%, rgba(205, 127, 50, 0.1) 100%);
             border-color: #cd7f32;
             box-shadow: 0 0 15px rgba(205, 127, 50, 0.2);
-        }}
-        .place-badge {{
+        }
+        .place-badge {
             font-family: 'Oswald', sans-serif;
             font-size: clamp(0.7rem, 1.2vw, 1rem);
             text-transform: uppercase;
             letter-spacing: 2px;
             opacity: 0.9;
             margin-bottom: 0.5vh;
-        }}
-        .winner-card.first .place-badge {{ color: #ffd700; }}
-        .winner-card.second .place-badge {{ color: #c0c0c0; }}
-        .winner-card.third .place-badge {{ color: #cd7f32; }}
-        .winner-name {{
+        }
+        .winner-card.first .place-badge { color: #ffd700; }
+        .winner-card.second .place-badge { color: #c0c0c0; }
+        .winner-card.third .place-badge { color: #cd7f32; }
+        .winner-name {
             font-family: 'Bebas Neue', sans-serif;
             font-size: clamp(1.2rem, 2.5vw, 2.2rem);
             letter-spacing: 1px;
-        }}
-        .footer {{
+        }
+        .footer {
             text-align: center;
             padding: 1vh 2vw;
             font-size: clamp(0.6rem, 1vw, 0.8rem);
             opacity: 0.6;
             flex-shrink: 0;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -987,32 +1094,157 @@ def generate_html_display(results, output_path):
             Congratulations to Our Most Recent Top Finishers!
             <svg class="trophy-icon" viewBox="0 0 24 24" fill="currentColor"><path d="M5 3h14v2h-1v1c0 2.21-1.79 4-4 4h-1v2h3v2h-3v4h3v2H8v-2h3v-4H8v-2h3v-2H10c-2.21 0-4-1.79-4-4V5H5V3zm3 2v1c0 1.1.9 2 2 2h4c1.1 0 2-.9 2-2V5H8z"/></svg>
         </div>
-        <div class="date-line">{formatted_date}</div>
+        <div class="date-line">$formatted_date</div>
     </div>
     <div class="tournaments-wrapper">
-        {tournament_columns}
+        $tournament_columns
     </div>
     <div class="footer">
-        Bankshot Billiards &bull; Updated {datetime.datetime.now().strftime("%m/%d/%Y %I:%M %p")}
+        Bankshot Billiards &bull; Updated $updated
     </div>
 </body>
 </html>
-'''
+''')
+
+WINNER_CARD_TEMPLATE = Template('''
+                    <div class="winner-card $place_class">
+                        <div class="place-badge">$place_label</div>
+                        <div class="winner-name">$player_name</div>
+                    </div>
+                    ''')
+
+TOURNAMENT_COLUMN_TEMPLATE = Template('''
+            <div class="tournament-column" style="width: $column_width%;">
+                <div class="tournament-name">$name</div>
+                <div class="winners-container">
+                    $winners_html
+                </div>
+            </div>
+            ''')
+
+NO_TOURNAMENTS_COLUMN = """
+        <div class="tournament-column" style="width: 100%;">
+            <div class="tournament-name">No Recent Tournaments Found</div>
+            <div class="winner-card">
+                <div class="winner-name">Check back soon!</div>
+            </div>
+        </div>
+        """
+
+RESULTS_HASH_RE = re.compile(r'<!-- results-hash: ([0-9a-f]+) -->')
+
+
+def results_hash(results):
+    """Hash of what the page shows - scrape time is left out"""
+    model = {
+        "most_recent_date": results.get("most_recent_date"),
+        "tournaments": results.get("tournaments", [])
+    }
+    return hashlib.sha256(json.dumps(model, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def rendered_hash(output_path):
+    """Results hash embedded in an existing page, if any"""
+    try:
+        with open(output_path, 'r') as f:
+            match = RESULTS_HASH_RE.search(f.read(256))
+        return match.group(1) if match else None
+    except OSError:
+        return None
+
+
+def write_atomic(path, data):
+    """Write bytes via a temp file + rename so readers never see a partial file"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def render_winner_cards(top_3):
+    """Winner cards for one tournament column"""
+    cards = []
     
-    with open(output_path, "w") as f:
-        f.write(html_content)
+    # Check if there's a split (multiple 1st place winners)
+    if any(p.get('split') for p in top_3):
+        # For splits: show both 1st place winners, then 3rd
+        first_place_winners = [p for p in top_3 if p.get('place') == 1][:2]
+        third_place = next((p for p in top_3 if p.get('place') == 3), None)
+        
+        for winner in first_place_winners:
+            cards.append(('first', '1st Place (Split)', winner.get('name', 'TBD')))
+        if third_place:
+            cards.append(('third', '3rd Place', third_place.get('name', 'TBD')))
+    else:
+        # Normal case: 1st, 2nd, 3rd
+        for place, (place_class, place_label) in enumerate(
+                [('first', '1st Place'), ('second', '2nd Place'), ('third', '3rd Place')], 1):
+            player = next((p for p in top_3 if p.get('place') == place), None)
+            cards.append((place_class, place_label, player.get('name', 'TBD') if player else 'TBD'))
     
-    log(f"✓ HTML display generated: {output_path}")
+    return ''.join(
+        WINNER_CARD_TEMPLATE.substitute(place_class=place_class, place_label=place_label,
+                                        player_name=html.escape(player_name))
+        for place_class, place_label, player_name in cards)
 
 
-if __name__ == "__main__":
-    results = main()
+def generate_html_display(results, output_path):
+    """Generate HTML display page (plus a .gz sidecar) - skipped if the results are unchanged
+
+    Returns True if the page was rewritten.
+    """
+    digest = results_hash(results)
+    if digest == rendered_hash(output_path) and os.path.exists(f"{output_path}.gz"):
+        log("✓ HTML display unchanged - skipping render")
+        return False
+    
+    tournaments = results.get("tournaments", [])
+    most_recent_date = results.get("most_recent_date", "")
     
-    output_dir = os.environ.get("OUTPUT_DIR", ".")
+    if most_recent_date:
+        try:
+            dt = datetime.datetime.strptime(most_recent_date, "%Y/%m/%d")
+            formatted_date = dt.strftime("%B %d, %Y")
+        except:
+            formatted_date = most_recent_date
+    else:
+        formatted_date = "Recent"
+    
+    num_tournaments = len(tournaments) if tournaments else 1
+    column_width = 100 / num_tournaments if num_tournaments > 0 else 100
     
+    if not tournaments:
+        tournament_columns = NO_TOURNAMENTS_COLUMN
+    else:
+        tournament_columns = ''.join(
+            TOURNAMENT_COLUMN_TEMPLATE.substitute(
+                column_width=column_width,
+                # Clean up tournament name - remove date prefix if present
+                name=html.escape(re.sub(r'^\d{4}[/-]\d{1,2}[/-]\d{1,2}\s*', '', tournament.get("name", "Tournament"))),
+                winners_html=render_winner_cards(tournament.get("top_3", [])))
+            for tournament in tournaments)
+    
+    html_content = WINNERS_PAGE_TEMPLATE.substitute(
+        results_hash=digest,
+        formatted_date=html.escape(formatted_date),
+        tournament_columns=tournament_columns,
+        updated=datetime.datetime.now().strftime("%m/%d/%Y %I:%M %p"))
+    
+    data = html_content.encode('utf-8')
+    compressed = gzip.compress(data, compresslevel=9, mtime=0)
+    # Precompressed copy for Apache to serve to the cast receiver
+    write_atomic(f"{output_path}.gz", compressed)
+    write_atomic(output_path, data)
+    
+    log("✓ HTML display generated: %s (%d bytes, %d gzipped)", output_path, len(data), len(compressed))
+    return True
+
+
+def write_results(results, output_dir=OUTPUT_DIR):
+    """results.json, results.txt and the winners page - derived from the archive's most recent date"""
     with open(f"{output_dir}/results.json", "w") as f:
         json.dump(results, f, indent=2)
-    log(f"✓ Saved results.json")
+    log("✓ Saved results.json")
     
     print("\n" + "=" * 60)
     print("BANKSHOT BILLIARDS TOURNAMENT RESULTS")
@@ -1050,3 +1282,21 @@ if __name__ == "__main__":
     generate_html_display(results, f"{output_dir}/winners_display.html")
     
     log("\n✓ Scraper completed")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == 'backfill':
+        # python3 winnerscraper.py backfill START END [--workers N] [--chunk-days D]
+        from winners_backfill import backfill_main
+        setup_logging()
+        sys.exit(backfill_main(sys.argv[2:]))
+    
+    setup_logging()
+    if len(sys.argv) > 2 and sys.argv[1] == 'scrape-url':
+        # python3 winnerscraper.py scrape-url URL [NAME DATE] - one just-completed tournament
+        name, date = (sys.argv[3:5] + [None, None])[:2]
+        results = scrape_tournament(WinnersArchive(ARCHIVE_FILE), sys.argv[2], name or None, date or None)
+    else:
+        results = main(WinnersArchive(ARCHIVE_FILE))
+    
+    write_results(results)
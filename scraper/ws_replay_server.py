@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+DigitalPool Websocket Replay Server
+Local stand-in for the DigitalPool live channel. Accepts the graphql-transport-ws
+handshake and replays a recorded JSON Lines file to each client.
+
+Each recording line is {"delay": seconds, "message": {...}} - the format written
+by live_subscriber.py when DIGITALPOOL_WS_RECORD is set.
+
+Usage:
+    python3 ws_replay_server.py recordings/live_sample.jsonl [--port 8765] [--drop-after N]
+    DIGITALPOOL_WS_URL=ws://localhost:8765 python3 bankshot_monitor_multi.py --subscribe
+
+--drop-after N closes the connection after N messages so reconnects can be exercised;
+the next connection resumes the replay where the previous one stopped.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+
+import websockets
+
+
+def load_recording(path):
+    with open(path, 'r') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+async def replay(ws, recording, state, drop_after, speed):
+    # Handshake
+    init = json.loads(await ws.recv())
+    if init.get('type') != 'connection_init':
+        await ws.close(4400, 'Expected connection_init')
+        return
+    await ws.send(json.dumps({'type': 'connection_ack'}))
+
+    # Wait for the client's subscriptions (status, and matches if it asks for them)
+    subscribed = set()
+    try:
+        while True:
+            message = json.loads(await asyncio.wait_for(ws.recv(), 1))
+            if message.get('type') in ('subscribe', 'start'):
+                subscribed.add(message.get('id'))
+    except asyncio.TimeoutError:
+        pass
+    logging.info("Client subscribed to %s", sorted(subscribed))
+
+    sent = 0
+    while state['position'] < len(recording):
+        entry = recording[state['position']]
+        await asyncio.sleep(entry.get('delay', 0) / speed)
+
+        message = entry['message']
+        if message.get('id') in subscribed or message.get('type') not in ('next', 'data'):
+            await ws.send(json.dumps(message))
+            sent += 1
+        state['position'] += 1
+
+        if drop_after and sent >= drop_after:
+            logging.info("Dropping connection after %d messages", sent)
+            await ws.close()
+            return
+
+    logging.info("Recording finished (%d messages) - holding connection open", len(recording))
+    await ws.wait_closed()
+
+
+async def serve(args):
+    recording = load_recording(args.recording)
+    state = {'position': 0}
+    logging.info("Loaded %d recorded messages from %s", len(recording), args.recording)
+
+    async def handler(ws):
+        try:
+            await replay(ws, recording, state, args.drop_after, args.speed)
+        except websockets.ConnectionClosed:
+            pass
+
+    async with websockets.serve(handler, args.host, args.port,
+                                subprotocols=['graphql-transport-ws', 'graphql-ws']):
+        logging.info("Replaying on ws://%s:%d", args.host, args.port)
+        await asyncio.Future()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay recorded DigitalPool live messages')
+    parser.add_argument('recording', help='JSON Lines recording')
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--drop-after', type=int, default=0,
+                        help='Close each connection after this many messages')
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help='Replay speed multiplier')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
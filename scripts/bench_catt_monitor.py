@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+catt_monitor Benchmark
+Runs the real monitor_and_cast loop against a simulated Chromecast on a fake
+clock, feeding it scripted file changes, so hours of venue time take seconds
+and casting-logic changes can be compared before they reach the TV.
+
+The loop's file watcher, clock (time / datetime), catt subprocess calls and
+cast controller are replaced; everything else - display rules, schedule,
+debouncer, watchdog, state file - is the production code.
+
+    python3 bench_catt_monitor.py                        # 8 h, catt CLI, no push
+    python3 bench_catt_monitor.py --mode controller --push
+    python3 bench_catt_monitor.py --latency 1.5 --failure-rate 0.1 --outage-interval 3600
+    python3 bench_catt_monitor.py --script changes.json --json
+
+Reported: re-casts, time from a file change to the TV showing it, loop
+wake-ups and real CPU time per simulated hour (the harness's own file writes
+included), watchdog outages, and updates that never reached the TV. --script takes a JSON list of
+{"at": <seconds>, "event": "tournament" | "media" | "foreign_app" | "idle"}.
+"""
+
+import argparse
+import functools
+import json
+import logging
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time as real_time
+from datetime import datetime
+
+import catt_monitor
+from cast_controller import DASHCAST_APP_ID
+from cast_watchdog import CastWatchdog
+from display_schedule import DAY_KEYS, DisplaySchedule, load_config
+
+
+IP_ADDRESS = '192.0.2.10'
+SOURCES = ('tournament', 'media')
+
+
+class FakeClock:
+    """Simulated seconds since start; stands in for the time module inside catt_monitor"""
+
+    def __init__(self, start):
+        self.start = start
+        self.now = 0.0
+        self.sleeps = 0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.start.timestamp() + self.now
+
+    def perf_counter(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps += 1
+        self.now += max(seconds, 0)
+
+    def advance_to(self, moment):
+        self.now = max(self.now, moment)
+
+    def datetime_class(self):
+        clock = self
+
+        class FakeDateTime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return datetime.fromtimestamp(clock.time(), tz)
+
+        return FakeDateTime
+
+
+class SimulatedChromecast:
+    """What the TV shows, with per-command latency and random failures"""
+
+    def __init__(self, clock, files, latency, failure_rate, rng):
+        self.clock = clock
+        self.files = files
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.rng = rng
+        self.app = 'Backdrop'
+        self.shown = {source: None for source in SOURCES}
+        self.displayed = {source: [] for source in SOURCES}   # (time, version) when the TV caught up
+        self.counts = {'casts': 0, 'stops': 0, 'pushes': 0, 'failures': 0}
+
+    def _command(self, extra=0.0):
+        self.clock.sleep(self.latency + extra)
+        if self.failure_rate and self.rng.random() < self.failure_rate:
+            self.counts['failures'] += 1
+            return False
+        return True
+
+    def _show(self, sources):
+        for source in sources:
+            version = read_version(self.files[source])
+            if version != self.shown[source]:
+                self.shown[source] = version
+                self.displayed[source].append((self.clock.now, version))
+
+    def cast_site(self, url, extra=0.0):
+        if not self._command(extra):
+            return False
+        self.app = 'DashCast'
+        self.counts['casts'] += 1
+        self._show(SOURCES)
+        return True
+
+    def stop(self, extra=0.0):
+        if not self._command(extra):
+            return False
+        self.app = 'Backdrop'
+        self.counts['stops'] += 1
+        return True
+
+    def page_reload(self, source):
+        if self.app == 'DashCast':
+            self.counts['pushes'] += 1
+            self._show([source])
+
+    def interrupt(self, event):
+        self.app = 'Backdrop' if event == 'idle' else 'YouTube'
+
+
+class SimulatedController:
+    """CastController interface over the simulated device (--mode controller)"""
+
+    def __init__(self, device):
+        self.device = device
+
+    def cast_site(self, url):
+        return self.device.cast_site(url)
+
+    def stop(self):
+        return self.device.stop()
+
+    def status(self):
+        app = self.device.app
+        return {'app_id': DASHCAST_APP_ID if app == 'DashCast' else app,
+                'display_name': app, 'is_idle': app == 'Backdrop'}
+
+    def disconnect(self):
+        pass
+
+
+class FakeSubprocess:
+    """subprocess stand-in: catt CLI calls go to the simulated device (--mode catt)"""
+
+    TimeoutExpired = subprocess.TimeoutExpired
+
+    def __init__(self, device, overhead):
+        self.device = device
+        self.overhead = overhead   # process start + discovery per catt call
+        self.calls = 0
+
+    def run(self, command, **kwargs):
+        self.calls += 1
+        args = list(command[1:])
+        if args[:1] == ['-d']:
+            args = args[2:]
+        if args[:1] == ['stop']:
+            ok = self.device.stop(self.overhead)
+        elif args[:1] == ['cast_site']:
+            ok = self.device.cast_site(args[1], self.overhead)
+        else:
+            ok = True
+        return subprocess.CompletedProcess(command, 0 if ok else 1, '', '' if ok else 'Error: simulated failure')
+
+
+class FakePush:
+    """Push channel whose receiver page is always connected and reloads instantly"""
+
+    def __init__(self, device):
+        self.device = device
+
+    def connected(self, tag):
+        return self.device.app == 'DashCast'
+
+    def disconnected_for(self, tag):
+        return 0 if self.device.app == 'DashCast' else None
+
+    def publish(self, event, data=None, tag=None):
+        self.device.page_reload('tournament' if event == 'data' else 'media')
+        return 1
+
+    def forget(self, tag):
+        pass
+
+
+class ScriptedWatcher:
+    """FileWatcher stand-in: jumps the clock to the next scripted event or timeout"""
+
+    def __init__(self, clock, events, files, device, end):
+        self.clock = clock
+        self.events = sorted(events, key=lambda e: e['at'])
+        self.files = files
+        self.device = device
+        self.end = end
+        self.versions = {source: 0 for source in SOURCES}
+        self.changes = []      # (time, source, version)
+        self.wakeups = 0
+        self.mode = 'scripted'
+
+    def wait(self, timeout, extra_fds=()):
+        self.wakeups += 1
+        deadline = self.clock.now + timeout
+        if self.events and self.events[0]['at'] <= min(deadline, self.end):
+            self.clock.advance_to(self.events[0]['at'])
+            changed = set()
+            while self.events and self.events[0]['at'] <= self.clock.now:
+                changed |= self.apply(self.events.pop(0))
+            return changed
+        if deadline >= self.end:
+            self.clock.advance_to(self.end)
+            raise KeyboardInterrupt   # monitor_and_cast's normal exit
+        self.clock.advance_to(deadline)
+        return set()
+
+    def apply(self, event):
+        kind = event['event']
+        if kind in SOURCES:
+            self.versions[kind] += 1
+            write_version(self.files[kind], self.versions[kind], kind)
+            self.changes.append((self.clock.now, kind, self.versions[kind]))
+            return {self.files[kind]}
+        self.device.interrupt(kind)
+        return set()
+
+    def close(self):
+        pass
+
+
+def read_version(path):
+    try:
+        with open(path, 'r') as f:
+            return json.load(f).get('version')
+    except (OSError, ValueError):
+        return None
+
+
+def write_version(path, version, source):
+    data = {'version': version}
+    if source == 'tournament':
+        data.update(tournament_name='Bench Tournament', status='In Progress',
+                    display_tournament=True, player_count=16)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def generate_events(hours, change_interval, media_interval, outage_interval, rng):
+    """Poisson-ish streams of tournament updates, media edits and TV interruptions"""
+    events = []
+    for kind, mean in (('tournament', change_interval), ('media', media_interval),
+                       ('foreign_app', outage_interval)):
+        if not mean:
+            continue
+        at = rng.expovariate(1 / mean)
+        while at < hours * 3600:
+            events.append({'at': at, 'event': kind})
+            at += rng.expovariate(1 / mean)
+    return events
+
+
+def percentile(values, share):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(share * len(ordered)))]
+
+
+def update_latencies(changes, displayed, end, grace):
+    """Seconds from each change to the TV showing it (or newer); missed/pending counts"""
+    latencies, missed, pending = [], 0, 0
+    for at, source, version in changes:
+        shown_at = next((t for t, v in displayed[source] if v is not None and v >= version and t >= at), None)
+        if shown_at is not None:
+            latencies.append(shown_at - at)
+        elif end - at > grace:
+            missed += 1
+        else:
+            pending += 1
+    return latencies, missed, pending
+
+
+def run(args):
+    rng = random.Random(args.seed)
+    start = datetime.strptime(args.start, '%Y-%m-%d %H:%M')
+    clock = FakeClock(start)
+    end = args.hours * 3600
+
+    if args.script:
+        with open(args.script, 'r') as f:
+            events = json.load(f)
+    else:
+        events = generate_events(args.hours, args.change_interval, args.media_interval, args.outage_interval, rng)
+
+    with tempfile.TemporaryDirectory() as work:
+        files = {'tournament': os.path.join(work, 'tournament_data.json'),
+                 'media': os.path.join(work, 'media_config.json')}
+        for source in SOURCES:
+            write_version(files[source], 0, source)
+
+        device = SimulatedChromecast(clock, files, args.latency, args.failure_rate, rng)
+        watcher = ScriptedWatcher(clock, events, files, device, end)
+        fake_subprocess = FakeSubprocess(device, args.catt_overhead)
+
+        if args.schedule == 'always':
+            config = {'business_hours': {day: ['00:00-24:00'] for day in DAY_KEYS}}
+        else:
+            config = load_config()
+
+        catt_monitor.TOURNAMENT_DATA_FILE = files['tournament']
+        catt_monitor.MEDIA_CONFIG_FILE = files['media']
+        catt_monitor.STATE_FILE = os.path.join(work, 'cast_state.json')
+        catt_monitor.time = clock
+        catt_monitor.datetime = clock.datetime_class()
+        catt_monitor.subprocess = fake_subprocess
+        catt_monitor.FileWatcher = lambda paths: watcher
+        catt_monitor.get_local_ip = lambda: IP_ADDRESS
+        catt_monitor.SCHEDULE = DisplaySchedule(config)
+        catt_monitor.DISCOVERY = None
+        catt_monitor.CONTROLLER = SimulatedController(device) if args.mode == 'controller' else None
+        catt_monitor.PUSH = FakePush(device) if args.push else None
+        outage_log = os.path.join(work, 'outages.json')
+        catt_monitor.CastWatchdog = functools.partial(CastWatchdog, outage_log=outage_log, clock=clock.monotonic)
+
+        cpu_started = real_time.process_time()
+        wall_started = real_time.perf_counter()
+        catt_monitor.monitor_and_cast()
+        cpu = real_time.process_time() - cpu_started
+        wall = real_time.perf_counter() - wall_started
+
+        try:
+            with open(outage_log, 'r') as f:
+                outages = json.load(f)
+        except (OSError, ValueError):
+            outages = []
+
+    grace = max(catt_monitor.RECAST_COOLDOWN.values()) + 120
+    latencies, missed, pending = update_latencies(watcher.changes, device.displayed, end, grace)
+    hours = args.hours
+    return {
+        'mode': args.mode + (' + push' if args.push else ''),
+        'simulated_hours': hours,
+        'changes': len(watcher.changes),
+        'casts': device.counts['casts'],
+        'recasts': max(device.counts['casts'] - 1, 0),
+        'stops': device.counts['stops'],
+        'pushes': device.counts['pushes'],
+        'command_failures': device.counts['failures'],
+        'catt_calls': fake_subprocess.calls,
+        'time_to_update': {
+            'count': len(latencies),
+            'mean': round(statistics.mean(latencies), 1) if latencies else None,
+            'median': round(statistics.median(latencies), 1) if latencies else None,
+            'p95': round(percentile(latencies, 0.95), 1) if latencies else None,
+            'max': round(max(latencies), 1) if latencies else None,
+        },
+        'missed_updates': missed,
+        'pending_at_end': pending,
+        'outages': len(outages),
+        'outage_mean_seconds': round(statistics.mean(o['duration_seconds'] for o in outages), 1) if outages else None,
+        'wakeups_per_hour': round(watcher.wakeups / hours, 1),
+        'cpu_ms_per_hour': round(cpu * 1000 / hours, 1),
+        'wall_seconds': round(wall, 2),
+    }
+
+
+def print_report(result):
+    ttu = result['time_to_update']
+    print(f"\ncatt_monitor benchmark - {result['mode']}, {result['simulated_hours']} simulated hour(s)\n")
+    rows = [
+        ('File changes', result['changes']),
+        ('Re-casts', f"{result['recasts']}  (stops {result['stops']}, pushes {result['pushes']}, "
+                     f"failed commands {result['command_failures']})"),
+        ('Time to update (s)', f"mean {ttu['mean']}  median {ttu['median']}  p95 {ttu['p95']}  max {ttu['max']}"
+                               if ttu['count'] else 'n/a'),
+        ('Missed updates', f"{result['missed_updates']}  (+{result['pending_at_end']} still pending at end)"),
+        ('Watchdog outages', f"{result['outages']}" + (f"  (mean {result['outage_mean_seconds']} s)"
+                                                       if result['outages'] else '')),
+        ('Loop wake-ups / hour', result['wakeups_per_hour']),
+        ('CPU / simulated hour', f"{result['cpu_ms_per_hour']} ms"),
+        ('Wall time', f"{result['wall_seconds']} s"),
+    ]
+    for label, value in rows:
+        print(f"  {label:<22} {value}")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark catt_monitor against a simulated Chromecast')
+    parser.add_argument('--hours', type=float, default=8)
+    parser.add_argument('--mode', choices=['catt', 'controller'], default='catt')
+    parser.add_argument('--push', action='store_true', help='Receiver page holds a push connection')
+    parser.add_argument('--latency', type=float, default=0.5, help='Seconds per device command')
+    parser.add_argument('--catt-overhead', type=float, default=4.0,
+                        help='Extra seconds per catt call (process start + discovery)')
+    parser.add_argument('--failure-rate', type=float, default=0.0)
+    parser.add_argument('--change-interval', type=float, default=120, help='Mean seconds between tournament updates')
+    parser.add_argument('--media-interval', type=float, default=3600, help='Mean seconds between media edits')
+    parser.add_argument('--outage-interval', type=float, default=0,
+                        help='Mean seconds between someone switching the TV away (0 = never)')
+    parser.add_argument('--schedule', choices=['always', 'real'], default='always',
+                        help="'real' applies display_schedule.json from --start")
+    parser.add_argument('--start', default='2026-01-09 12:00', help='Simulated start (YYYY-MM-DD HH:MM)')
+    parser.add_argument('--script', help='JSON list of scripted events instead of random ones')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--json', action='store_true')
+    parser.add_argument('--verbose', action='store_true', help="Show the monitor's own log")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.CRITICAL, format='%(message)s')
+    result = run(args)
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print_report(result)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
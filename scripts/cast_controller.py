@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Persistent Chromecast Controller
+Keeps one pychromecast connection to the Chromecast open for the life of
+catt_monitor, so stop / load / status are single messages on an existing
+socket instead of a new catt process (imports, mDNS discovery, connect) per
+call. Sites are shown with the DashCast receiver app, the same one catt's
+cast_site uses.
+
+pychromecast is optional: get_cast_controller() returns None without it and
+catt_monitor keeps using the catt CLI.
+"""
+
+import logging
+import time
+
+try:
+    import pychromecast
+    from pychromecast.controllers.dashcast import DashCastController
+except ImportError:
+    pychromecast = None
+
+
+DASHCAST_APP_ID = '84912283'
+CAST_PORT = 8009
+CONNECT_TIMEOUT = 10
+LAUNCH_TIMEOUT = 15
+RECONNECT_BACKOFF_INITIAL = 2
+RECONNECT_BACKOFF_MAX = 120
+
+
+class CastError(Exception):
+    """The Chromecast could not be reached or did not respond"""
+
+
+class CastController:
+    """Long-lived connection for stop / cast_site / status, reconnecting as needed
+
+    device_name picks a Chromecast by friendly name (None = first found);
+    host/port connect directly and skip mDNS discovery. With a discovery
+    cache (cast_discovery.DiscoveryCache) the cached address is used the same
+    way, and marked stale when connecting to it fails.
+    """
+
+    def __init__(self, device_name=None, host=None, port=CAST_PORT, timeout=CONNECT_TIMEOUT, discovery=None):
+        self.device_name = device_name
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.discovery = discovery
+        self.cast = None
+        self.dashcast = None
+        self.browser = None
+        self.connects = 0
+        self.next_attempt = 0
+        self.backoff = RECONNECT_BACKOFF_INITIAL
+
+    @property
+    def connected(self):
+        return bool(self.cast and self.cast.socket_client and self.cast.socket_client.is_connected)
+
+    def _discover(self):
+        names = [self.device_name] if self.device_name else None
+        casts, self.browser = pychromecast.get_listed_chromecasts(friendly_names=names, discovery_timeout=self.timeout)
+        if self.browser:
+            # Discovery is only needed to find the device once
+            self.browser.stop_discovery()
+            self.browser = None
+        if not casts:
+            raise CastError(f"No Chromecast found{' named ' + self.device_name if self.device_name else ''}")
+        return casts[0]
+
+    def connect(self):
+        """Open the connection (discovering the device unless host is set)"""
+        self.disconnect()
+        if time.monotonic() < self.next_attempt:
+            raise CastError(f"Reconnect backoff - next attempt in {self.next_attempt - time.monotonic():.0f}s")
+
+        started = time.perf_counter()
+        host, port = self.host, self.port
+        cached = None
+        if not host and self.discovery:
+            cached = self.discovery.resolve(self.device_name)
+            if cached:
+                host, port = cached
+        try:
+            if host:
+                cast = pychromecast.get_chromecast_from_host(
+                    (host, port, None, None, self.device_name), tries=1, timeout=self.timeout)
+            else:
+                cast = self._discover()
+            cast.wait(timeout=self.timeout)
+            if not cast.socket_client.is_connected:
+                raise CastError(f"Could not connect to {cast.name}")
+        except Exception as e:
+            if cached:
+                self.discovery.invalidate(self.device_name)
+            self.next_attempt = time.monotonic() + self.backoff
+            self.backoff = min(self.backoff * 2, RECONNECT_BACKOFF_MAX)
+            if isinstance(e, CastError):
+                raise
+            raise CastError(str(e)) from e
+
+        self.dashcast = DashCastController()
+        cast.register_handler(self.dashcast)
+        self.cast = cast
+        self.connects += 1
+        self.backoff = RECONNECT_BACKOFF_INITIAL
+        logging.info("Connected to Chromecast %s (%s) in %.0f ms", cast.name,
+                     self.host or (f"{host}, cached" if cached else 'discovered'), (time.perf_counter() - started) * 1000)
+
+    def disconnect(self):
+        if self.cast:
+            try:
+                self.cast.disconnect(timeout=2)
+            except Exception:
+                pass
+        self.cast = None
+        self.dashcast = None
+
+    def _ensure_connected(self):
+        if not self.connected:
+            if self.cast:
+                logging.warning("Chromecast connection lost - reconnecting")
+            self.connect()
+
+    def _call(self, action, *args):
+        """Run an action, reconnecting and retrying once if the socket died"""
+        self._ensure_connected()
+        try:
+            return action(*args)
+        except Exception as e:
+            logging.warning("Cast command failed (%s) - reconnecting", e)
+            self.connect()
+            return action(*args)
+
+    def _wait_for_app(self, app_id, timeout):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            status = self.cast.status
+            if (status.app_id if status else None) == app_id:
+                return True
+            time.sleep(0.05)
+        return False
+
+    def _stop(self):
+        self.cast.quit_app()
+        return True
+
+    def _cast_site(self, url):
+        # force=True replaces the page even when DashCast is already running
+        self.dashcast.load_url(url, force=True)
+        if not self._wait_for_app(DASHCAST_APP_ID, LAUNCH_TIMEOUT):
+            raise CastError("DashCast did not start")
+        return True
+
+    def stop(self):
+        """Quit whatever app is running"""
+        try:
+            self._call(self._stop)
+            logging.info("Cast stopped successfully")
+            return True
+        except Exception as e:
+            logging.error("Error stopping cast: %s", e)
+            return False
+
+    def cast_site(self, url):
+        """Show url on the TV - no stop needed first"""
+        logging.info("Casting site: %s", url)
+        started = time.perf_counter()
+        try:
+            self._call(self._cast_site, url)
+            logging.info("Site cast successfully in %.0f ms", (time.perf_counter() - started) * 1000)
+            return True
+        except Exception as e:
+            logging.error("Error casting site: %s", e)
+            return False
+
+    def status(self):
+        """{'app_id', 'display_name', 'is_idle', 'is_active_input'} for the running app, or None if unreachable
+
+        is_active_input is None when the TV doesn't report it (no HDMI-CEC).
+        """
+        try:
+            self._ensure_connected()
+        except Exception as e:
+            logging.debug("Chromecast status unavailable: %s", e)
+            return None
+        status = self.cast.status
+        if not status:
+            return None
+        return {
+            'app_id': status.app_id,
+            'display_name': status.display_name,
+            'is_idle': bool(status.app_id is None or getattr(self.cast, 'is_idle', False)),
+            'is_active_input': status.is_active_input,
+        }
+
+
+def get_cast_controller(device_name=None, host=None, port=CAST_PORT, discovery=None):
+    """A CastController, or None when pychromecast isn't installed"""
+    if pychromecast is None:
+        logging.info("pychromecast not installed - using the catt CLI for casting")
+        return None
+    return CastController(device_name=device_name, host=host, port=port, discovery=discovery)
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Chromecast Discovery Cache
+Runs mDNS discovery once and keeps each device's name, IP and port in a small
+JSON file, so casts can go straight to the cached address. On busy Wi-Fi the
+discovery step is the slowest and least reliable part of a cast; with the
+cache it only runs again when an entry's TTL expires or a cast to the cached
+address fails (the caller invalidates it).
+
+Discovery uses pychromecast when installed, otherwise `catt scan`.
+
+    python3 cast_discovery.py          # show the cache
+    python3 cast_discovery.py --scan   # discover now and show the result
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+try:
+    import pychromecast
+    import pychromecast.discovery
+except ImportError:
+    pychromecast = None
+
+
+CACHE_FILE = os.path.expanduser('~/.cache/cast_discovery.json')
+DISCOVERY_TTL = 6 * 3600   # Seconds a discovered address is trusted
+DISCOVERY_TIMEOUT = 10
+MIN_RESCAN_INTERVAL = 30   # A missing device doesn't trigger back-to-back scans
+CAST_PORT = 8009
+CATT_COMMAND = '/home/pi/.local/bin/catt'
+
+# catt scan: "192.168.1.20 - Bracket TV - Google Inc. Chromecast"
+SCAN_LINE_RE = re.compile(r'^(\d{1,3}(?:\.\d{1,3}){3}) - (.+?) - ')
+
+
+class DiscoveryCache:
+    """resolve(name) -> (host, port) from the cache, discovering only when needed
+
+    name None means "the only Chromecast on the network"; with several found
+    it resolves to None and the caller falls back to its own default.
+    """
+
+    def __init__(self, path=CACHE_FILE, ttl=DISCOVERY_TTL, catt_command=CATT_COMMAND):
+        self.path = path
+        self.ttl = ttl
+        self.catt_command = catt_command
+        self.lock = threading.Lock()
+        self.devices = {}       # name -> {'host', 'port', 'seen'}
+        self.last_scan = 0
+        self.scans = 0
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r') as f:
+                self.devices = json.load(f).get('devices', {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logging.warning("Ignoring unreadable discovery cache %s: %s", self.path, e)
+
+    def _save(self):
+        tmp_path = self.path + '.tmp'
+        try:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump({'devices': self.devices}, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.warning("Could not write discovery cache %s: %s", self.path, e)
+
+    def _fresh(self, entry):
+        return entry is not None and time.time() - entry.get('seen', 0) < self.ttl
+
+    def _ambiguous(self, name):
+        """No name, several devices known and the scan is recent - nothing to resolve"""
+        return name is None and len(self.devices) > 1 and any(map(self._fresh, self.devices.values()))
+
+    def _entry(self, name):
+        if name is not None:
+            return self.devices.get(name)
+        if len(self.devices) == 1:
+            return next(iter(self.devices.values()))
+        return None
+
+    def _scan_pychromecast(self):
+        services, browser = pychromecast.discovery.discover_chromecasts(timeout=DISCOVERY_TIMEOUT)
+        pychromecast.discovery.stop_discovery(browser)
+        return {s.friendly_name: (s.host, s.port) for s in services if s.friendly_name}
+
+    def _scan_catt(self):
+        result = subprocess.run([self.catt_command, 'scan'], capture_output=True, text=True,
+                                timeout=DISCOVERY_TIMEOUT + 20)
+        found = {}
+        for line in result.stdout.splitlines():
+            match = SCAN_LINE_RE.match(line.strip())
+            if match:
+                found[match.group(2)] = (match.group(1), CAST_PORT)
+        return found
+
+    def discover(self):
+        """Scan the network now; returns {name: (host, port)}"""
+        started = time.perf_counter()
+        self.last_scan = time.monotonic()
+        self.scans += 1
+        try:
+            found = self._scan_pychromecast() if pychromecast else self._scan_catt()
+        except Exception as e:
+            logging.warning("Chromecast discovery failed: %s", e)
+            return {}
+
+        now = time.time()
+        for name, (host, port) in found.items():
+            previous = self.devices.get(name)
+            if previous and previous.get('host') != host:
+                logging.info("Chromecast %s moved: %s -> %s", name, previous.get('host'), host)
+            self.devices[name] = {'host': host, 'port': port, 'seen': now}
+        self._save()
+        logging.info("Discovered %d Chromecast(s) in %.1f s: %s", len(found),
+                     time.perf_counter() - started, ', '.join(sorted(found)) or 'none')
+        return found
+
+    def resolve(self, name=None):
+        """(host, port) for a device - cached while fresh, otherwise rediscovered"""
+        with self.lock:
+            if self._ambiguous(name):
+                return None
+            entry = self._entry(name)
+            if not self._fresh(entry) and time.monotonic() - self.last_scan >= MIN_RESCAN_INTERVAL:
+                self.discover()
+                entry = self._entry(name)
+            if entry is None:
+                return None
+            return entry['host'], entry.get('port', CAST_PORT)
+
+    def invalidate(self, name=None):
+        """The cached address didn't work - rediscover on the next resolve()"""
+        with self.lock:
+            entry = self._entry(name)
+            if entry and entry.get('seen'):
+                entry['seen'] = 0
+                self._save()
+                logging.info("Discovery cache: %s marked stale", name or entry['host'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Chromecast discovery cache')
+    parser.add_argument('--scan', action='store_true', help='Discover now')
+    parser.add_argument('--cache', default=CACHE_FILE)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    cache = DiscoveryCache(args.cache)
+    if args.scan:
+        cache.discover()
+    now = time.time()
+    for name, entry in sorted(cache.devices.items()):
+        age = now - entry.get('seen', 0)
+        print(f"{name:<30} {entry['host']}:{entry.get('port', CAST_PORT)}  "
+              f"{'fresh' if age < cache.ttl else 'stale'} ({age / 60:.0f} min)")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
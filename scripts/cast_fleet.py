@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Chromecast Fleet
+Fleet mode for catt_monitor: several Chromecasts driven from one process,
+configured in cast_devices.json. Each device has its own page, display rule,
+optional hours and state; the tournament data, file watcher, IP cache,
+schedule and push channel are shared. Stops and casts for different devices
+run at the same time on a small thread pool, so re-casting four TVs takes
+about as long as one.
+
+catt_monitor.py switches to fleet mode when cast_devices.json exists
+(see cast_devices.example.json).
+
+Device entries:
+    name            Chromecast friendly name (catt -d / pychromecast)
+    host            optional IP - connect directly, skip discovery
+    page            path on the Pi ("/", "/sidepot.html") or a full URL
+    show            "tournament" - same rule as single-device mode (default)
+                    "schedule"   - business hours / early start only
+                    "always"
+    content         changes that refresh this device: ["tournament", "media"] (default)
+    business_hours  optional per-device hours (display_schedule.json format)
+    holidays        optional per-device holiday overrides
+"""
+
+import json
+import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import catt_monitor as monitor
+from cast_controller import get_cast_controller
+from cast_watchdog import CastWatchdog
+from display_schedule import DisplaySchedule, load_config
+from file_watcher import FileWatcher
+
+
+FLEET_STATE_FILE = '/var/www/html/cast_fleet_state.json'
+FLEET_WORKERS = 4    # Concurrent stop/cast commands
+SHOW_RULES = ('tournament', 'schedule', 'always')
+
+
+def load_devices(path):
+    """Device entries from cast_devices.json ({"devices": [...]} or a bare list)"""
+    with open(path, 'r') as f:
+        data = json.load(f)
+    entries = data.get('devices', []) if isinstance(data, dict) else data
+    names = set()
+    for entry in entries:
+        if not entry.get('name'):
+            raise ValueError("Every device in cast_devices.json needs a 'name'")
+        if entry['name'] in names:
+            raise ValueError(f"Duplicate device name '{entry['name']}'")
+        if entry.get('show', 'tournament') not in SHOW_RULES:
+            raise ValueError(f"Device '{entry['name']}': show must be one of {', '.join(SHOW_RULES)}")
+        names.add(entry['name'])
+    return entries
+
+
+def load_fleet_state():
+    try:
+        if Path(FLEET_STATE_FILE).exists():
+            with open(FLEET_STATE_FILE, 'r') as f:
+                return json.load(f)
+    except Exception as e:
+        logging.error("Error loading fleet state: %s", e)
+    return {}
+
+
+def save_fleet_state(states):
+    """All devices' state in one file, keyed by device name"""
+    tmp_path = FLEET_STATE_FILE + '.tmp'
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(states, f, indent=2)
+        Path(tmp_path).replace(FLEET_STATE_FILE)
+        return True
+    except Exception as e:
+        logging.error("Error saving fleet state: %s", e)
+        return False
+
+
+def empty_state():
+    return {
+        'is_casting': False,
+        'cast_started_at': None,
+        'cast_url': None,
+        'tournament_data_hash': None,
+        'media_config_hash': None,
+    }
+
+
+class FleetDevice:
+    """One Chromecast: decides what it needs each pass, the pool runs it"""
+
+    def __init__(self, entry, state=None):
+        self.name = entry['name']
+        self.host = entry.get('host')
+        # catt -d target: a fixed IP, or the name (resolved through the discovery cache)
+        self.target = self.host or self.name
+        self.page = entry.get('page', '/')
+        self.show = entry.get('show', 'tournament')
+        self.content = set(entry.get('content', ['tournament', 'media']))
+        # Push client tag - the receiver page reports it back in ?receiver=
+        self.client = re.sub(r'[^a-z0-9]+', '-', self.name.lower()).strip('-')[:32] or 'cast'
+        self.state = {**empty_state(), **(state or {})}
+        self.controller = get_cast_controller(self.name, self.host, discovery=None if self.host else monitor.DISCOVERY)
+        self.watchdog = CastWatchdog(self.controller, self.name) if self.controller else None
+        self.debouncer = monitor.ChangeDebouncer(monitor.RECAST_COOLDOWN)
+        if self.state.get('cast_started_at'):
+            age = (datetime.now() - datetime.fromisoformat(self.state['cast_started_at'])).total_seconds()
+            self.debouncer.applied(time.monotonic() - max(age, 0))
+
+        overrides = {key: entry[key] for key in ('business_hours', 'holidays', 'early_start_minutes') if key in entry}
+        self.schedule = DisplaySchedule({**load_config(), **overrides}) if overrides else None
+
+    def cast_url(self, local_ip):
+        base = self.page if self.page.startswith(('http://', 'https://')) else f"http://{local_ip}/{self.page.lstrip('/')}"
+        return f"{base}{'&' if '?' in base else '?'}receiver={self.client}"
+
+    def wants_display(self, tournament_data):
+        return monitor.should_display_tournament(tournament_data, self.show, self.schedule)
+
+    # --- Work run on the pool ---
+
+    def do_cast(self, url):
+        if not self.controller:
+            monitor.catt_stop(self.target)
+            time.sleep(2)
+        if monitor.PUSH:
+            monitor.PUSH.forget(self.client)
+        return monitor.catt_cast_site(url, self.target, self.controller)
+
+    def do_recast(self, url):
+        return monitor.recast(url, self.target, self.controller, self.client)
+
+    def do_stop(self):
+        return monitor.catt_stop(self.target, self.controller)
+
+    # --- Planning (main thread) ---
+
+    def plan(self, tournament_data, hashes, fresh, local_ip):
+        """(kind, callable, reason) for the pool, or None - pushes are sent here directly"""
+        want = self.wants_display(tournament_data)
+        url = self.cast_url(local_ip)
+        casting = self.state['is_casting']
+
+        if want and not casting:
+            return 'cast', lambda: self.do_cast(url), 'display on'
+        if not want and casting:
+            return 'stop', self.do_stop, 'display off'
+        if not want:
+            return None
+
+        tournament_hash, media_hash = hashes
+        differing = {n for n, c in [('tournament', tournament_hash != self.state.get('tournament_data_hash')),
+                                    ('media', media_hash != self.state.get('media_config_hash'))]
+                     if c and n in self.content}
+        self.debouncer.retain(differing)
+
+        url_changed = bool(self.state.get('cast_url')) and self.state['cast_url'] != url
+        gone_for = monitor.PUSH.disconnected_for(self.client) if monitor.PUSH else None
+        watchdog_reason = self.watchdog.check() if self.watchdog else None
+        if url_changed or (gone_for is not None and gone_for > monitor.RECEIVER_LOST_AFTER) or watchdog_reason:
+            if url_changed:
+                reason = 'page URL changed'
+            elif watchdog_reason:
+                reason = watchdog_reason
+            else:
+                reason = f"receiver page gone for {gone_for:.0f}s"
+            return 'recast', lambda: self.do_recast(url), reason
+
+        if not differing:
+            if hashes != (self.state.get('tournament_data_hash'), self.state.get('media_config_hash')):
+                # Only content this device doesn't show changed
+                self.mark_content(hashes)
+            return None
+        if monitor.PUSH and monitor.PUSH.connected(self.client):
+            for source in sorted(differing):
+                monitor.PUSH.publish('data' if source == 'tournament' else 'media',
+                                     {'hash': tournament_hash if source == 'tournament' else media_hash},
+                                     tag=self.client)
+            logging.info("[%s] 📨 Pushed %s change", self.name, ' + '.join(sorted(differing)))
+            self.debouncer.clear()
+            self.mark_content(hashes)
+            return None
+
+        for source in differing:
+            if source in fresh or source not in self.debouncer.pending:
+                self.debouncer.note(source)
+        if self.debouncer.due_in():
+            return None
+        counts, staleness = self.debouncer.summary()
+        reason = (f"{' + '.join(f'{s} x{n}' for s, n in sorted(counts.items()))} changed, "
+                  f"oldest waited {staleness:.0f}s")
+        return 'recast', lambda: self.do_recast(url), reason
+
+    def mark_content(self, hashes):
+        self.state['tournament_data_hash'], self.state['media_config_hash'] = hashes
+
+    def finish(self, kind, ok, hashes, local_ip):
+        """Apply a pool result to this device's state (main thread)"""
+        if not ok:
+            logging.error("[%s] ✗ %s failed - will retry next cycle", self.name, kind)
+            return
+        logging.info("[%s] ✓ %s done", self.name, kind)
+        if kind == 'stop':
+            self.state.update(empty_state())
+            self.debouncer.clear()
+            if self.watchdog:
+                self.watchdog.reset()
+            return
+        if self.watchdog:
+            self.watchdog.recast_done()
+        self.state['is_casting'] = True
+        self.state['cast_started_at'] = datetime.now().isoformat()
+        self.state['cast_url'] = self.cast_url(local_ip)
+        self.mark_content(hashes)
+        self.debouncer.applied()
+
+    def next_wait(self, tournament_data):
+        wait = monitor.next_wait(tournament_data, self.state['is_casting'], self.show, self.schedule)
+        due_in = self.debouncer.due_in()
+        if due_in is not None:
+            wait = min(wait, max(due_in, 1))
+        if self.watchdog and self.state['is_casting']:
+            wait = min(wait, max(self.watchdog.due_in(), 0.1))
+        return wait
+
+
+def monitor_fleet(entries):
+    """Fleet counterpart of catt_monitor.monitor_and_cast"""
+    logging.info("=" * 60)
+    logging.info("CATT Monitor Starting - fleet mode, %d device(s)", len(entries))
+    logging.info("=" * 60)
+
+    states = load_fleet_state()
+    devices = [FleetDevice(entry, states.get(entry['name'])) for entry in entries]
+    for device in devices:
+        logging.info("  %s: %s (%s)%s", device.name, device.page, device.show,
+                     ' - own hours' if device.schedule else '')
+
+    watched_files = {monitor.TOURNAMENT_DATA_FILE, monitor.MEDIA_CONFIG_FILE}
+    watcher = FileWatcher(watched_files)
+    logging.info("Watching %s (%s)", ', '.join(sorted(watched_files)), watcher.mode)
+    ip_cache = monitor.LocalIPCache()
+    wake_fds = [ip_cache.netlink] if ip_cache.netlink else []
+    executor = ThreadPoolExecutor(max_workers=FLEET_WORKERS, thread_name_prefix='cast')
+
+    changed = set(watched_files)
+    tournament_data = None
+    hashes = (None, None)
+
+    try:
+        while True:
+            try:
+                fresh = set()
+                if monitor.TOURNAMENT_DATA_FILE in changed:
+                    tournament_data = monitor.load_tournament_data()
+                    new_hash = monitor.get_file_hash(monitor.TOURNAMENT_DATA_FILE)
+                    if new_hash != hashes[0]:
+                        fresh.add('tournament')
+                    hashes = (new_hash, hashes[1])
+                if monitor.MEDIA_CONFIG_FILE in changed:
+                    new_hash = monitor.get_file_hash(monitor.MEDIA_CONFIG_FILE)
+                    if new_hash != hashes[1]:
+                        fresh.add('media')
+                    hashes = (hashes[0], new_hash)
+                changed = set()
+
+                # Without tournament data only "schedule" / "always" devices can
+                # be planned; "tournament" devices keep their state until it loads
+                if tournament_data:
+                    active = devices
+                else:
+                    logging.debug("No tournament data found")
+                    active = [device for device in devices if device.show != 'tournament']
+                retry = set() if tournament_data else {monitor.TOURNAMENT_DATA_FILE}
+
+                local_ip, _ = ip_cache.get()
+                if not local_ip:
+                    logging.error("Could not determine local IP address")
+                    changed = watcher.wait(monitor.CHECK_INTERVAL) | retry
+                    continue
+
+                jobs = []
+                for device in active:
+                    planned = device.plan(tournament_data, hashes, fresh, local_ip)
+                    if planned:
+                        kind, action, reason = planned
+                        logging.info("[%s] 🔄 %s: %s", device.name, kind, reason)
+                        jobs.append((device, kind, executor.submit(action)))
+
+                failed = 0
+                if jobs:
+                    started = time.perf_counter()
+                    for device, kind, future in jobs:
+                        try:
+                            ok = future.result()
+                        except Exception as e:
+                            logging.error("[%s] %s raised: %s", device.name, kind, e)
+                            ok = False
+                        device.finish(kind, ok, hashes, local_ip)
+                        failed += not ok
+                    logging.info("✓ %d cast command(s) finished in %.1f s (%d failed)",
+                                 len(jobs), time.perf_counter() - started, failed)
+
+                if jobs or fresh:
+                    save_fleet_state({device.name: device.state for device in devices})
+
+                timeout = min((device.next_wait(tournament_data) for device in active),
+                              default=monitor.CHECK_INTERVAL)
+                if failed or retry:
+                    timeout = min(timeout, monitor.CHECK_INTERVAL)
+                changed = watcher.wait(timeout, wake_fds) | retry
+
+            except KeyboardInterrupt:
+                logging.info("Monitor stopped by user")
+                break
+            except Exception as e:
+                logging.error("Error in fleet loop: %s", e)
+                import traceback
+                traceback.print_exc()
+                time.sleep(monitor.CHECK_INTERVAL)
+                changed = set(watched_files)
+    finally:
+        executor.shutdown(wait=True)
+        for device in devices:
+            if device.controller:
+                device.controller.disconnect()
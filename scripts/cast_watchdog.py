@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Cast Session Watchdog
+Checks that the Chromecast is still showing our page after a successful cast.
+Another app being cast, the receiver timing out to its idle screen, or the TV
+switching away from the Chromecast's HDMI input are noticed within one
+interval and reported to catt_monitor, which re-casts immediately. Each outage
+is recorded with its cause and how long it lasted.
+
+The input check relies on HDMI-CEC; TVs without it don't report the active
+input, and a switch away from our page there goes unnoticed. Re-casting
+takes the input back on CEC TVs, so an input switch is re-cast once per
+outage rather than on every check.
+
+The check reads the receiver status that the persistent CastController
+connection already keeps up to date, so a poll sends nothing to the device
+and can run every few seconds. It needs pychromecast; without it catt_monitor
+relies on the push channel's receiver-lost check.
+"""
+
+import json
+import logging
+import os
+import time
+from datetime import datetime
+
+from cast_controller import DASHCAST_APP_ID
+
+
+WATCHDOG_INTERVAL = 10        # Seconds between status checks while casting
+OUTAGE_LOG_FILE = '/var/www/html/cast_outages.json'
+MAX_OUTAGES_KEPT = 200
+
+
+def record_outage(path, outage):
+    """Append to the outage log (JSON list, newest last, capped)"""
+    try:
+        with open(path, 'r') as f:
+            outages = json.load(f)
+    except (OSError, ValueError):
+        outages = []
+    outages.append(outage)
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(outages[-MAX_OUTAGES_KEPT:], f, indent=2)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logging.warning("Could not write outage log %s: %s", path, e)
+
+
+class CastWatchdog:
+    """check() -> reason the receiver needs a re-cast, or None"""
+
+    def __init__(self, controller, name=None, interval=WATCHDOG_INTERVAL,
+                 outage_log=OUTAGE_LOG_FILE, expected_app=DASHCAST_APP_ID, clock=None):
+        self.controller = controller
+        self.name = name
+        self.interval = interval
+        self.outage_log = outage_log
+        self.expected_app = expected_app
+        self.clock = clock or time.monotonic
+        self.next_check = 0
+        self.outage = None     # open outage: {'started', 'since', 'cause', 'app'}
+        self.checks = 0
+
+    def due_in(self):
+        return max(0.0, self.next_check - self.clock())
+
+    def check(self, force=False):
+        """Poll the receiver if due; returns a reason string when it is not showing our page"""
+        now = self.clock()
+        if not force and now < self.next_check:
+            return None
+        self.next_check = now + self.interval
+        self.checks += 1
+
+        status = self.controller.status()
+        if status is None:
+            # Connection down - CastController reconnects on its own backoff;
+            # nothing to re-cast to until it is back
+            self._open('unreachable', None)
+            return None
+        if status['app_id'] == self.expected_app:
+            if status.get('is_active_input') is not False:
+                self._close()
+                return None
+            # Our page is still running but the TV is on another input
+            first = self.outage is None or self.outage['cause'] != 'input_switched'
+            self._open('input_switched', None)
+            return 'TV switched to another input' if first else None
+
+        if status['is_idle'] or not status['app_id']:
+            cause, reason = 'idle', 'receiver went to its idle screen'
+        else:
+            cause, reason = 'foreign_app', f"receiver is running {status['display_name'] or status['app_id']}"
+        self._open(cause, status['display_name'] or status['app_id'])
+        return reason
+
+    def _open(self, cause, app):
+        if self.outage is None:
+            self.outage = {'started': time.time(), 'since': self.clock(), 'cause': cause, 'app': app}
+            logging.warning("%s⚠️  Display outage: %s%s", self._prefix(), cause, f" ({app})" if app else '')
+        elif self.outage['cause'] != cause and cause != 'unreachable':
+            # Reconnected to find the wrong app, or the cause changed mid-outage -
+            # keep the start, record the latest cause
+            self.outage.update(cause=cause, app=app)
+
+    def _close(self, ended_by='restored'):
+        if self.outage is None:
+            return None
+        duration = self.clock() - self.outage['since']
+        entry = {
+            'device': self.name,
+            'cause': self.outage['cause'],
+            'app': self.outage['app'],
+            'started': datetime.fromtimestamp(self.outage['started']).isoformat(timespec='seconds'),
+            'duration_seconds': round(duration, 1),
+            # Measured from detection - it may have started up to one interval earlier
+            'check_interval': self.interval,
+            'ended_by': ended_by,
+        }
+        self.outage = None
+        logging.info("%s✓ Display %s after %.0f s outage (%s)", self._prefix(), ended_by, duration, entry['cause'])
+        if self.outage_log:
+            record_outage(self.outage_log, entry)
+        return entry
+
+    def reset(self):
+        """Casting stopped on purpose - close any open outage"""
+        self._close('stopped')
+        self.next_check = 0
+
+    def recast_done(self):
+        """A cast just went out - verify it on the next check"""
+        self.next_check = 0
+
+    def _prefix(self):
+        return f"[{self.name}] " if self.name else ''
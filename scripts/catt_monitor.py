@@ -7,31 +7,84 @@ UPDATED: Monitors file changes and re-casts only when content changes
 
 import json
 import subprocess
+import sys
 import time
 import socket
 import logging
-import re
 import hashlib
+import ipaddress
 from datetime import datetime
 from pathlib import Path
+from service_logging import setup_logging
+from file_watcher import FileWatcher
+from cast_controller import get_cast_controller
+from cast_discovery import DiscoveryCache
+from cast_watchdog import CastWatchdog
+from push_channel import PushChannel
+from display_schedule import DisplaySchedule, TIMELINE_FILE
 
 # Configuration
 TOURNAMENT_DATA_FILE = '/var/www/html/tournament_data.json'
 MEDIA_CONFIG_FILE = '/var/www/html/media/media_config.json'
 STATE_FILE = '/var/www/html/cast_state.json'
 LOG_FILE = '/var/log/catt_monitor.log'
-CHECK_INTERVAL = 15  # Check every 15 seconds
+CHECK_INTERVAL = 15  # Retry interval after a failed read / while a re-cast is in cooldown
+# Business hours, holidays and the early-start rule live in display_schedule.json;
+# the loop sleeps until the schedule's next on/off transition or a file event
+MAX_WAIT = 600          # Upper bound on one sleep (clock changes, missed events)
+# Minimum seconds between content re-casts, per change source. Changes inside
+# the window are merged and applied by one re-cast when it ends (only used when
+# the receiver has no push connection - pushed changes apply immediately)
+RECAST_COOLDOWN = {
+    'tournament': 600,
+    'media': 600,
+}
+RECAST_FILES = {'tournament': 'tournament_data.json', 'media': 'media_config.json'}
+RECEIVER_CHECK = 30     # Shorter sleep while casting, to notice a lost receiver page
 CATT_COMMAND = '/home/pi/.local/bin/catt'
+# True casts the pre-rendered image slideshow (render_frames.py + frames.html)
+# instead of index.php - for older Chromecasts that struggle with the live page
+CAST_FRAMES = False
+# In-process cast connection (needs pychromecast) - device by friendly name
+# (None = first found), or CAST_HOST to connect by IP without discovery
+CAST_DEVICE = None
+CAST_HOST = None
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler()
-    ]
-)
+# Set in main(); None means every command runs the catt CLI
+CONTROLLER = None
+
+# Chromecast addresses from one discovery, reused until DISCOVERY_TTL expires or
+# a cast to the cached address fails (cast_discovery.py). Set in main() unless
+# CAST_HOST pins the address.
+DISCOVERY_CACHE_FILE = '/home/pi/.cache/cast_discovery.json'
+DISCOVERY_TTL = 6 * 3600
+DISCOVERY = None
+
+# Fleet mode (cast_fleet.py): when this file exists, every Chromecast listed in
+# it is driven from this process with its own page, rules and state
+FLEET_CONFIG = str(Path(__file__).resolve().with_name('cast_devices.json'))
+
+# Push channel to the cast page (push_channel.py) - content changes are sent
+# as notices instead of re-casting. The cast URL carries PUSH_CLIENT so the
+# receiver's connection can be told apart from other browsers.
+PUSH_PORT = 8088
+PUSH_CLIENT = 'cast'
+RECEIVER_LOST_AFTER = 60   # Seconds without the receiver's connection before re-casting
+PUSH = None
+
+# DisplaySchedule, loaded on first use; its timeline is published for other services
+SCHEDULE = None
+
+# The Pi's IP is cached; it is looked up again only after a netlink
+# address/route/link event, or every IP_REFRESH_INTERVAL as a fallback
+IP_REFRESH_INTERVAL = 1800
+
+# rtnetlink multicast groups from <linux/rtnetlink.h>
+RTMGRP_LINK = 0x1
+RTMGRP_IPV4_IFADDR = 0x10
+RTMGRP_IPV4_ROUTE = 0x40
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
 
 def get_local_ip():
     """Get the local IP address of the Pi"""
@@ -42,9 +95,112 @@ def get_local_ip():
         s.close()
         return ip_address
     except Exception as e:
-        logging.error(f"Error getting IP address: {e}")
+        logging.error("Error getting IP address: %s", e)
         return None
 
+class LocalIPCache:
+    """get() -> (ip, changed) - the cached IP, re-resolved only after a network change"""
+    
+    def __init__(self, refresh_interval=IP_REFRESH_INTERVAL):
+        self.refresh_interval = refresh_interval
+        self.ip = None
+        self.resolved_at = 0
+        self.netlink = None
+        try:
+            self.netlink = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE)
+            self.netlink.bind((0, RTMGRP_LINK | RTMGRP_IPV4_IFADDR | RTMGRP_IPV4_ROUTE))
+            self.netlink.setblocking(False)
+        except (AttributeError, OSError) as e:
+            logging.info("Netlink unavailable (%s) - re-checking the IP every %d s", e, refresh_interval)
+            self.netlink = None
+    
+    def _network_changed(self):
+        """Drain pending netlink notifications; True if there were any"""
+        if not self.netlink:
+            return False
+        events = 0
+        while True:
+            try:
+                if not self.netlink.recv(65536):
+                    break
+                events += 1
+            except BlockingIOError:
+                break
+            except OSError as e:
+                # ENOBUFS: notifications were dropped - treat as a change
+                logging.debug("Netlink read error: %s", e)
+                events += 1
+                break
+        if events:
+            logging.debug("Network change: %d netlink event(s)", events)
+        return events > 0
+    
+    def get(self):
+        stale = time.monotonic() - self.resolved_at > self.refresh_interval
+        if self.ip is not None and not self._network_changed() and not stale:
+            return self.ip, False
+        
+        ip_address = get_local_ip()
+        self.resolved_at = time.monotonic()
+        if not ip_address:
+            # Keep the last known address; try again on the next event/loop
+            self.resolved_at = 0
+            return self.ip, False
+        
+        changed = self.ip is not None and ip_address != self.ip
+        if changed:
+            logging.info("🌐 Local IP changed: %s -> %s", self.ip, ip_address)
+        self.ip = ip_address
+        return ip_address, changed
+
+class ChangeDebouncer:
+    """Trailing-edge coalescing of content changes between re-casts
+
+    note(source) records a change; due_in() is the time until one re-cast
+    should apply everything pending - each source may re-cast again once its
+    interval has passed since the last re-cast.
+    """
+    
+    def __init__(self, intervals, clock=None):
+        self.intervals = dict(intervals)
+        self.clock = clock or time.monotonic
+        self.last_applied = None
+        self.pending = {}   # source -> {'count', 'first'}
+    
+    def note(self, source):
+        entry = self.pending.setdefault(source, {'count': 0, 'first': self.clock()})
+        entry['count'] += 1
+        return entry['count']
+    
+    def due_in(self):
+        """Seconds until the pending changes should be applied (0 = now), None if nothing pending"""
+        if not self.pending:
+            return None
+        if self.last_applied is None:
+            return 0
+        now = self.clock()
+        return max(0, min(self.last_applied + self.intervals.get(source, 0) - now for source in self.pending))
+    
+    def summary(self):
+        """({source: merged change count}, seconds the oldest pending change has waited)"""
+        now = self.clock()
+        counts = {source: entry['count'] for source, entry in self.pending.items()}
+        staleness = max((now - entry['first'] for entry in self.pending.values()), default=0)
+        return counts, staleness
+    
+    def applied(self, at=None):
+        """A cast went out with the newest content - starts a new cooldown"""
+        self.last_applied = self.clock() if at is None else at
+        self.pending.clear()
+    
+    def retain(self, sources):
+        """Drop pending sources whose content is back to what is on screen"""
+        for source in set(self.pending) - set(sources):
+            del self.pending[source]
+    
+    def clear(self):
+        self.pending.clear()
+
 def get_file_hash(filepath):
     """Get MD5 hash of file contents"""
     try:
@@ -53,46 +209,15 @@ def get_file_hash(filepath):
         with open(filepath, 'rb') as f:
             return hashlib.md5(f.read()).hexdigest()
     except Exception as e:
-        logging.error(f"Error hashing file {filepath}: {e}")
+        logging.error("Error hashing file %s: %s", filepath, e)
         return None
 
-def is_business_hours():
-    """Check if current time is within business hours"""
-    try:
-        now = datetime.now()
-        day = now.isoweekday()  # 1=Mon, 7=Sun
-        hour = now.hour
-        minute = now.minute
-        current_minutes = hour * 60 + minute
-        
-        # Business hours in minutes since midnight
-        if day == 7:  # Sunday: 12pm - Monday 1am (next day)
-            return current_minutes >= 720  # After 12:00pm
-        elif day == 1:  # Monday: Closes 1am, Opens 3pm - Tuesday 1am
-            if current_minutes < 60:  # Before 1:00am (from Sunday)
-                return True
-            elif current_minutes >= 900:  # After 3:00pm
-                return True
-        elif day in [2, 3, 4]:  # Tuesday-Thursday: Closes 1am, Opens 12pm - 1am
-            if current_minutes < 60:  # Before 1:00am (from previous day)
-                return True
-            elif current_minutes >= 720:  # After 12:00pm
-                return True
-        elif day == 5:  # Friday: Closes 1am, Opens 12pm - Saturday 2:30am
-            if current_minutes < 60:  # Before 1:00am (from Thursday)
-                return True
-            elif current_minutes >= 720:  # After 12:00pm
-                return True
-        elif day == 6:  # Saturday: Closes 2:30am, Opens 12pm - Sunday 2:30am
-            if current_minutes < 150:  # Before 2:30am (from Friday)
-                return True
-            elif current_minutes >= 720:  # After 12:00pm
-                return True
-        
-        return False
-    except Exception as e:
-        logging.error(f"Error checking business hours: {e}")
-        return False
+def get_schedule():
+    """The shared DisplaySchedule (display_schedule.json)"""
+    global SCHEDULE
+    if SCHEDULE is None:
+        SCHEDULE = DisplaySchedule(timeline_file=TIMELINE_FILE)
+    return SCHEDULE
 
 def load_tournament_data():
     """Load tournament data from JSON file"""
@@ -102,7 +227,7 @@ def load_tournament_data():
                 return json.load(f)
         return None
     except Exception as e:
-        logging.error(f"Error loading tournament data: {e}")
+        logging.error("Error loading tournament data: %s", e)
         return None
 
 def load_cast_state():
@@ -116,16 +241,18 @@ def load_cast_state():
             'last_tournament_url': None,
             'cast_started_at': None,
             'tournament_data_hash': None,
-            'media_config_hash': None
+            'media_config_hash': None,
+            'cast_url': None
         }
     except Exception as e:
-        logging.error(f"Error loading cast state: {e}")
+        logging.error("Error loading cast state: %s", e)
         return {
             'is_casting_tournament': False,
             'last_tournament_url': None,
             'cast_started_at': None,
             'tournament_data_hash': None,
-            'media_config_hash': None
+            'media_config_hash': None,
+            'cast_url': None
         }
 
 def save_cast_state(state):
@@ -135,129 +262,121 @@ def save_cast_state(state):
             json.dump(state, f, indent=2)
         return True
     except Exception as e:
-        logging.error(f"Error saving cast state: {e}")
+        logging.error("Error saving cast state: %s", e)
         return False
 
-def catt_stop():
-    """Stop current CATT cast"""
+def _is_address(device):
+    try:
+        ipaddress.ip_address(device or '')
+        return True
+    except ValueError:
+        return False
+
+def _run_catt(device, args, timeout):
+    """Run catt against a device - by its cached address when known, so catt
+    skips its own discovery; a failure there triggers one rediscovery + retry"""
+    name = device or CAST_DEVICE
+    address = DISCOVERY.resolve(name) if DISCOVERY and not _is_address(name) else None
+    target = address[0] if address else name
+    command = [CATT_COMMAND] + (['-d', target] if target else []) + args
     try:
+        result = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        if address:
+            DISCOVERY.invalidate(name)
+        raise
+    if result.returncode != 0 and address:
+        # The device may have moved to a new address
+        DISCOVERY.invalidate(name)
+        retry = DISCOVERY.resolve(name)
+        if retry and retry != address:
+            logging.info("Retrying with rediscovered address %s", retry[0])
+            command = [CATT_COMMAND, '-d', retry[0]] + args
+            result = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+    return result
+
+def _controller_for(device, controller):
+    # Single-device mode uses the global controller; fleet devices pass their own
+    return CONTROLLER if device is None and controller is None else controller
+
+def catt_stop(device=None, controller=None):
+    """Stop current CATT cast"""
+    controller = _controller_for(device, controller)
+    if controller:
         logging.info("Stopping current cast...")
-        result = subprocess.run(
-            [CATT_COMMAND, 'stop'],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
+        return controller.stop()
+    try:
+        logging.info("Stopping current cast%s...", f" on {device}" if device else '')
+        result = _run_catt(device, ['stop'], timeout=10)
         
         if result.returncode == 0:
             logging.info("Cast stopped successfully")
             return True
         else:
-            logging.warning(f"CATT stop returned non-zero: {result.stderr}")
+            logging.warning("CATT stop returned non-zero: %s", result.stderr)
             return False
     except Exception as e:
-        logging.error(f"Error stopping cast: {e}")
+        logging.error("Error stopping cast: %s", e)
         return False
 
-def catt_cast_site(url):
+def catt_cast_site(url, device=None, controller=None):
     """Cast a website using CATT"""
+    controller = _controller_for(device, controller)
+    if controller:
+        return controller.cast_site(url)
     try:
-        logging.info(f"Casting site: {url}")
-        result = subprocess.run(
-            [CATT_COMMAND, 'cast_site', url],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        logging.info("Casting site%s: %s", f" on {device}" if device else '', url)
+        result = _run_catt(device, ['cast_site', url], timeout=30)
         
         if result.returncode == 0:
             logging.info("Site cast successfully")
             return True
         else:
-            logging.warning(f"CATT cast returned non-zero: {result.stderr}")
+            logging.warning("CATT cast returned non-zero: %s", result.stderr)
             return False
     except Exception as e:
-        logging.error(f"Error casting site: {e}")
+        logging.error("Error casting site: %s", e)
         return False
 
-def parse_start_time(start_time_str):
-    """Parse start time string like '7:00 PM' to minutes since midnight"""
+def recast(cast_url, device=None, controller=None, client=PUSH_CLIENT):
+    """Cast the page again (stop + pause first when using the catt CLI)"""
+    if not _controller_for(device, controller):
+        catt_stop(device)
+        time.sleep(1)
+    if PUSH:
+        # The new page has to connect before the receiver can count as lost again
+        PUSH.forget(client)
+    return catt_cast_site(cast_url, device, controller)
+
+def is_scheduled_on(tournament_data, schedule=None):
+    """Business hours or the 1-hour early start - one lookup in the precomputed timeline"""
     try:
-        if not start_time_str:
-            return None
-        
-        # Extract hour and minute
-        match = re.search(r'(\d+):?(\d+)?\s*(AM|PM)', start_time_str, re.IGNORECASE)
-        if not match:
-            return None
-        
-        hour = int(match.group(1))
-        minute = int(match.group(2)) if match.group(2) else 0
-        meridiem = match.group(3).upper()
-        
-        # Convert to 24-hour format
-        if meridiem == 'PM' and hour != 12:
-            hour += 12
-        elif meridiem == 'AM' and hour == 12:
-            hour = 0
-        
-        return hour * 60 + minute
+        on, reason, _ = (schedule or get_schedule()).state(datetime.now(), tournament_data)
+        if on:
+            logging.debug("Schedule: on (%s)", reason)
+        return on
     except Exception as e:
-        logging.error(f"Error parsing start time '{start_time_str}': {e}")
-        return None
+        logging.error("Error checking display schedule: %s", e)
+        return False
 
-def should_start_early_for_tournament(tournament_data):
-    """Check if we should start casting 1 hour before tournament"""
+def next_wait(tournament_data, casting, show='tournament', schedule=None):
+    """Seconds to sleep: until the next schedule transition, capped"""
+    limit = RECEIVER_CHECK if casting and PUSH else MAX_WAIT
+    if show == 'always':
+        return limit
     try:
-        # Check if tournament is today
-        tournament_date = tournament_data.get('date')
-        if not tournament_date:
-            return False
-        
-        today = datetime.now().strftime('%Y/%m/%d')
-        if tournament_date != today:
-            return False
-        
-        # Check if tournament has a start time
-        start_time_str = tournament_data.get('start_time')
-        if not start_time_str:
-            return False
-        
-        # Parse start time
-        tournament_start = parse_start_time(start_time_str)
-        if tournament_start is None:
-            return False
-        
-        # Get current time in minutes
-        now = datetime.now()
-        current_minutes = now.hour * 60 + now.minute
-        
-        # Check if we're within 1 hour before tournament start
-        early_start = tournament_start - 60
-        
-        if current_minutes >= early_start and current_minutes < tournament_start:
-            return True
-        
-        return False
-        
+        seconds = (schedule or get_schedule()).seconds_until_change(datetime.now(), tournament_data)
     except Exception as e:
-        logging.error(f"Error checking early start: {e}")
-        return False
+        logging.error("Error reading display schedule: %s", e)
+        return CHECK_INTERVAL
+    if seconds is None:
+        return limit
+    # +1 s so the wake-up lands just after the transition, not just before it
+    return min(seconds + 1, limit)
 
-def should_display_tournament(tournament_data):
-    """
-    Determine if tournament should be displayed
-    Includes: 1-hour early start, active tournaments, OR business hours
-    """
+def tournament_active(tournament_data):
+    """Tournament marked for display and In Progress / Upcoming"""
     try:
-        # Check for early start (1 hour before tournament)
-        if should_start_early_for_tournament(tournament_data):
-            return True
-        
-        # Check business hours - always cast during business hours
-        if is_business_hours():
-            return True
-        
         # Check for active tournament display
         should_display = tournament_data.get('display_tournament', False)
         
@@ -276,27 +395,92 @@ def should_display_tournament(tournament_data):
         return should_display
         
     except Exception as e:
-        logging.error(f"Error checking display status: {e}")
+        logging.error("Error checking display status: %s", e)
         return False
 
+def should_display_tournament(tournament_data, show='tournament', schedule=None):
+    """
+    Determine if tournament should be displayed - the one display rule, also
+    used per device by cast_fleet.py
+    show: 'tournament' - 1-hour early start, business hours OR an active tournament
+          'schedule'   - early start / business hours only
+          'always'
+    schedule: a device's own DisplaySchedule (default: display_schedule.json)
+    """
+    if show == 'always':
+        return True
+    # Early start (1 hour before tournament) or business hours -
+    # always cast then (display_schedule.json)
+    scheduled = is_scheduled_on(tournament_data, schedule)
+    if scheduled or show == 'schedule':
+        return scheduled
+    return bool(tournament_data) and tournament_active(tournament_data)
+
 def monitor_and_cast():
-    """Main monitoring and casting logic - re-casts only on file changes"""
+    """Main monitoring and casting logic - pushes file changes, re-casts only when needed"""
     logging.info("=" * 60)
-    logging.info("CATT Monitor Starting - File change monitoring")
+    logging.info("CATT Monitor Starting - File change monitoring (inotify)")
     logging.info("Casts during: Business hours OR Tournament active")
-    logging.info("Re-casts only when tournament_data.json or media_config.json changes")
+    logging.info("Content changes are pushed to the cast page; re-casts only when the receiver is lost")
     logging.info("=" * 60)
     
     state = load_cast_state()
     
+    # Files are re-read and re-hashed only when the watcher reports a change;
+    # between changes the loop just re-checks the clock-based display rules
+    watched_files = {TOURNAMENT_DATA_FILE, MEDIA_CONFIG_FILE}
+    watcher = FileWatcher(watched_files)
+    logging.info("Watching %s (%s)", ', '.join(sorted(watched_files)), watcher.mode)
+    
+    ip_cache = LocalIPCache()
+    # A network change also ends the sleep, so a new IP is re-cast right away
+    wake_fds = [ip_cache.netlink] if ip_cache.netlink else []
+    
+    try:
+        on, reason, next_change = get_schedule().state(datetime.now())
+        logging.info("Schedule: display %s%s, next change %s", 'on' if on else 'off',
+                     f" ({reason})" if reason else '', next_change or 'beyond the timeline')
+    except Exception as e:
+        logging.error("Error reading display schedule: %s", e)
+    
+    debouncer = ChangeDebouncer(RECAST_COOLDOWN)
+    # Receiver status checks while casting - needs the persistent connection
+    watchdog = CastWatchdog(CONTROLLER) if CONTROLLER else None
+    if watchdog:
+        logging.info("Watchdog: checking the receiver every %d s while casting", watchdog.interval)
+    if state.get('cast_started_at'):
+        # Carry the cooldown of a cast made before a restart
+        age = (datetime.now() - datetime.fromisoformat(state['cast_started_at'])).total_seconds()
+        debouncer.applied(time.monotonic() - max(age, 0))
+    
+    changed = set(watched_files)
+    tournament_data = None
+    current_tournament_hash = None
+    current_media_hash = None
+    
     while True:
         try:
-            # Load current tournament data
-            tournament_data = load_tournament_data()
+            # Sources whose content differs from the last read
+            fresh = set()
+            if TOURNAMENT_DATA_FILE in changed:
+                tournament_data = load_tournament_data()
+                new_hash = get_file_hash(TOURNAMENT_DATA_FILE)
+                if new_hash != current_tournament_hash:
+                    fresh.add('tournament')
+                current_tournament_hash = new_hash
+            if MEDIA_CONFIG_FILE in changed:
+                new_hash = get_file_hash(MEDIA_CONFIG_FILE)
+                if new_hash != current_media_hash:
+                    fresh.add('media')
+                current_media_hash = new_hash
+            if changed:
+                logging.debug("Re-read: %s", ', '.join(sorted(changed)))
+            changed = set()
             
             if not tournament_data:
                 logging.debug("No tournament data found")
-                time.sleep(CHECK_INTERVAL)
+                # Keep retrying the read in case it caught a half-written file
+                changed = watcher.wait(CHECK_INTERVAL) | {TOURNAMENT_DATA_FILE}
                 continue
             
             # Get tournament info
@@ -306,36 +490,42 @@ def monitor_and_cast():
             player_count = tournament_data.get('player_count', 0)
             should_display = should_display_tournament(tournament_data)
             
-            # Get file hashes to detect changes
-            current_tournament_hash = get_file_hash(TOURNAMENT_DATA_FILE)
-            current_media_hash = get_file_hash(MEDIA_CONFIG_FILE)
-            
-            logging.debug(f"Tournament: {tournament_name}")
-            logging.debug(f"  Status: {status}, Players: {player_count}, Should Display: {should_display}")
+            logging.debug("Tournament: %s", tournament_name)
+            logging.debug("  Status: %s, Players: %s, Should Display: %s", status, player_count, should_display)
             
-            # Get local IP for casting
-            local_ip = get_local_ip()
+            # Get local IP for casting (cached - see LocalIPCache)
+            local_ip, _ = ip_cache.get()
             if not local_ip:
                 logging.error("Could not determine local IP address")
-                time.sleep(CHECK_INTERVAL)
+                changed = watcher.wait(CHECK_INTERVAL)
                 continue
             
-            cast_url = f"http://{local_ip}/"
+            page = 'frames.html' if CAST_FRAMES else ''
+            cast_url = f"http://{local_ip}/{page}?receiver={PUSH_CLIENT}"
             
             # SCENARIO 1: Tournament should be displayed and we're not casting yet
             if should_display and not state['is_casting_tournament']:
-                logging.info(f"🎱 Tournament ready to display")
-                logging.info(f"   Name: {tournament_name}")
-                logging.info(f"   Status: {status}")
-                logging.info(f"   Players: {player_count}")
+                logging.info("🎱 Tournament ready to display")
+                logging.info("   Name: %s", tournament_name)
+                logging.info("   Status: %s", status)
+                logging.info("   Players: %s", player_count)
                 
-                catt_stop()
-                time.sleep(2)
+                # DashCast replaces whatever is running, so the persistent
+                # controller needs no stop/pause first
+                if not CONTROLLER:
+                    catt_stop()
+                    time.sleep(2)
                 
+                if PUSH:
+                    PUSH.forget(PUSH_CLIENT)
                 if catt_cast_site(cast_url):
+                    debouncer.applied()
+                    if watchdog:
+                        watchdog.recast_done()
                     state['is_casting_tournament'] = True
                     state['last_tournament_url'] = tournament_url
                     state['cast_started_at'] = datetime.now().isoformat()
+                    state['cast_url'] = cast_url
                     state['tournament_data_hash'] = current_tournament_hash
                     state['media_config_hash'] = current_media_hash
                     save_cast_state(state)
@@ -345,63 +535,157 @@ def monitor_and_cast():
             elif should_display and state['is_casting_tournament']:
                 tournament_changed = (current_tournament_hash != state.get('tournament_data_hash'))
                 media_changed = (current_media_hash != state.get('media_config_hash'))
+                differing = {n for n, c in [('tournament', tournament_changed), ('media', media_changed)] if c}
+                debouncer.retain(differing)
+                # New IP - the receiver's page points at an address that is gone
+                url_changed = bool(state.get('cast_url')) and state['cast_url'] != cast_url
+                # The cast page holds a push connection; gone for a while = session lost
+                gone_for = PUSH.disconnected_for(PUSH_CLIENT) if PUSH else None
+                receiver_lost = gone_for is not None and gone_for > RECEIVER_LOST_AFTER
+                # Someone switched the TV to another app, or it fell back to idle
+                watchdog_reason = watchdog.check() if watchdog else None
                 
-                if tournament_changed or media_changed:
-                    # Add cooldown - wait at least 10 minutes between recasts
-                    if state.get('cast_started_at'):
-                        last_cast = datetime.fromisoformat(state['cast_started_at'])
-                        minutes_since_cast = (datetime.now() - last_cast).total_seconds() / 60
-                        
-                        if minutes_since_cast < 10:  # 10 minute cooldown
-                            logging.info(f"⏸️  Files changed but in cooldown period ({minutes_since_cast:.1f} min since last cast)")
-                            time.sleep(CHECK_INTERVAL)
-                            continue
-                    
+                if url_changed or receiver_lost or watchdog_reason:
                     change_reasons = []
-                    if tournament_changed:
-                        change_reasons.append("tournament_data.json changed")
-                    if media_changed:
-                        change_reasons.append("media_config.json changed")
-                    
-                    logging.info(f"🔄 Content changed: {', '.join(change_reasons)}")
-                    logging.info("   Re-casting to update display...")
+                    if url_changed:
+                        change_reasons.append(f"local IP changed ({state['cast_url']} -> {cast_url})")
+                    if receiver_lost:
+                        change_reasons.append(f"receiver page gone for {gone_for:.0f}s")
+                    if watchdog_reason:
+                        change_reasons.append(watchdog_reason)
                     
-                    catt_stop()
-                    time.sleep(1)
-                    
-                    if catt_cast_site(cast_url):
+                    logging.info("🔄 Receiver needs a fresh cast: %s", ', '.join(change_reasons))
+                    if recast(cast_url):
+                        debouncer.applied()
+                        if watchdog:
+                            watchdog.recast_done()
                         state['cast_started_at'] = datetime.now().isoformat()  # Update cast time
+                        state['cast_url'] = cast_url
                         state['tournament_data_hash'] = current_tournament_hash
                         state['media_config_hash'] = current_media_hash
                         save_cast_state(state)
-                        logging.info("✓ Re-cast successful - display updated")
+                        logging.info("✓ Re-cast successful - display restored")
                     else:
                         logging.error("✗ Re-cast failed - will retry next cycle")
+                
+                elif (tournament_changed or media_changed) and CAST_FRAMES:
+                    # frames.html re-reads its manifest, so new renders show without a re-cast
+                    logging.info("Content changed - slideshow picks up the new frames")
+                    debouncer.clear()
+                    state['tournament_data_hash'] = current_tournament_hash
+                    state['media_config_hash'] = current_media_hash
+                    save_cast_state(state)
+                
+                elif (tournament_changed or media_changed) and PUSH and PUSH.connected(PUSH_CLIENT):
+                    # The page applies the notice itself - no re-cast, no cooldown
+                    if tournament_changed:
+                        PUSH.publish('data', {'hash': current_tournament_hash})
+                    if media_changed:
+                        PUSH.publish('media', {'hash': current_media_hash})
+                    logging.info("📨 Pushed %s change to the receiver", ' + '.join(sorted(differing)))
+                    debouncer.clear()
+                    state['tournament_data_hash'] = current_tournament_hash
+                    state['media_config_hash'] = current_media_hash
+                    save_cast_state(state)
+                
+                elif tournament_changed or media_changed:
+                    # No push connection from the receiver (older page) - re-cast,
+                    # merging everything that changes during the cooldown into one
+                    for source in differing:
+                        # A difference with nothing pending (e.g. after a restart) counts once
+                        if source in fresh or source not in debouncer.pending:
+                            debouncer.note(source)
+                    
+                    due_in = debouncer.due_in()
+                    if due_in:
+                        if fresh & differing:
+                            logging.info("⏸️  %s changed - merged into the re-cast in %.1f s",
+                                         ' + '.join(sorted(fresh & differing)), due_in)
+                    else:
+                        counts, staleness = debouncer.summary()
+                        change_reasons = [f"{RECAST_FILES[source]} changed x{count}"
+                                          for source, count in sorted(counts.items())]
+                        logging.info("🔄 Content changed: %s", ', '.join(change_reasons))
+                        logging.info("   Re-casting to update display (merged %d change(s), oldest waited %.0f s)...",
+                                     sum(counts.values()), staleness)
+                        
+                        if recast(cast_url):
+                            debouncer.applied()
+                            if watchdog:
+                                watchdog.recast_done()
+                            state['cast_started_at'] = datetime.now().isoformat()  # Update cast time
+                            state['cast_url'] = cast_url
+                            state['tournament_data_hash'] = current_tournament_hash
+                            state['media_config_hash'] = current_media_hash
+                            save_cast_state(state)
+                            logging.info("✓ Re-cast successful - display updated")
+                        else:
+                            logging.error("✗ Re-cast failed - will retry next cycle")
+                            changed = watcher.wait(CHECK_INTERVAL, wake_fds)
+                            continue
             
             # SCENARIO 3: Tournament no longer should be displayed
             elif not should_display and state['is_casting_tournament']:
                 logging.info("Tournament no longer should be displayed - Stopping cast")
                 catt_stop()
+                debouncer.clear()
+                if watchdog:
+                    watchdog.reset()
                 state['is_casting_tournament'] = False
                 state['last_tournament_url'] = None
                 state['cast_started_at'] = None
+                state['cast_url'] = None
                 state['tournament_data_hash'] = None
                 state['media_config_hash'] = None
                 save_cast_state(state)
             
-            time.sleep(CHECK_INTERVAL)
+            timeout = next_wait(tournament_data, state['is_casting_tournament'])
+            due_in = debouncer.due_in()
+            if due_in is not None:
+                # Wake when the cooldown ends to apply the merged changes
+                timeout = min(timeout, max(due_in, 1))
+            if watchdog and state['is_casting_tournament']:
+                timeout = min(timeout, max(watchdog.due_in(), 0.1))
+            changed = watcher.wait(timeout, wake_fds)
             
         except KeyboardInterrupt:
             logging.info("Monitor stopped by user")
             break
         except Exception as e:
-            logging.error(f"Error in monitor loop: {e}")
+            logging.error("Error in monitor loop: %s", e)
             import traceback
             traceback.print_exc()
             time.sleep(CHECK_INTERVAL)
+            changed = set(watched_files)
 
 def main():
-    monitor_and_cast()
+    global CONTROLLER, PUSH, DISCOVERY
+    setup_logging(LOG_FILE, fmt=LOG_FORMAT, datefmt=None)
+    if not CAST_HOST:
+        DISCOVERY = DiscoveryCache(DISCOVERY_CACHE_FILE, DISCOVERY_TTL, CATT_COMMAND)
+    fleet = None
+    if Path(FLEET_CONFIG).exists():
+        # cast_fleet imports this module by name - make that this instance
+        # rather than a second copy when run as a script
+        sys.modules.setdefault('catt_monitor', sys.modules[__name__])
+        from cast_fleet import load_devices
+        fleet = load_devices(FLEET_CONFIG)
+    else:
+        CONTROLLER = get_cast_controller(CAST_DEVICE, CAST_HOST, discovery=DISCOVERY)
+    PUSH = PushChannel(PUSH_PORT)
+    if not PUSH.start():
+        PUSH = None
+    try:
+        if fleet:
+            from cast_fleet import monitor_fleet
+            monitor_fleet(fleet)
+        else:
+            monitor_and_cast()
+    finally:
+        if CONTROLLER:
+            CONTROLLER.disconnect()
+        if PUSH:
+            PUSH.stop()
 
 if __name__ == '__main__':
     main()
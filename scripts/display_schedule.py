@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Display Schedule
+Business hours, holiday overrides and the tournament early-start rule, loaded
+from display_schedule.json and precomputed into a sorted timeline of on/off
+windows. Lookups are a bisect over that timeline, and callers can sleep until
+the next transition instead of re-checking the clock.
+
+Used by catt_monitor.py (import) and hdmi_display_manager.sh (CLI):
+
+    python3 display_schedule.py status      # "on 5400 business_hours", exit 0 if on, 1 if off
+    python3 display_schedule.py timeline [--hours 48] [--tournament FILE] [--write FILE]
+"""
+
+import argparse
+import bisect
+import json
+import logging
+import os
+import re
+import sys
+from datetime import datetime, timedelta
+
+
+SCHEDULE_FILE = os.environ.get(
+    'DISPLAY_SCHEDULE', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'display_schedule.json'))
+TIMELINE_FILE = '/var/www/html/display_timeline.json'
+
+DAY_KEYS = ['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']
+HORIZON_DAYS = 7          # Timeline is rebuilt once "now" passes its end
+DEFAULT_EARLY_START = 60  # Minutes before a tournament's start time
+
+WINDOW_RE = re.compile(r'^\s*(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})\s*$')
+
+# Used when display_schedule.json is missing or unusable (same hours as the shipped file)
+DEFAULT_CONFIG = {
+    'early_start_minutes': DEFAULT_EARLY_START,
+    'business_hours': {
+        'mon': ['15:00-25:00'],
+        'tue': ['12:00-25:00'],
+        'wed': ['12:00-25:00'],
+        'thu': ['12:00-25:00'],
+        'fri': ['12:00-26:30'],
+        'sat': ['12:00-24:00'],
+        'sun': ['12:00-25:00'],
+    },
+    'holidays': {},
+}
+
+
+def validate_config(config):
+    """Raise ValueError unless every window in the config parses"""
+    if not isinstance(config, dict):
+        raise ValueError("schedule must be a JSON object")
+    hours = config.get('business_hours', {})
+    holidays = config.get('holidays', {})
+    if not isinstance(hours, dict) or not isinstance(holidays, dict):
+        raise ValueError("business_hours and holidays must be objects")
+    for windows in list(hours.values()) + list(holidays.values()):
+        if not isinstance(windows, list):
+            raise ValueError(f"Expected a list of windows, got {windows!r}")
+        for text in windows:
+            _window(datetime(2000, 1, 1), str(text))
+    int(config.get('early_start_minutes', DEFAULT_EARLY_START))
+    return config
+
+
+def load_config(path=SCHEDULE_FILE):
+    """The schedule from path, or DEFAULT_CONFIG (with a warning) if it can't be used"""
+    try:
+        with open(path, 'r') as f:
+            return validate_config(json.load(f))
+    except (OSError, ValueError, TypeError) as e:
+        logging.warning("Display schedule %s unusable (%s) - using the built-in default hours", path, e)
+        return json.loads(json.dumps(DEFAULT_CONFIG))
+
+
+def parse_start_time(start_time_str):
+    """Parse start time string like '7:00 PM' to minutes since midnight"""
+    try:
+        if not start_time_str:
+            return None
+
+        match = re.search(r'(\d+):?(\d+)?\s*(AM|PM)', start_time_str, re.IGNORECASE)
+        if not match:
+            return None
+
+        hour = int(match.group(1))
+        minute = int(match.group(2)) if match.group(2) else 0
+        meridiem = match.group(3).upper()
+
+        if meridiem == 'PM' and hour != 12:
+            hour += 12
+        elif meridiem == 'AM' and hour == 12:
+            hour = 0
+
+        return hour * 60 + minute
+    except Exception as e:
+        logging.error("Error parsing start time '%s': %s", start_time_str, e)
+        return None
+
+
+def _window(day, text):
+    """'12:00-26:30' on a date -> (start, end) datetimes; an end past 24:00 is next day"""
+    match = WINDOW_RE.match(text)
+    if not match:
+        raise ValueError(f"Bad schedule window '{text}' (expected HH:MM-HH:MM)")
+    start_h, start_m, end_h, end_m = map(int, match.groups())
+    midnight = datetime(day.year, day.month, day.day)
+    start = midnight + timedelta(hours=start_h, minutes=start_m)
+    end = midnight + timedelta(hours=end_h, minutes=end_m)
+    if end <= start:
+        end += timedelta(days=1)
+    return start, end
+
+
+class DisplaySchedule:
+    """state(now, tournament) -> (on, reason, next_transition) from a precomputed timeline"""
+
+    def __init__(self, config=None, horizon_days=HORIZON_DAYS, timeline_file=None):
+        self.config = config if config is not None else load_config()
+        self.horizon_days = horizon_days
+        self.timeline_file = timeline_file   # Re-written on every rebuild when set
+        self.early_start = timedelta(minutes=self.config.get('early_start_minutes', DEFAULT_EARLY_START))
+        self.intervals = []   # merged (start, end, reason), sorted
+        self.starts = []
+        self.valid_from = None
+        self.valid_until = None
+        self.tournament_key = None
+
+    def opening_windows(self, day):
+        """Windows opening on this date - a holiday entry replaces the weekday hours"""
+        holidays = self.config.get('holidays', {})
+        for key in (day.strftime('%Y-%m-%d'), day.strftime('%m-%d')):
+            if key in holidays:
+                return holidays[key]
+        return self.config.get('business_hours', {}).get(DAY_KEYS[day.weekday()], [])
+
+    @staticmethod
+    def early_start_key(tournament):
+        if not tournament:
+            return None
+        return (tournament.get('date'), tournament.get('start_time'))
+
+    def early_start_window(self, tournament):
+        """[start - early_start, start) on the tournament's date, or None"""
+        date_str, start_time = self.early_start_key(tournament) or (None, None)
+        start_minutes = parse_start_time(start_time)
+        if not date_str or start_minutes is None:
+            return None
+        try:
+            day = datetime.strptime(date_str, '%Y/%m/%d')
+        except ValueError:
+            return None
+        start = day + timedelta(minutes=start_minutes)
+        return start - self.early_start, start, 'early_start'
+
+    def build(self, now, tournament=None):
+        """Precompute merged on-windows from yesterday to horizon_days ahead"""
+        today = now.date()
+        windows = []
+        # Yesterday's late windows can still be open this morning
+        for offset in range(-1, self.horizon_days + 1):
+            day = today + timedelta(days=offset)
+            for text in self.opening_windows(day):
+                start, end = _window(day, text)
+                windows.append((start, end, 'business_hours'))
+
+        early = self.early_start_window(tournament)
+        if early:
+            windows.append(early)
+
+        windows.sort()
+        merged = []
+        for start, end, reason in windows:
+            if merged and start <= merged[-1][1]:
+                last_start, last_end, last_reason = merged[-1]
+                merged[-1] = (last_start, max(last_end, end), last_reason)
+            else:
+                merged.append((start, end, reason))
+
+        self.intervals = merged
+        self.starts = [start for start, _, _ in merged]
+        self.valid_from = datetime(today.year, today.month, today.day)
+        self.valid_until = self.valid_from + timedelta(days=self.horizon_days)
+        self.tournament_key = self.early_start_key(tournament)
+        logging.debug("Display timeline rebuilt: %d window(s) until %s", len(merged), self.valid_until)
+        if self.timeline_file:
+            self.write_timeline(self.timeline_file, now, self.horizon_days * 24, tournament)
+
+    def _ensure(self, now, tournament):
+        if (self.valid_from is None or not self.valid_from <= now < self.valid_until
+                or self.early_start_key(tournament) != self.tournament_key):
+            self.build(now, tournament)
+            return True
+        return False
+
+    def state(self, now=None, tournament=None):
+        """(on, reason, next_transition) - next_transition is None past the horizon"""
+        now = now or datetime.now()
+        self._ensure(now, tournament)
+        index = bisect.bisect_right(self.starts, now) - 1
+        if index >= 0:
+            start, end, reason = self.intervals[index]
+            if now < end:
+                return True, reason, end
+        following = index + 1
+        next_start = self.intervals[following][0] if following < len(self.intervals) else None
+        return False, None, next_start
+
+    def is_on(self, now=None, tournament=None):
+        return self.state(now, tournament)[0]
+
+    def seconds_until_change(self, now=None, tournament=None):
+        now = now or datetime.now()
+        next_change = self.state(now, tournament)[2]
+        return None if next_change is None else max(0.0, (next_change - now).total_seconds())
+
+    def timeline(self, now=None, hours=48, tournament=None):
+        """Windows and on/off transitions from now, for other services"""
+        now = now or datetime.now()
+        self._ensure(now, tournament)
+        until = now + timedelta(hours=hours)
+        windows = [(s, e, r) for s, e, r in self.intervals if e > now and s < until]
+        transitions = []
+        for start, end, reason in windows:
+            if start > now:
+                transitions.append({'at': start.isoformat(timespec='minutes'), 'on': True, 'reason': reason})
+            if end <= until:
+                transitions.append({'at': end.isoformat(timespec='minutes'), 'on': False, 'reason': reason})
+        on, reason, _ = self.state(now, tournament)
+        return {
+            'generated': now.isoformat(timespec='seconds'),
+            'on': on,
+            'reason': reason,
+            'early_start_minutes': int(self.early_start.total_seconds() // 60),
+            'windows': [{'start': s.isoformat(timespec='minutes'), 'end': e.isoformat(timespec='minutes'),
+                         'reason': r} for s, e, r in windows],
+            'transitions': transitions,
+        }
+
+    def write_timeline(self, path=TIMELINE_FILE, now=None, hours=48, tournament=None):
+        data = self.timeline(now, hours, tournament)
+        tmp_path = path + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logging.warning("Could not write timeline %s: %s", path, e)
+        return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Display on/off schedule')
+    parser.add_argument('--config', default=SCHEDULE_FILE)
+    sub = parser.add_subparsers(dest='command', required=True)
+    status = sub.add_parser('status', help='Print "on|off <seconds to next change> [reason]"; exit 0 if on')
+    status.add_argument('--tournament', help='tournament_data.json - include the early-start window')
+    timeline = sub.add_parser('timeline', help='Print (or write) the upcoming windows and transitions')
+    timeline.add_argument('--hours', type=int, default=48)
+    timeline.add_argument('--tournament')
+    timeline.add_argument('--write', metavar='FILE')
+    args = parser.parse_args()
+
+    schedule = DisplaySchedule(load_config(args.config))
+    tournament = None
+    if args.tournament:
+        try:
+            with open(args.tournament, 'r') as f:
+                tournament = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    if args.command == 'status':
+        try:
+            on, reason, next_change = schedule.state(tournament=tournament)
+        except Exception as e:
+            # Exit 1 means "off" to hdmi_display_manager.sh - report a failure distinctly
+            logging.error("Error evaluating display schedule: %s", e)
+            return 2
+        seconds = int((next_change - datetime.now()).total_seconds()) if next_change else 86400
+        print(f"{'on' if on else 'off'} {max(seconds, 0)} {reason or ''}".rstrip())
+        return 0 if on else 1
+
+    if args.write:
+        data = schedule.write_timeline(args.write, hours=args.hours, tournament=tournament)
+    else:
+        data = schedule.timeline(hours=args.hours, tournament=tournament)
+    print(json.dumps(data, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+catt Stand-in
+Enough of the catt command line for catt_monitor (stop, cast_site, status,
+scan), speaking Cast v2 directly to one device - meant for fake_chromecast.py
+on machines without catt installed:
+
+    CATT_COMMAND = '/home/pi/fake_catt.py'
+
+    fake_catt.py -d 127.0.0.1 cast_site http://127.0.0.1/
+    fake_catt.py -d 127.0.0.1:8019 stop
+
+-d takes an IP (optionally :port). A friendly name, or no -d, targets
+FAKE_CAST_HOST (default 127.0.0.1); `scan` reports that device under
+FAKE_CAST_NAME. Exit status 1 with "Error: ..." on stderr when the device
+refuses or doesn't answer, like catt.
+"""
+
+import argparse
+import ipaddress
+import os
+import socket
+import ssl
+import struct
+import sys
+import time
+
+from fake_chromecast import (DASHCAST_APP_ID, NS_CONNECTION, NS_DASHCAST, NS_RECEIVER,
+                             decode_message, encode_message)
+
+
+DEFAULT_HOST = os.environ.get('FAKE_CAST_HOST', '127.0.0.1')
+DEFAULT_NAME = os.environ.get('FAKE_CAST_NAME', 'Fake Chromecast')
+CAST_PORT = 8009
+TIMEOUT = 15
+SENDER = 'sender-0'
+
+
+class CastError(Exception):
+    pass
+
+
+class Sender:
+    """One short-lived Cast v2 connection, like a catt invocation"""
+
+    def __init__(self, host, port):
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        raw = socket.create_connection((host, port), timeout=TIMEOUT)
+        self.sock = context.wrap_socket(raw)
+        self.request_id = 0
+        self.send('receiver-0', NS_CONNECTION, {'type': 'CONNECT'})
+
+    def send(self, destination, namespace, payload):
+        data = encode_message(SENDER, destination, namespace, payload)
+        self.sock.sendall(struct.pack('>I', len(data)) + data)
+
+    def _recv_exact(self, size):
+        data = b''
+        while len(data) < size:
+            chunk = self.sock.recv(size - len(data))
+            if not chunk:
+                raise CastError("Connection closed by device")
+            data += chunk
+        return data
+
+    def request(self, payload):
+        """Send to the receiver and wait for the reply with our requestId"""
+        self.request_id += 1
+        payload = dict(payload, requestId=self.request_id)
+        self.send('receiver-0', NS_RECEIVER, payload)
+        deadline = time.monotonic() + TIMEOUT
+        while time.monotonic() < deadline:
+            length = struct.unpack('>I', self._recv_exact(4))[0]
+            message = decode_message(self._recv_exact(length))
+            reply = message['payload']
+            if message['namespace'] == NS_RECEIVER and reply.get('requestId') == self.request_id:
+                if reply.get('type') == 'LAUNCH_ERROR':
+                    raise CastError(f"Device refused {payload['type']}: {reply.get('reason')}")
+                return reply
+        raise CastError(f"No reply to {payload['type']}")
+
+    def close(self):
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+
+def running_app(status):
+    apps = status.get('status', {}).get('applications') or [{}]
+    return apps[0]
+
+
+def target(device):
+    """-d value -> (host, port)"""
+    if device:
+        host, _, port = device.partition(':')
+        try:
+            ipaddress.ip_address(host)
+            return host, int(port or CAST_PORT)
+        except ValueError:
+            pass
+    return DEFAULT_HOST, CAST_PORT
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Minimal catt stand-in for fake_chromecast.py')
+    parser.add_argument('-d', '--device')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('stop')
+    sub.add_parser('status')
+    sub.add_parser('scan')
+    cast_site = sub.add_parser('cast_site')
+    cast_site.add_argument('url')
+    args = parser.parse_args()
+
+    host, port = target(args.device)
+    if args.command == 'scan':
+        print("Scanning Chromecasts...")
+        print(f"{host} - {DEFAULT_NAME} - Fake Chromecast")
+        return 0
+
+    sender = None
+    try:
+        sender = Sender(host, port)
+        if args.command == 'stop':
+            sender.request({'type': 'STOP'})
+        elif args.command == 'status':
+            app = running_app(sender.request({'type': 'GET_STATUS'}))
+            print(f"State: {app.get('displayName', 'idle')}")
+        else:
+            status = sender.request({'type': 'LAUNCH', 'appId': DASHCAST_APP_ID})
+            app = running_app(status)
+            if app.get('appId') != DASHCAST_APP_ID:
+                raise CastError("DashCast did not start")
+            sender.send(app['transportId'], NS_CONNECTION, {'type': 'CONNECT'})
+            sender.send(app['transportId'], NS_DASHCAST,
+                        {'url': args.url, 'force': True, 'reload': False, 'reload_time': 0})
+            print(f"Casting {args.url} on \"{DEFAULT_NAME}\"...")
+        return 0
+    except (CastError, OSError, ssl.SSLError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if sender:
+            sender.close()
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
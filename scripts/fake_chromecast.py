@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+Fake Chromecast
+A local stand-in that speaks enough of the Cast v2 protocol (TLS socket,
+length-prefixed CastMessage protobufs) for pychromecast and catt to connect,
+launch DashCast, load a URL, stop, and read receiver status. Used to measure
+re-cast latency without a TV.
+
+    python3 fake_chromecast.py                     # serve on 127.0.0.1:8009
+    python3 fake_chromecast.py --measure 5         # serve, then time 5 re-casts
+                                                   # with the catt CLI and with
+                                                   # the persistent CastController
+    python3 fake_chromecast.py --latency 0.8 --failure-rate 0.1
+                                                   # a slow, flaky device
+
+--latency delays every launch / stop / load; --failure-rate makes that share
+of them fail (LAUNCH_ERROR, or the load is dropped). Point catt_monitor at it
+with CAST_HOST, or with CATT_COMMAND set to fake_catt.py when catt isn't
+installed.
+
+catt and pychromecast connect to port 8009 when given an IP, so --measure
+needs that port free. A self-signed certificate is made with openssl on start.
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import shutil
+import socket
+import ssl
+import statistics
+import struct
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+
+
+NS_CONNECTION = 'urn:x-cast:com.google.cast.tp.connection'
+NS_HEARTBEAT = 'urn:x-cast:com.google.cast.tp.heartbeat'
+NS_RECEIVER = 'urn:x-cast:com.google.cast.receiver'
+NS_DASHCAST = 'urn:x-cast:es.offb.dashcast'
+
+BACKDROP_APP_ID = 'E8C28D3C'
+DASHCAST_APP_ID = '84912283'
+APP_NAMES = {BACKDROP_APP_ID: 'Backdrop', DASHCAST_APP_ID: 'DashCast'}
+APP_NAMESPACES = {BACKDROP_APP_ID: [], DASHCAST_APP_ID: [NS_DASHCAST]}
+
+RECAST_PAUSE = 1   # catt_monitor sleeps between stop and cast on a re-cast
+
+
+# --- CastMessage protobuf (cast_channel.proto), encoded by hand ---
+
+def _varint(value):
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _read_varint(data, pos):
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def encode_message(source_id, destination_id, namespace, payload):
+    """CastMessage with a UTF-8 JSON payload"""
+    def string_field(number, text):
+        raw = text.encode()
+        return _varint(number << 3 | 2) + _varint(len(raw)) + raw
+
+    return (
+        _varint(1 << 3) + _varint(0)            # protocol_version = CASTV2_1_0
+        + string_field(2, source_id)
+        + string_field(3, destination_id)
+        + string_field(4, namespace)
+        + _varint(5 << 3) + _varint(0)          # payload_type = STRING
+        + string_field(6, json.dumps(payload))
+    )
+
+
+def decode_message(data):
+    """CastMessage -> dict of source_id, destination_id, namespace, payload"""
+    fields = {}
+    pos = 0
+    while pos < len(data):
+        key, pos = _read_varint(data, pos)
+        number, wire_type = key >> 3, key & 7
+        if wire_type == 0:
+            fields[number], pos = _read_varint(data, pos)
+        elif wire_type == 2:
+            length, pos = _read_varint(data, pos)
+            fields[number] = data[pos:pos + length]
+            pos += length
+        else:
+            raise ValueError(f"Unsupported wire type {wire_type}")
+
+    payload = fields.get(6, b'').decode()
+    return {
+        'source_id': fields.get(2, b'').decode(),
+        'destination_id': fields.get(3, b'').decode(),
+        'namespace': fields.get(4, b'').decode(),
+        'payload': json.loads(payload) if payload else {},
+    }
+
+
+# --- Device ---
+
+class FakeChromecast:
+    """Receiver state shared by every connected sender"""
+
+    def __init__(self, name='Fake Chromecast', latency=0.0, failure_rate=0.0, seed=None):
+        self.name = name
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.connections = set()
+        self.app_id = BACKDROP_APP_ID
+        self.session_id = str(uuid.uuid4())
+        self.url = None
+        self.counts = {'connections': 0, 'launches': 0, 'loads': 0, 'stops': 0, 'failures': 0}
+
+    def command(self, kind):
+        """Apply the configured latency; False if this command should fail"""
+        if self.latency:
+            time.sleep(self.latency)
+        if self.failure_rate and self.random.random() < self.failure_rate:
+            with self.lock:
+                self.counts['failures'] += 1
+            logging.info("Simulated %s failure", kind)
+            return False
+        return True
+
+    def receiver_status(self, request_id=0):
+        app = {
+            'appId': self.app_id,
+            'displayName': APP_NAMES.get(self.app_id, self.app_id),
+            'isIdleScreen': self.app_id == BACKDROP_APP_ID,
+            'namespaces': [{'name': ns} for ns in APP_NAMESPACES.get(self.app_id, [])],
+            'sessionId': self.session_id,
+            'statusText': self.url or APP_NAMES.get(self.app_id, ''),
+            'transportId': self.session_id,
+        }
+        return {
+            'type': 'RECEIVER_STATUS',
+            'requestId': request_id,
+            'status': {
+                'applications': [app],
+                'isActiveInput': True,
+                'isStandBy': False,
+                'volume': {'controlType': 'attenuation', 'level': 1.0, 'muted': False, 'stepInterval': 0.05},
+            },
+        }
+
+    def launch(self, app_id):
+        with self.lock:
+            if app_id != self.app_id:
+                self.app_id = app_id
+                self.session_id = str(uuid.uuid4())
+                self.url = None
+                self.counts['launches'] += 1
+
+    def stop(self):
+        with self.lock:
+            self.app_id = BACKDROP_APP_ID
+            self.session_id = str(uuid.uuid4())
+            self.url = None
+            self.counts['stops'] += 1
+
+    def load(self, url):
+        with self.lock:
+            self.url = url
+            self.counts['loads'] += 1
+        logging.info("DashCast showing %s", url)
+
+    def broadcast_status(self, exclude=None):
+        for connection in list(self.connections):
+            if connection is not exclude:
+                connection.send('receiver-0', '*', NS_RECEIVER, self.receiver_status())
+
+
+class SenderConnection:
+    """One TLS connection from pychromecast/catt"""
+
+    def __init__(self, device, sock, address):
+        self.device = device
+        self.sock = sock
+        self.address = address
+        self.send_lock = threading.Lock()
+
+    def send(self, source_id, destination_id, namespace, payload):
+        data = encode_message(source_id, destination_id, namespace, payload)
+        with self.send_lock:
+            try:
+                self.sock.sendall(struct.pack('>I', len(data)) + data)
+            except OSError:
+                pass
+
+    def _recv_exact(self, size):
+        data = b''
+        while len(data) < size:
+            chunk = self.sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError('closed')
+            data += chunk
+        return data
+
+    def handle(self, message):
+        namespace = message['namespace']
+        payload = message['payload']
+        kind = payload.get('type')
+        reply_to = message['source_id']
+        me = message['destination_id']
+
+        if namespace == NS_HEARTBEAT and kind == 'PING':
+            self.send(me, reply_to, NS_HEARTBEAT, {'type': 'PONG'})
+        elif namespace == NS_RECEIVER:
+            request_id = payload.get('requestId', 0)
+            if kind in ('LAUNCH', 'STOP') and not self.device.command(kind):
+                self.send('receiver-0', reply_to, NS_RECEIVER,
+                          {'type': 'LAUNCH_ERROR', 'reason': 'NOT_ALLOWED', 'requestId': request_id})
+                return
+            if kind == 'LAUNCH':
+                self.device.launch(payload.get('appId'))
+            elif kind == 'STOP':
+                self.device.stop()
+            elif kind not in ('GET_STATUS', 'SET_VOLUME', 'GET_APP_AVAILABILITY'):
+                return
+            self.send('receiver-0', reply_to, NS_RECEIVER, self.device.receiver_status(request_id))
+            if kind in ('LAUNCH', 'STOP'):
+                self.device.broadcast_status(exclude=self)
+        elif namespace == NS_DASHCAST and payload.get('url'):
+            if self.device.command('load'):
+                self.device.load(payload['url'])
+        # CONNECT/CLOSE and anything else need no reply
+
+    def run(self):
+        self.device.connections.add(self)
+        self.device.counts['connections'] += 1
+        logging.debug("Sender connected from %s", self.address)
+        try:
+            while True:
+                length = struct.unpack('>I', self._recv_exact(4))[0]
+                self.handle(decode_message(self._recv_exact(length)))
+        except (ConnectionError, OSError, ssl.SSLError):
+            pass
+        except Exception as e:
+            logging.warning("Bad message from %s: %s", self.address, e)
+        finally:
+            self.device.connections.discard(self)
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+            logging.debug("Sender %s disconnected", self.address)
+
+
+def make_ssl_context(cert_dir):
+    """Self-signed certificate - senders don't verify it"""
+    cert = os.path.join(cert_dir, 'cert.pem')
+    key = os.path.join(cert_dir, 'key.pem')
+    subprocess.run(['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+                    '-subj', '/CN=fake-chromecast', '-keyout', key, '-out', cert],
+                   check=True, capture_output=True)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    return context
+
+
+def serve(device, host, port, ready=None):
+    with tempfile.TemporaryDirectory() as cert_dir:
+        context = make_ssl_context(cert_dir)
+        with socket.create_server((host, port), reuse_port=False) as server:
+            logging.info("Fake Chromecast '%s' listening on %s:%d", device.name, host, port)
+            if ready:
+                ready.set()
+            while True:
+                sock, address = server.accept()
+                try:
+                    tls = context.wrap_socket(sock, server_side=True)
+                except (ssl.SSLError, OSError) as e:
+                    logging.debug("TLS handshake failed from %s: %s", address, e)
+                    sock.close()
+                    continue
+                threading.Thread(target=SenderConnection(device, tls, address).run, daemon=True).start()
+
+
+# --- Re-cast latency measurement ---
+
+def measure_catt(catt, host, url, runs):
+    """catt_monitor's old re-cast: catt stop, pause, catt cast_site - a new process each"""
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([catt, '-d', host, 'stop'], capture_output=True, timeout=60)
+        time.sleep(RECAST_PAUSE)
+        result = subprocess.run([catt, '-d', host, 'cast_site', url], capture_output=True, text=True, timeout=60)
+        times.append(time.perf_counter() - started)
+        if result.returncode != 0:
+            logging.warning("catt cast_site failed: %s", result.stderr.strip())
+    return times
+
+
+def measure_controller(host, port, url, runs):
+    """Persistent CastController: connect once, then one load per re-cast"""
+    from cast_controller import get_cast_controller
+    controller = get_cast_controller(host=host, port=port)
+    if controller is None:
+        return None, []
+    started = time.perf_counter()
+    controller.connect()
+    connect_time = time.perf_counter() - started
+
+    times = []
+    for i in range(runs):
+        started = time.perf_counter()
+        controller.cast_site(f"{url}?recast={i}")
+        times.append(time.perf_counter() - started)
+    controller.disconnect()
+    return connect_time, times
+
+
+def report(label, times):
+    if times:
+        print(f"{label:<34} mean {statistics.mean(times) * 1000:8.0f} ms   "
+              f"median {statistics.median(times) * 1000:8.0f} ms   ({len(times)} runs)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local Cast v2 stand-in for re-cast timing')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8009)
+    parser.add_argument('--name', default='Fake Chromecast')
+    parser.add_argument('--measure', type=int, metavar='N', help='Time N re-casts, then exit')
+    parser.add_argument('--url', default='http://127.0.0.1/')
+    parser.add_argument('--catt', default=shutil.which('catt') or '/home/pi/.local/bin/catt')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to each launch/stop/load')
+    parser.add_argument('--failure-rate', type=float, default=0.0, help='Share of launch/stop/load commands that fail')
+    parser.add_argument('--seed', type=int, help='Seed for the failure draws')
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+    device = FakeChromecast(args.name, args.latency, args.failure_rate, args.seed)
+
+    if not args.measure:
+        try:
+            serve(device, args.host, args.port)
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    ready = threading.Event()
+    threading.Thread(target=serve, args=(device, args.host, args.port, ready), daemon=True).start()
+    if not ready.wait(30):
+        print("Fake Chromecast did not start")
+        return 1
+
+    print(f"\nRe-cast latency against the fake device, {args.measure} runs each\n")
+    if os.path.exists(args.catt) or shutil.which(args.catt):
+        report('catt CLI (stop + pause + cast)', measure_catt(args.catt, args.host, args.url, args.measure))
+    else:
+        print(f"catt not found at {args.catt} - skipping the CLI measurement")
+
+    connect_time, times = measure_controller(args.host, args.port, args.url, args.measure)
+    if connect_time is None:
+        print("pychromecast not installed - skipping the controller measurement")
+    else:
+        print(f"{'CastController first connect':<34} {connect_time * 1000:13.0f} ms")
+        report('CastController re-cast', times)
+
+    print(f"\nDevice saw: {device.counts}")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+File Change Watcher
+Blocks until one of a few watched files changes, using Linux inotify (through
+ctypes, no extra packages) on the files' parent directories. Watching the
+directory rather than the file keeps working when a writer replaces the file
+with a rename.
+
+Where inotify is unavailable (not Linux, watch limit reached, directory
+missing) it falls back to comparing os.stat() results, which costs no file
+reads.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import struct
+import time
+
+
+# inotify constants from <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+# A complete write (close) or a rename/delete - not every intermediate write()
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_MOVED_FROM | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+EVENT_HEADER = struct.Struct('iIII')   # wd, mask, cookie, len
+
+STAT_POLL_INTERVAL = 1.0   # Seconds between stat checks in fallback mode
+
+
+def _stat_signature(path):
+    try:
+        st = os.stat(path)
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+    except OSError:
+        return None
+
+
+class FileWatcher:
+    """wait(timeout) -> set of watched paths that changed (empty on timeout)"""
+
+    def __init__(self, paths):
+        self.paths = [os.path.abspath(p) for p in paths]
+        self.fd = None
+        self.dirs = {}          # wd -> directory
+        self.stat_paths = []    # paths watched by stat comparison
+        self.signatures = {}
+        self._init_inotify()
+        for path in self.stat_paths:
+            self.signatures[path] = _stat_signature(path)
+
+    @property
+    def mode(self):
+        if self.fd is None:
+            return 'stat'
+        return 'inotify+stat' if self.stat_paths else 'inotify'
+
+    def _init_inotify(self):
+        libc = None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        except (OSError, AttributeError) as e:
+            logging.info("inotify unavailable (%s) - using stat polling", e)
+            self.stat_paths = list(self.paths)
+            return
+        if fd < 0:
+            logging.info("inotify_init1 failed (%s) - using stat polling", os.strerror(ctypes.get_errno()))
+            self.stat_paths = list(self.paths)
+            return
+
+        self.fd = fd
+        watched = {}
+        for path in self.paths:
+            directory = os.path.dirname(path)
+            if directory not in watched:
+                wd = libc.inotify_add_watch(fd, directory.encode(), WATCH_MASK)
+                if wd < 0:
+                    logging.info("Cannot watch %s (%s) - using stat polling for it",
+                                 directory, os.strerror(ctypes.get_errno()))
+                    watched[directory] = None
+                else:
+                    watched[directory] = wd
+                    self.dirs[wd] = directory
+            if watched[directory] is None:
+                self.stat_paths.append(path)
+
+        if not self.dirs:
+            os.close(self.fd)
+            self.fd = None
+
+    def _read_events(self):
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except OSError as e:
+                if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    break
+                raise
+            if not data:
+                break
+
+            offset = 0
+            while offset + EVENT_HEADER.size <= len(data):
+                wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+                name = data[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + length].rstrip(b'\0')
+                offset += EVENT_HEADER.size + length
+
+                if mask & IN_Q_OVERFLOW:
+                    # Events were dropped - assume everything changed
+                    logging.warning("inotify queue overflow - rechecking all files")
+                    return set(self.paths)
+                directory = self.dirs.get(wd)
+                if mask & (IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+                    # The directory itself went away - watch its files by stat from now on
+                    if directory:
+                        lost = [p for p in self.paths if os.path.dirname(p) == directory]
+                        logging.warning("Watched directory %s removed - using stat polling", directory)
+                        self.dirs.pop(wd, None)
+                        for path in lost:
+                            if path not in self.stat_paths:
+                                self.stat_paths.append(path)
+                                self.signatures[path] = _stat_signature(path)
+                        changed.update(lost)
+                    continue
+                if directory and name:
+                    path = os.path.join(directory, os.fsdecode(name))
+                    if path in self.paths:
+                        changed.add(path)
+        return changed
+
+    def _stat_changes(self):
+        changed = set()
+        for path in self.stat_paths:
+            signature = _stat_signature(path)
+            if signature != self.signatures.get(path):
+                self.signatures[path] = signature
+                changed.add(path)
+        return changed
+
+    def wait(self, timeout, extra_fds=()):
+        """Block until a watched file changes or timeout seconds pass
+
+        extra_fds (e.g. a netlink socket) also end the wait when readable; the
+        caller reads them - the returned set is then empty.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            changed = self._stat_changes() if self.stat_paths else set()
+            if changed:
+                return changed
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return set()
+            if self.stat_paths:
+                remaining = min(remaining, STAT_POLL_INTERVAL)
+
+            fds = list(extra_fds)
+            if self.fd is not None and self.dirs:
+                fds.append(self.fd)
+            if not fds:
+                time.sleep(remaining)
+                continue
+            readable, _, _ = select.select(fds, [], [], remaining)
+            if self.fd in readable:
+                changed = self._read_events()
+                if changed:
+                    return changed
+            if any(fd in readable for fd in extra_fds):
+                return set()
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
@@ -10,12 +10,18 @@ log() {
     echo "[$(date '+%Y-%m-%d %H:%M:%S')] $1" | tee -a "$LOG_FILE"
 }
 
-is_business_hours() {
+SCHEDULE_CMD="python3 /home/pi/display_schedule.py"
+NEXT_CHANGE=60
+
+# Hours come from /home/pi/display_schedule.json (shared with catt_monitor.py).
+# Prints "on|off <seconds to next change> <reason>"; exit status 0 when on.
+# Built-in hours, used only when display_schedule.py itself can't run
+default_business_hours() {
     local day=$(date +%u)
     local hour=$(date +%H | sed 's/^0//')
     local minute=$(date +%M | sed 's/^0//')
     local current_minutes=$((hour * 60 + minute))
-    
+
     case $day in
         7) [ $current_minutes -ge 720 ] && return 0 ;;
         1) [ $current_minutes -lt 60 ] || [ $current_minutes -ge 900 ] && return 0 ;;
@@ -26,6 +32,22 @@ is_business_hours() {
     return 1
 }
 
+is_business_hours() {
+    local status
+    status=$($SCHEDULE_CMD status 2>>"$LOG_FILE")
+    local rc=$?
+    NEXT_CHANGE=$(echo "$status" | awk '{print $2}')
+    [ -z "$NEXT_CHANGE" ] && NEXT_CHANGE=60
+    # 0 = on, 1 = off; anything else means the schedule command failed
+    if [ $rc -gt 1 ]; then
+        log "display_schedule.py failed (exit $rc) - using built-in business hours"
+        NEXT_CHANGE=60
+        default_business_hours
+        return $?
+    fi
+    return $rc
+}
+
 is_chromium_running() {
     pgrep chromium > /dev/null
 }
@@ -94,5 +116,11 @@ while true; do
             stop_chromium
         fi
     fi
-    sleep 60
+    # Sleep until the next scheduled change, but re-check at least every minute
+    # so the browser is restarted promptly if it crashes
+    if [ "$NEXT_CHANGE" -lt 60 ] 2>/dev/null; then
+        sleep $((NEXT_CHANGE + 1))
+    else
+        sleep 60
+    fi
 done
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Display Push Channel
+A small Server-Sent Events endpoint that catt_monitor runs in a background
+thread. The cast page keeps an EventSource open to /events and applies
+"data" / "media" notices in place, so a content change no longer needs a
+stop-and-recast on the Chromecast.
+
+Clients identify themselves with ?client=<tag> (the Chromecast page uses
+the tag catt_monitor puts in the cast URL), which lets catt_monitor tell
+whether the receiver's page is still alive.
+
+    GET /events?client=cast   text/event-stream
+    GET /status               connected clients per tag (JSON)
+"""
+
+import json
+import logging
+import queue
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+PUSH_PORT = 8088
+HEARTBEAT_INTERVAL = 15   # Comment line keeps proxies and the receiver from timing out
+RETRY_MS = 3000           # EventSource reconnect delay
+
+
+class PushChannel:
+    """Fan-out of named events to every connected EventSource"""
+
+    def __init__(self, port=PUSH_PORT, host='0.0.0.0'):
+        self.port = port
+        self.host = host
+        self.server = None
+        self.lock = threading.Lock()
+        self.clients = {}          # queue -> tag
+        self.last_disconnect = {}  # tag -> time.time() of the last disconnect
+        self.sequence = 0
+
+    def start(self):
+        """Serve in a daemon thread; False if the port can't be bound"""
+        handler = type('PushHandler', (_EventHandler,), {'channel': self})
+        try:
+            self.server = ThreadingHTTPServer((self.host, self.port), handler)
+        except OSError as e:
+            logging.warning("Push channel unavailable on port %d: %s", self.port, e)
+            return False
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, name='push-channel', daemon=True).start()
+        logging.info("Push channel listening on port %d", self.port)
+        return True
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def publish(self, event, data=None, tag=None):
+        """Send an event to every client (or only those with tag); returns how many received it"""
+        with self.lock:
+            self.sequence += 1
+            message = (event, self.sequence, json.dumps(data or {}))
+            sent = 0
+            for client, client_tag in self.clients.items():
+                if tag is None or client_tag == tag:
+                    client.put(message)
+                    sent += 1
+            return sent
+
+    def connected(self, tag):
+        with self.lock:
+            return any(t == tag for t in self.clients.values())
+
+    def disconnected_for(self, tag):
+        """Seconds since the last client with this tag left; 0 if one is connected,
+        None if none has connected since forget()"""
+        with self.lock:
+            if any(t == tag for t in self.clients.values()):
+                return 0
+            left = self.last_disconnect.get(tag)
+        return None if left is None else time.time() - left
+
+    def forget(self, tag):
+        """Drop disconnect history - after a fresh cast the new page has to connect first"""
+        with self.lock:
+            self.last_disconnect.pop(tag, None)
+
+    def counts(self):
+        with self.lock:
+            result = {}
+            for tag in self.clients.values():
+                result[tag] = result.get(tag, 0) + 1
+            return result
+
+    def _add(self, client, tag):
+        with self.lock:
+            self.clients[client] = tag
+        logging.debug("Push client connected: %s (%d total)", tag, len(self.clients))
+
+    def _remove(self, client):
+        with self.lock:
+            tag = self.clients.pop(client, None)
+            if tag is not None:
+                self.last_disconnect[tag] = time.time()
+        logging.debug("Push client disconnected: %s", tag)
+
+
+class _EventHandler(BaseHTTPRequestHandler):
+    channel = None
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        logging.debug("Push channel: " + format, *args)
+
+    def _headers(self, content_type):
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Cache-Control', 'no-cache')
+        # The page is served by Apache on port 80
+        self.send_header('Access-Control-Allow-Origin', '*')
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == '/status':
+            body = json.dumps({'clients': self.channel.counts(), 'sequence': self.channel.sequence}).encode()
+            self._headers('application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif url.path == '/events':
+            tag = parse_qs(url.query).get('client', ['browser'])[0][:32]
+            self._stream(tag)
+        else:
+            self.send_error(404)
+
+    def _stream(self, tag):
+        self._headers('text/event-stream')
+        self.send_header('Connection', 'keep-alive')
+        self.end_headers()
+
+        client = queue.SimpleQueue()
+        self.channel._add(client, tag)
+        try:
+            self.wfile.write(f"retry: {RETRY_MS}\n\n".encode())
+            self.wfile.flush()
+            while True:
+                try:
+                    event, sequence, data = client.get(timeout=HEARTBEAT_INTERVAL)
+                    chunk = f"id: {sequence}\nevent: {event}\ndata: {data}\n\n"
+                except queue.Empty:
+                    chunk = ": ping\n\n"
+                self.wfile.write(chunk.encode())
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError, OSError):
+            pass
+        finally:
+            self.channel._remove(client)
+            self.close_connection = True
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Display Frame Renderer
+Rasterizes the tournament and winners views to still images with headless
+Chrome, so older Chromecast receivers can show a plain image slideshow
+(frames.html) instead of running the JS-heavy pages themselves.
+
+Each view lists the files its content comes from and is re-rendered only
+when one of them changes (or the frame is older than MAX_FRAME_AGE, for the
+clock-driven parts of the page). Frames and manifest.json are replaced
+atomically, and each render logs its time and image size.
+
+Usage:
+    python3 render_frames.py [--once] [--format webp|png]
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.ui import WebDriverWait
+
+from service_logging import setup_logging
+
+# Configuration
+FRAMES_DIR = '/var/www/html/frames'
+MANIFEST_FILE = os.path.join(FRAMES_DIR, 'manifest.json')
+LOG_FILE = '/var/log/render_frames.log'
+CHECK_INTERVAL = 15          # Seconds between source checks
+MAX_FRAME_AGE = 900          # Re-render at least this often (start times, media schedule)
+FRAME_FORMAT = os.environ.get('FRAME_FORMAT', 'webp')   # 'webp' or 'png'
+FRAME_QUALITY = 85           # WebP quality (ignored for PNG)
+FRAME_WIDTH = 1920
+FRAME_HEIGHT = 1080
+PAGE_TIMEOUT = 20
+SETTLE_SECONDS = 3           # index.php hides its loading overlay after up to 2 s
+
+# Views to rasterize, in slideshow order
+VIEWS = [
+    {
+        'name': 'tournament',
+        'url': 'http://localhost/',
+        'duration': 30,
+        'sources': ['/var/www/html/tournament_data.json', '/var/www/html/media/media_config.json'],
+    },
+    {
+        # Pulled from GitHub by tournament_monitor.py
+        'name': 'winners',
+        'url': 'file:///tmp/tournament-scraper/results/winners_display.html',
+        'duration': 20,
+        'sources': ['/tmp/tournament-scraper/results/winners_display.html'],
+    },
+]
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+FONTS_READY_JS = """
+var done = arguments[arguments.length - 1];
+(document.fonts ? document.fonts.ready : Promise.resolve()).then(function() { done(true); });
+"""
+
+
+def get_file_hash(filepath):
+    """Get MD5 hash of file contents"""
+    try:
+        if not Path(filepath).exists():
+            return None
+        with open(filepath, 'rb') as f:
+            return hashlib.md5(f.read()).hexdigest()
+    except Exception as e:
+        logging.error("Error hashing file %s: %s", filepath, e)
+        return None
+
+
+def view_version(view):
+    """Combined hash of a view's source files, or None if none exist yet"""
+    hashes = [get_file_hash(path) for path in view['sources']]
+    if not any(hashes):
+        return None
+    return hashlib.md5('|'.join(h or '-' for h in hashes).encode()).hexdigest()
+
+
+def load_manifest():
+    try:
+        with open(MANIFEST_FILE, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {'frames': []}
+    except Exception as e:
+        logging.warning("Could not read %s: %s", MANIFEST_FILE, e)
+        return {'frames': []}
+
+
+def write_atomic(path, data, mode='wb'):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, mode) as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def setup_driver():
+    """Headless Chrome sized to the TV"""
+    options = Options()
+    options.add_argument('--headless=new')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--hide-scrollbars')
+    options.add_argument('--allow-file-access-from-files')
+    options.add_argument(f'--window-size={FRAME_WIDTH},{FRAME_HEIGHT}')
+
+    driver = None
+    for path in ['/usr/bin/chromedriver', '/usr/local/bin/chromedriver', 'chromedriver']:
+        try:
+            driver = webdriver.Chrome(service=Service(executable_path=path), options=options)
+            break
+        except Exception:
+            continue
+    if not driver:
+        driver = webdriver.Chrome(options=options)
+
+    # Exact frame size regardless of window decorations
+    driver.execute_cdp_cmd('Emulation.setDeviceMetricsOverride', {
+        'width': FRAME_WIDTH, 'height': FRAME_HEIGHT, 'deviceScaleFactor': 1, 'mobile': False
+    })
+    driver.set_page_load_timeout(PAGE_TIMEOUT)
+    driver.set_script_timeout(PAGE_TIMEOUT)
+    return driver
+
+
+def render_view(driver, view, fmt):
+    """Load a view and capture it; returns (image bytes, load ms, capture ms)"""
+    start = time.perf_counter()
+    driver.get(view['url'])
+    WebDriverWait(driver, PAGE_TIMEOUT).until(
+        lambda d: d.execute_script("return document.readyState") == 'complete')
+    driver.execute_async_script(FONTS_READY_JS)
+    time.sleep(SETTLE_SECONDS)
+    loaded = time.perf_counter()
+
+    params = {'format': fmt, 'captureBeyondViewport': False}
+    if fmt != 'png':
+        params['quality'] = FRAME_QUALITY
+    data = base64.b64decode(driver.execute_cdp_cmd('Page.captureScreenshot', params)['data'])
+    captured = time.perf_counter()
+
+    return data, (loaded - start) * 1000, (captured - loaded) * 1000
+
+
+def render_changed(fmt=FRAME_FORMAT, force=False):
+    """Re-render views whose sources changed; returns the number rendered"""
+    manifest = load_manifest()
+    previous = {frame['name']: frame for frame in manifest.get('frames', [])}
+    now = time.time()
+
+    due = []
+    for view in VIEWS:
+        version = view_version(view)
+        if version is None:
+            logging.debug("%s: no source files yet - skipping", view['name'])
+            continue
+        frame = previous.get(view['name'])
+        if (force or not frame or frame.get('version') != version or frame.get('format') != fmt
+                or now - frame.get('rendered_ts', 0) > MAX_FRAME_AGE):
+            due.append((view, version))
+
+    if not due:
+        return 0
+
+    os.makedirs(FRAMES_DIR, exist_ok=True)
+    frames = dict(previous)
+    rendered = 0
+    driver = None
+    try:
+        # One Chrome per batch - renders are minutes apart and the Pi is short on memory
+        driver = setup_driver()
+        for view, version in due:
+            try:
+                data, load_ms, capture_ms = render_view(driver, view, fmt)
+            except Exception as e:
+                logging.error("✗ Render of %s failed: %s", view['name'], e)
+                continue
+
+            filename = f"{view['name']}.{fmt}"
+            rendered_ts = time.time()
+            write_atomic(os.path.join(FRAMES_DIR, filename), data)
+            frames[view['name']] = {
+                'name': view['name'],
+                # New query string per render so the receiver never shows a cached frame
+                'src': f"frames/{filename}?v={int(rendered_ts)}",
+                'duration': view['duration'],
+                'format': fmt,
+                'bytes': len(data),
+                'version': version,
+                'render_ms': round(load_ms + capture_ms),
+                'rendered_at': datetime.now().isoformat(timespec='seconds'),
+                'rendered_ts': rendered_ts,
+            }
+            rendered += 1
+            logging.info("✓ Rendered %s in %.0f ms (load %.0f, capture %.0f): %d bytes %s",
+                         view['name'], load_ms + capture_ms, load_ms, capture_ms, len(data), fmt)
+    except Exception as e:
+        logging.error("Error starting headless Chrome: %s", e)
+    finally:
+        if driver:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    if rendered:
+        manifest = {
+            'updated': datetime.now().isoformat(timespec='seconds'),
+            'frames': [frames[view['name']] for view in VIEWS if view['name'] in frames],
+        }
+        write_atomic(MANIFEST_FILE, json.dumps(manifest, indent=2), mode='w')
+    return rendered
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rasterize display views for the frame slideshow')
+    parser.add_argument('--once', action='store_true', help='Render changed views once and exit')
+    parser.add_argument('--force', action='store_true', help='Re-render every view')
+    parser.add_argument('--format', choices=['webp', 'png'], default=FRAME_FORMAT)
+    args = parser.parse_args()
+
+    setup_logging(LOG_FILE, fmt=LOG_FORMAT, datefmt=None)
+
+    if args.once:
+        render_changed(args.format, args.force)
+        return
+
+    logging.info("Frame renderer starting - %s frames in %s", args.format, FRAMES_DIR)
+    force = args.force
+    while True:
+        try:
+            render_changed(args.format, force)
+            force = False
+            time.sleep(CHECK_INTERVAL)
+        except KeyboardInterrupt:
+            logging.info("Renderer stopped by user")
+            break
+        except Exception as e:
+            logging.error("Error in render loop: %s", e)
+            time.sleep(CHECK_INTERVAL)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Shared Logging Setup for the Bankshot Python Services
+- Messages use %-style arguments, so they are only formatted when emitted
+- DEBUG is off unless BANKSHOT_LOG_LEVEL=DEBUG (or level=...) is set
+- Records are handed to a queue and written by one background thread
+- High-volume dumps can be sampled with sample() / debug_sampled()
+- Bytes written to the log file are reported when the process exits
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+
+DEFAULT_FORMAT = '[%(asctime)s] %(message)s'
+DEFAULT_DATEFMT = '%Y-%m-%d %H:%M:%S'
+LOG_LEVEL_ENV = 'BANKSHOT_LOG_LEVEL'
+SAMPLE_EVERY = 20  # Emit 1 of every 20 sampled records
+
+_listener = None
+_file_handler = None
+_sample_counts = {}
+_sample_lock = threading.Lock()
+
+
+class _CountingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that tallies the bytes it writes to the log file
+
+    shouldRollover() and emit() both format the record; it is formatted once
+    and counted once, after the write went through.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.bytes_written = 0
+        self._formatted = (None, None)
+        self._failed = False
+
+    def format(self, record):
+        cached, text = self._formatted
+        if cached is not record:
+            text = super().format(record)
+            self._formatted = (record, text)
+        return text
+
+    def emit(self, record):
+        self._failed = False
+        try:
+            super().emit(record)
+            cached, text = self._formatted
+            if cached is record and not self._failed:
+                self.bytes_written += len((text + self.terminator).encode(self.encoding or 'utf-8', 'replace'))
+        finally:
+            self._formatted = (None, None)
+
+    def handleError(self, record):
+        self._failed = True
+        super().handleError(record)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Queue records unformatted so formatting happens on the writer thread
+
+    Log arguments should be values that are not mutated after the call.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+def setup_logging(log_file=None, fmt=DEFAULT_FORMAT, datefmt=DEFAULT_DATEFMT,
+                  level=None, max_bytes=5*1024*1024, backup_count=5, console=True):
+    """Configure the root logger with a queue-based background writer
+
+    Falls back to console-only logging if the log file cannot be opened.
+    """
+    global _listener, _file_handler
+
+    if _listener:
+        shutdown_logging(report=False)
+
+    level_name = level or os.environ.get(LOG_LEVEL_ENV, 'INFO')
+    log_level = logging.getLevelName(str(level_name).upper())
+    if not isinstance(log_level, int):
+        log_level = logging.INFO
+
+    handlers = []
+
+    if log_file:
+        log_dir = os.path.dirname(log_file)
+        try:
+            if log_dir:
+                os.makedirs(log_dir, exist_ok=True)
+            _file_handler = _CountingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count)
+            _file_handler.setFormatter(logging.Formatter(fmt, datefmt=datefmt))
+            handlers.append(_file_handler)
+        except Exception as e:
+            print(f"Warning: Could not set up file logging: {e}")
+            print("Continuing with console-only logging")
+
+    if console or not handlers:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter(fmt, datefmt=datefmt))
+        handlers.append(console_handler)
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(log_level)
+    root.handlers = [_DeferredQueueHandler(log_queue)]
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+    return root
+
+
+def bytes_written():
+    """Bytes written to the log file by this process so far"""
+    return _file_handler.bytes_written if _file_handler else 0
+
+
+def shutdown_logging(report=True):
+    """Flush the queue, stop the writer thread and report log volume"""
+    global _listener, _file_handler
+
+    if not _listener:
+        return
+
+    # Stopping the listener drains the queue, so the count is final
+    _listener.stop()
+
+    if report and _file_handler:
+        record = logging.getLogger().makeRecord(
+            'root', logging.INFO, __file__, 0,
+            "Log bytes written this run: %d", (_file_handler.bytes_written,), None)
+        for handler in _listener.handlers:
+            handler.handle(record)
+
+    for handler in _listener.handlers:
+        try:
+            handler.close()
+        except Exception:
+            pass
+    _listener = None
+    _file_handler = None
+
+
+def sample(key, every=SAMPLE_EVERY):
+    """True for the 1st, (every+1)th, (2*every+1)th... call with this key"""
+    with _sample_lock:
+        count = _sample_counts.get(key, 0)
+        _sample_counts[key] = count + 1
+    return count % every == 0
+
+
+def debug_sampled(logger, key, msg, *args, every=SAMPLE_EVERY):
+    """Emit a DEBUG record for only a sample of calls with this key"""
+    if logger.isEnabledFor(logging.DEBUG) and sample(key, every):
+        logger.debug(msg, *args)
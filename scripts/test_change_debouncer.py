@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Re-cast coalescing tests for catt_monitor.ChangeDebouncer
+
+    python3 -m pytest scripts/test_change_debouncer.py
+    python3 -m unittest test_change_debouncer        (from scripts/)
+"""
+
+import unittest
+
+from catt_monitor import ChangeDebouncer
+
+
+class FakeClock:
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class ChangeDebouncerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.debouncer = ChangeDebouncer({'tournament': 600, 'media': 60}, clock=self.clock)
+        self.recasts = []
+
+    def change(self, source, at):
+        """What monitor_and_cast does for a changed file: note it, re-cast once due"""
+        self.clock.now = at
+        self.debouncer.note(source)
+        self.poll(at)
+
+    def poll(self, at):
+        self.clock.now = at
+        if self.debouncer.due_in() == 0:
+            self.recasts.append(self.debouncer.summary())
+            self.debouncer.applied()
+
+    def test_first_change_recasts_immediately(self):
+        self.change('tournament', 1000)
+        self.assertEqual(self.recasts, [({'tournament': 1}, 0)])
+        self.assertIsNone(self.debouncer.due_in())
+
+    def test_burst_coalesces_into_one_recast(self):
+        self.debouncer.applied(at=1000)
+        for at in (1010, 1100, 1250, 1400, 1590):
+            self.change('tournament', at)
+        self.assertEqual(self.recasts, [])
+        self.assertEqual(self.debouncer.due_in(), 10)
+
+        self.poll(1600)   # Cooldown ends - everything pending goes out together
+        self.poll(1601)
+        self.assertEqual(self.recasts, [({'tournament': 5}, 590)])
+        self.assertIsNone(self.debouncer.due_in())
+
+    def test_sources_share_one_recast(self):
+        self.debouncer.applied(at=1000)
+        self.change('tournament', 1010)
+        self.change('media', 1020)
+        self.assertEqual(self.debouncer.due_in(), 40)   # media's shorter interval decides
+
+        self.poll(1060)
+        self.assertEqual(self.recasts, [({'tournament': 1, 'media': 1}, 50)])
+
+    def test_reverted_change_is_dropped(self):
+        self.debouncer.applied(at=1000)
+        self.change('tournament', 1010)
+        self.debouncer.retain(set())   # File is back to what is on screen
+        self.poll(1600)
+        self.assertEqual(self.recasts, [])
+        self.assertIsNone(self.debouncer.due_in())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Tests for the display rule shared by catt_monitor.py and cast_fleet.py
+
+    python3 -m pytest scripts/test_display_rule.py
+    python3 -m unittest test_display_rule        (from scripts/)
+"""
+
+import unittest
+
+from catt_monitor import should_display_tournament
+from display_schedule import DAY_KEYS, DisplaySchedule
+
+# Time-independent schedules: open around the clock, or never
+OPEN = DisplaySchedule({'business_hours': {day: ['00:00-24:00'] for day in DAY_KEYS}})
+CLOSED = DisplaySchedule({'business_hours': {}})
+
+ACTIVE = {'tournament_name': 'Tuesday 8-Ball', 'status': 'In Progress', 'display_tournament': True}
+FINISHED = {'tournament_name': 'Tuesday 8-Ball', 'status': 'Completed', 'display_tournament': True}
+
+
+class DisplayRuleTest(unittest.TestCase):
+
+    def test_tournament_rule(self):
+        self.assertTrue(should_display_tournament(FINISHED, 'tournament', OPEN))
+        self.assertTrue(should_display_tournament(ACTIVE, 'tournament', CLOSED))
+        self.assertFalse(should_display_tournament(FINISHED, 'tournament', CLOSED))
+
+    def test_schedule_rule_ignores_tournament(self):
+        self.assertTrue(should_display_tournament(FINISHED, 'schedule', OPEN))
+        self.assertFalse(should_display_tournament(ACTIVE, 'schedule', CLOSED))
+
+    def test_always_rule(self):
+        self.assertTrue(should_display_tournament(None, 'always', CLOSED))
+
+    def test_without_tournament_data(self):
+        # Only the schedule can turn a display on until the data loads
+        self.assertTrue(should_display_tournament(None, 'schedule', OPEN))
+        self.assertTrue(should_display_tournament(None, 'tournament', OPEN))
+        self.assertFalse(should_display_tournament(None, 'tournament', CLOSED))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Timeline lookup tests for display_schedule.py
+
+    python3 -m pytest scripts/test_display_schedule.py
+    python3 -m unittest test_display_schedule        (from scripts/)
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+import display_schedule
+from display_schedule import DisplaySchedule, load_config
+
+# Fixed hours so the tests don't follow edits to display_schedule.json
+CONFIG = {
+    'early_start_minutes': 60,
+    'business_hours': {
+        'mon': ['15:00-25:00'],
+        'tue': ['12:00-25:00'],
+        'wed': ['12:00-25:00'],
+        'thu': ['12:00-25:00'],
+        'fri': ['12:00-26:30'],
+        'sat': ['12:00-24:00'],
+        'sun': ['12:00-25:00'],
+    },
+    'holidays': {
+        '2026-12-24': ['12:00-18:00'],
+        '12-25': [],
+    },
+}
+
+# 2026-10-19 is a Monday
+
+
+class TimelineLookupTest(unittest.TestCase):
+
+    def setUp(self):
+        self.schedule = DisplaySchedule(CONFIG)
+
+    def test_on_at_opening_minute(self):
+        self.assertEqual(self.schedule.state(datetime(2026, 10, 20, 11, 59)),
+                         (False, None, datetime(2026, 10, 20, 12, 0)))
+        self.assertEqual(self.schedule.state(datetime(2026, 10, 20, 12, 0)),
+                         (True, 'business_hours', datetime(2026, 10, 21, 1, 0)))
+
+    def test_off_at_closing_minute_after_midnight(self):
+        # Tuesday's 12:00-25:00 window is still open early Wednesday
+        self.assertEqual(self.schedule.state(datetime(2026, 10, 21, 0, 59)),
+                         (True, 'business_hours', datetime(2026, 10, 21, 1, 0)))
+        self.assertEqual(self.schedule.state(datetime(2026, 10, 21, 1, 0)),
+                         (False, None, datetime(2026, 10, 21, 12, 0)))
+
+    def test_late_window_from_yesterday_on_a_fresh_timeline(self):
+        # The first lookup of the day builds from Saturday - Friday's 26:30 must carry over
+        self.assertTrue(self.schedule.is_on(datetime(2026, 10, 24, 2, 29)))
+        self.assertEqual(self.schedule.state(datetime(2026, 10, 24, 2, 30)),
+                         (False, None, datetime(2026, 10, 24, 12, 0)))
+
+    def test_window_ending_at_midnight(self):
+        self.assertTrue(self.schedule.is_on(datetime(2026, 10, 24, 23, 59)))
+        self.assertEqual(self.schedule.state(datetime(2026, 10, 25, 0, 0)),
+                         (False, None, datetime(2026, 10, 25, 12, 0)))
+
+    def test_seconds_until_change(self):
+        self.assertEqual(self.schedule.seconds_until_change(datetime(2026, 10, 20, 11, 0)), 3600)
+        self.assertEqual(self.schedule.seconds_until_change(datetime(2026, 10, 21, 0, 30)), 1800)
+
+    def test_holidays_replace_weekday_hours(self):
+        # Christmas Eve closes early; Christmas Day ('12-25', every year) is closed
+        self.assertEqual(self.schedule.state(datetime(2026, 12, 24, 18, 0)),
+                         (False, None, datetime(2026, 12, 26, 12, 0)))
+        self.assertFalse(self.schedule.is_on(datetime(2027, 12, 25, 15, 0)))
+
+    def test_early_start_before_opening(self):
+        # Monday opens at 15:00 - a 2 PM start gets its own hour, then a gap
+        tournament = {'date': '2026/10/19', 'start_time': '2:00 PM'}
+        self.assertEqual(self.schedule.state(datetime(2026, 10, 19, 12, 59), tournament),
+                         (False, None, datetime(2026, 10, 19, 13, 0)))
+        self.assertEqual(self.schedule.state(datetime(2026, 10, 19, 13, 0), tournament),
+                         (True, 'early_start', datetime(2026, 10, 19, 14, 0)))
+        self.assertFalse(self.schedule.is_on(datetime(2026, 10, 19, 14, 0), tournament))
+
+    def test_early_start_merges_into_adjacent_hours(self):
+        tournament = {'date': '2026/10/19', 'start_time': '3:00 PM'}
+        self.assertEqual(self.schedule.state(datetime(2026, 10, 19, 14, 0), tournament),
+                         (True, 'early_start', datetime(2026, 10, 20, 1, 0)))
+
+
+class LoadConfigTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'display_schedule.json')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_missing_file_uses_default_hours(self):
+        with self.assertLogs(level='WARNING'):
+            config = load_config(self.path)
+        self.assertEqual(config, display_schedule.DEFAULT_CONFIG)
+        self.assertIsNot(config, display_schedule.DEFAULT_CONFIG)
+
+    def test_shipped_file_matches_default_hours(self):
+        config = load_config(display_schedule.SCHEDULE_FILE)
+        config.pop('_comment', None)
+        self.assertEqual(config, display_schedule.DEFAULT_CONFIG)
+
+    def test_bad_window_uses_default_hours(self):
+        with open(self.path, 'w') as f:
+            f.write('{"business_hours": {"mon": ["noon-late"]}}')
+        with self.assertLogs(level='WARNING'):
+            self.assertEqual(load_config(self.path), display_schedule.DEFAULT_CONFIG)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,7 @@
 """
 Tournament Monitor - GitHub Integration
 Pulls tournament data from GitHub repository and updates local cache
-WITH LOG ROTATION - Prevents large log files
+WITH LOG ROTATION - Prevents large log files (shared service_logging setup)
 """
 
 import json
@@ -10,43 +10,27 @@ import subprocess
 import os
 import time
 import logging
-from logging.handlers import RotatingFileHandler
 from datetime import datetime
 from pathlib import Path
+from service_logging import setup_logging
 
 # Configuration
 GITHUB_REPO_URL = "https://github.com/jhamilt0n/bankshot-tournament-display.git"
 LOCAL_REPO_PATH = "/tmp/tournament-scraper"
 OUTPUT_FILE = "/var/www/html/tournament_data.json"
+# Live bracket delta committed by the scrape workflow
+BRACKET_DELTA_REPO_FILE = "state/bracket_delta.json"
+BRACKET_DELTA_OUTPUT_FILE = "/var/www/html/bracket_delta.json"
 LOG_FILE = "/home/pi/logs/tournament_monitor.log"
 CHECK_INTERVAL = 300  # seconds
 
-# Setup logging with rotation (5MB max, keep 5 backups)
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)
-
-# Remove any existing handlers
-logger.handlers = []
-
-# Rotating file handler
-file_handler = RotatingFileHandler(
-    LOG_FILE,
-    maxBytes=5*1024*1024,  # 5MB
-    backupCount=5
-)
-file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-logger.addHandler(file_handler)
-
-# Console handler
-console_handler = logging.StreamHandler()
-console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-logger.addHandler(console_handler)
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
 
 def clone_or_pull_repo():
     """Clone repository if it doesn't exist, otherwise pull latest changes"""
     try:
         if not os.path.exists(LOCAL_REPO_PATH):
-            logging.info(f"Cloning repository from {GITHUB_REPO_URL}")
+            logging.info("Cloning repository from %s", GITHUB_REPO_URL)
             result = subprocess.run(
                 ['git', 'clone', GITHUB_REPO_URL, LOCAL_REPO_PATH],
                 capture_output=True,
@@ -54,7 +38,7 @@ def clone_or_pull_repo():
                 timeout=30
             )
             if result.returncode != 0:
-                logging.error(f"Failed to clone repository: {result.stderr}")
+                logging.error("Failed to clone repository: %s", result.stderr)
                 return False
             logging.info("Repository cloned successfully")
         else:
@@ -66,7 +50,7 @@ def clone_or_pull_repo():
                 timeout=30
             )
             if result.returncode != 0:
-                logging.error(f"Failed to pull repository: {result.stderr}")
+                logging.error("Failed to pull repository: %s", result.stderr)
                 return False
             logging.info("Successfully pulled latest data from GitHub")
         
@@ -75,7 +59,7 @@ def clone_or_pull_repo():
         logging.error("Git operation timed out")
         return False
     except Exception as e:
-        logging.error(f"Error with git operation: {e}")
+        logging.error("Error with git operation: %s", e)
         return False
 
 def load_tournament_data():
@@ -95,17 +79,17 @@ def load_tournament_data():
             data = json.load(f)
         
         logging.info("Loaded tournament data from GitHub repo")
-        logging.info(f"  Tournament: {data.get('tournament_name', 'Unknown')}")
-        logging.info(f"  Status: {data.get('status', 'Unknown')}")
-        logging.info(f"  Display: {data.get('display_tournament', False)}")
+        logging.info("  Tournament: %s", data.get('tournament_name', 'Unknown'))
+        logging.info("  Status: %s", data.get('status', 'Unknown'))
+        logging.info("  Display: %s", data.get('display_tournament', False))
         
         return data
         
     except json.JSONDecodeError as e:
-        logging.error(f"Invalid JSON in tournament file: {e}")
+        logging.error("Invalid JSON in tournament file: %s", e)
         return None
     except Exception as e:
-        logging.error(f"Error loading tournament data: {e}")
+        logging.error("Error loading tournament data: %s", e)
         return None
 
 def save_tournament_data(data):
@@ -117,10 +101,43 @@ def save_tournament_data(data):
         with open(OUTPUT_FILE, 'w') as f:
             json.dump(data, f, indent=2)
         
-        logging.info(f"Saved tournament data to {OUTPUT_FILE}")
+        logging.info("Saved tournament data to %s", OUTPUT_FILE)
+        return True
+    except Exception as e:
+        logging.error("Error saving tournament data: %s", e)
+        return False
+
+def copy_bracket_delta():
+    """Copy the latest bracket delta from the repository when its sequence changed"""
+    source = os.path.join(LOCAL_REPO_PATH, BRACKET_DELTA_REPO_FILE)
+    try:
+        with open(source, 'r') as f:
+            delta = json.load(f)
+    except FileNotFoundError:
+        return False
+    except Exception as e:
+        logging.error("Error reading bracket delta: %s", e)
+        return False
+    
+    try:
+        with open(BRACKET_DELTA_OUTPUT_FILE, 'r') as f:
+            current = json.load(f)
+        if (current.get('tournament_url'), current.get('sequence')) == \
+                (delta.get('tournament_url'), delta.get('sequence')):
+            return False
+    except Exception:
+        pass
+    
+    try:
+        tmp_path = BRACKET_DELTA_OUTPUT_FILE + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(delta, f, indent=2)
+        os.replace(tmp_path, BRACKET_DELTA_OUTPUT_FILE)
+        logging.info("Bracket delta #%s: %d changed matches",
+                     delta.get('sequence'), len(delta.get('changed', [])))
         return True
     except Exception as e:
-        logging.error(f"Error saving tournament data: {e}")
+        logging.error("Error saving bracket delta: %s", e)
         return False
 
 def generate_qr_code():
@@ -136,11 +153,11 @@ def generate_qr_code():
         if result.returncode == 0:
             logging.info("✓ QR code generated successfully")
         else:
-            logging.warning(f"QR generation returned non-zero: {result.stderr.strip()}")
+            logging.warning("QR generation returned non-zero: %s", result.stderr.strip())
         
         return result.returncode == 0
     except Exception as e:
-        logging.error(f"Error generating QR code: {e}")
+        logging.error("Error generating QR code: %s", e)
         return False
 
 def check_tournament_status(data):
@@ -152,17 +169,17 @@ def check_tournament_status(data):
     player_count = data.get('player_count', 0)
     
     if display and player_count > 0:
-        logging.info(f"✓ Tournament is active: {data.get('tournament_name', 'Unknown')}")
+        logging.info("✓ Tournament is active: %s", data.get('tournament_name', 'Unknown'))
     elif display and player_count == 0:
-        logging.info(f"⏳ Tournament scheduled but no players yet: {data.get('tournament_name', 'Unknown')}")
+        logging.info("⏳ Tournament scheduled but no players yet: %s", data.get('tournament_name', 'Unknown'))
     else:
         logging.info("○ No active tournament to display")
 
 def monitor_loop():
     """Main monitoring loop"""
     logging.info("Starting GitHub-based tournament monitor...")
-    logging.info(f"Repository: {GITHUB_REPO_URL}")
-    logging.info(f"Check interval: {CHECK_INTERVAL} seconds")
+    logging.info("Repository: %s", GITHUB_REPO_URL)
+    logging.info("Check interval: %s seconds", CHECK_INTERVAL)
     
     while True:
         try:
@@ -183,6 +200,8 @@ def monitor_loop():
                         check_tournament_status(tournament_data)
                 else:
                     logging.warning("No valid tournament data found")
+                
+                copy_bracket_delta()
             
             # Wait before next check
             time.sleep(CHECK_INTERVAL)
@@ -191,8 +210,10 @@ def monitor_loop():
             logging.info("Monitor stopped by user")
             break
         except Exception as e:
-            logging.error(f"Error in monitor loop: {e}")
+            logging.error("Error in monitor loop: %s", e)
             time.sleep(CHECK_INTERVAL)
 
 if __name__ == '__main__':
+    # Rotating log (5MB max, keep 5 backups) written from a background thread
+    setup_logging(LOG_FILE, fmt=LOG_FORMAT, datefmt=None)
     monitor_loop()
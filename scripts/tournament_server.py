@@ -21,10 +21,12 @@ Author: Bankshot Tournament Console
 import os
 import json
 import base64
+import logging
 import requests
 from datetime import datetime
 from flask import Flask, request, jsonify, send_from_directory
 from flask_cors import CORS
+from service_logging import setup_logging
 
 app = Flask(__name__)
 CORS(app)
@@ -45,16 +47,12 @@ GITHUB_TOKEN = os.environ.get('GITHUB_TOKEN', '')  # Set via environment variabl
 os.makedirs(TOURNAMENT_DATA_DIR, exist_ok=True)
 
 
-def log_message(message):
-    """Log a message to file and console."""
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    log_line = f"[{timestamp}] {message}"
-    print(log_line)
-    try:
-        with open(LOG_FILE, 'a') as f:
-            f.write(log_line + '\n')
-    except:
-        pass
+logger = logging.getLogger(__name__)
+
+
+def log_message(message, *args):
+    """Log a message to file and console (lazy %-style arguments)."""
+    logger.info(message, *args)
 
 
 def trigger_github_action(tournament_data):
@@ -83,7 +81,7 @@ def trigger_github_action(tournament_data):
     }
     
     try:
-        log_message(f"Triggering GitHub Action for: {tournament_data.get('tournament', {}).get('name', 'Unknown')}")
+        log_message("Triggering GitHub Action for: %s", tournament_data.get('tournament', {}).get('name', 'Unknown'))
         
         response = requests.post(url, headers=headers, json=payload, timeout=30)
         
@@ -105,7 +103,7 @@ def trigger_github_action(tournament_data):
         log_message("GitHub API timeout")
         return False, "GitHub API request timed out"
     except Exception as e:
-        log_message(f"Error triggering GitHub Action: {e}")
+        log_message("Error triggering GitHub Action: %s", e)
         return False, str(e)
 
 
@@ -154,7 +152,7 @@ def create_tournament():
         with open(filepath, 'w') as f:
             json.dump(data, f, indent=2)
         
-        log_message(f"Saved tournament data to: {filepath}")
+        log_message("Saved tournament data to: %s", filepath)
         
         response_data = {
             'success': True,
@@ -181,7 +179,7 @@ def create_tournament():
         return jsonify(response_data)
         
     except Exception as e:
-        log_message(f"Error in create_tournament: {e}")
+        log_message("Error in create_tournament: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -277,7 +275,7 @@ def delete_tournament(filename):
     
     try:
         os.remove(filepath)
-        log_message(f"Deleted tournament file: {filename}")
+        log_message("Deleted tournament file: %s", filename)
         return jsonify({'success': True, 'message': 'File deleted'})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -295,10 +293,11 @@ def get_config():
 
 
 if __name__ == '__main__':
+    setup_logging(LOG_FILE)
     log_message("Tournament Server starting...")
-    log_message(f"Data directory: {TOURNAMENT_DATA_DIR}")
-    log_message(f"GitHub repo: {GITHUB_OWNER}/{GITHUB_REPO}")
-    log_message(f"GitHub token configured: {bool(GITHUB_TOKEN)}")
+    log_message("Data directory: %s", TOURNAMENT_DATA_DIR)
+    log_message("GitHub repo: %s/%s", GITHUB_OWNER, GITHUB_REPO)
+    log_message("GitHub token configured: %s", bool(GITHUB_TOKEN))
     
     if not GITHUB_TOKEN:
         log_message("WARNING: GITHUB_TOKEN not set. Run with: GITHUB_TOKEN=ghp_xxx python3 tournament_server.py")
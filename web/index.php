@@ -1030,6 +1030,30 @@ setInterval(checkDisplayTypeChange, 30000);
     setTimeout(hideLoading, 800);
     setTimeout(function() { if (!loadingHidden) hideLoading(); }, 2000);
 })();
+
+// Push notices from catt_monitor (push_channel.py) - applied in place instead
+// of a stop-and-recast. Polling above keeps working if the channel is down.
+(function() {
+    var PUSH_PORT = 8088;  // PUSH_PORT in catt_monitor.py
+    if (!window.EventSource) return;
+    
+    var match = /[?&]receiver=([^&]+)/.exec(window.location.search);
+    var client = match ? match[1] : 'browser';
+    var source = new EventSource('http://' + window.location.hostname + ':' + PUSH_PORT + '/events?client=' + client);
+    
+    source.addEventListener('data', function() {
+        console.log('Push: tournament data changed');
+        if (typeof checkForChanges === 'function') {
+            checkForChanges();
+        } else {
+            location.reload();
+        }
+    });
+    source.addEventListener('media', function() {
+        console.log('Push: media changed - reloading rotation');
+        location.reload();
+    });
+})();
 </script>
 
 </body>